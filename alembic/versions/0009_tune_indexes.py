@@ -0,0 +1,58 @@
+"""tune transaction_lines and account_balances indexes
+
+Revision ID: 0009_tune_indexes
+Revises: 0008_add_account_aggregates
+Create Date: 2026-10-16
+
+Adds a covering index transaction_lines(journal_id, currency_code, side, amount):
+the trading balance aggregation joins lines to journals by journal_id and only
+reads these columns, so it is served from the index alone. Drops the standalone
+ix_tx_lines_currency_code, which no query uses as an access path and which only
+added write cost to every posted line. Drops ix_account_balances_full_name, which
+duplicates the index behind the UNIQUE constraint on account_full_name and doubled
+the write cost of every balance update.
+
+On PostgreSQL the statements run CONCURRENTLY inside an autocommit block, so the
+upgrade does not lock the tables against writers while indexes are built.
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+from contextlib import nullcontext
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0009_tune_indexes'
+down_revision: str | None = '0008_add_account_aggregates'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _index_kw() -> dict[str, bool]:
+    # CONCURRENTLY cannot run inside a transaction; see the autocommit blocks below
+    if op.get_context().dialect.name == "postgresql":
+        return {"postgresql_concurrently": True}
+    return {}
+
+
+def upgrade() -> None:
+    kw = _index_kw()
+    with op.get_context().autocommit_block() if kw else nullcontext():
+        op.create_index(
+            'ix_tx_lines_journal_covering',
+            'transaction_lines',
+            ['journal_id', 'currency_code', 'side', 'amount'],
+            unique=False,
+            **kw,
+        )
+        op.drop_index('ix_tx_lines_currency_code', table_name='transaction_lines', **kw)
+        op.drop_index('ix_account_balances_full_name', table_name='account_balances', **kw)
+
+
+def downgrade() -> None:
+    kw = _index_kw()
+    with op.get_context().autocommit_block() if kw else nullcontext():
+        op.create_index('ix_account_balances_full_name', 'account_balances', ['account_full_name'], **kw)
+        op.create_index('ix_tx_lines_currency_code', 'transaction_lines', ['currency_code'], unique=False, **kw)
+        op.drop_index('ix_tx_lines_journal_covering', table_name='transaction_lines', **kw)
@@ -9,7 +9,7 @@ Source of truth for structure: `rpg_py_accountant.yaml`.
 from __future__ import annotations
 
 __version__ = "1.1.0"
-__version_schema__ = "0008_add_account_aggregates"
+__version_schema__ = "0009_tune_indexes"
 
 __version_schema__: str
 """Database schema version (last migration file name).
@@ -20,7 +20,7 @@ Should match the latest migration in alembic/versions/.
 Example:
     >>> from py_accountant import __version_schema__
     >>> print(__version_schema__)
-    '0008_add_account_aggregates'
+    '0009_tune_indexes'
 """
 
 __all__ = [
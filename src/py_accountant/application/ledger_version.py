@@ -0,0 +1,24 @@
+"""In-process version of posted ledger data.
+
+``AsyncPostTransaction`` bumps the version when it persists a transaction and
+again when the posting unit of work commits. Report caches include the version
+in their keys, so any posting in this process invalidates cached results.
+Postings made by other processes (or written directly through a repository)
+are not observed.
+"""
+from __future__ import annotations
+
+__all__ = ["bump", "current"]
+
+_version = 0
+
+
+def current() -> int:
+    """Return the current ledger version."""
+    return _version
+
+
+def bump() -> None:
+    """Advance the ledger version; cached reports keyed on older versions miss."""
+    global _version
+    _version += 1
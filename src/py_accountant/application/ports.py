@@ -2,9 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Protocol, runtime_checkable
-
-from sqlalchemy.ext.asyncio import AsyncSession
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 from py_accountant.application.dto.models import (
     AccountDTO,
@@ -14,6 +12,10 @@ from py_accountant.application.dto.models import (
     TransactionDTO,
 )
 
+if TYPE_CHECKING:
+    # Annotation only: the application layer does not import SQLAlchemy at runtime
+    from sqlalchemy.ext.asyncio import AsyncSession
+
 __all__ = [
     "Clock",
     "SupportsCommitRollback",
@@ -39,6 +41,8 @@ class Clock(Protocol):
     Implementations typically return timezone-aware UTC datetimes.
     """
 
+    __slots__ = ()
+
     def now(self) -> datetime: ...
 
 
@@ -74,6 +78,8 @@ class AsyncAccountRepository(Protocol):
     async def get_by_full_name(self, full_name: str) -> AccountDTO | None: ...
     async def create(self, dto: AccountDTO) -> AccountDTO: ...
     async def list(self, parent_id: str | None = None) -> list[AccountDTO]: ...
+    # Batch lookup (one query); unknown names are simply absent from the result
+    async def list_by_full_names(self, full_names: list[str]) -> list[AccountDTO]: ...
     # Fast path for aggregated balance (optional None when missing)
     async def get_balance(self, full_name: str) -> Decimal | None: ...
 
@@ -84,6 +90,16 @@ class AsyncTransactionRepository(Protocol):
 
     async def add(self, dto: TransactionDTO) -> TransactionDTO: ...
     async def list_between(self, start: datetime, end: datetime, meta: dict[str, Any] | None = None) -> list[TransactionDTO]: ...
+    # Per-currency/side sums over the window (read-side projection, no conversion),
+    # optionally restricted to one account's lines
+    async def aggregate_raw(
+        self,
+        start: datetime,
+        end: datetime,
+        meta: dict[str, Any] | None = None,
+        *,
+        account_full_name: str | None = None,
+    ) -> list[tuple[str, str, Decimal]]: ...
     async def ledger(
         self,
         account_full_name: str,
@@ -173,6 +189,9 @@ class TransactionRepository(Protocol):
 
     def add(self, dto: TransactionDTO) -> TransactionDTO: ...
     def list_between(self, start: datetime, end: datetime, meta: dict[str, Any] | None = None) -> list[TransactionDTO]: ...
+    def aggregate_raw(
+        self, start: datetime, end: datetime, meta: dict[str, Any] | None = None
+    ) -> list[tuple[str, str, Decimal]]: ...
     def ledger(
         self,
         account_full_name: str,
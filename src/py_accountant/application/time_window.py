@@ -0,0 +1,26 @@
+"""Shared helpers for default report/ledger time windows.
+
+Use cases default an omitted ``start`` to the Unix epoch expressed in the
+timezone of ``clock.now()`` so repository comparisons stay tz-consistent.
+"""
+from __future__ import annotations
+
+from datetime import datetime, tzinfo
+
+__all__ = ["epoch_for"]
+
+_EPOCH_BY_TZ: dict[tzinfo, datetime] = {}
+
+
+def epoch_for(tz: tzinfo | None) -> datetime:
+    """Return Unix epoch (0) in timezone ``tz``; cached per tzinfo.
+
+    ``tz=None`` yields a naive local-time epoch and is not cached (it depends on
+    the process local timezone).
+    """
+    if tz is None:
+        return datetime.fromtimestamp(0)
+    epoch = _EPOCH_BY_TZ.get(tz)
+    if epoch is None:
+        epoch = _EPOCH_BY_TZ[tz] = datetime.fromtimestamp(0, tz=tz)
+    return epoch
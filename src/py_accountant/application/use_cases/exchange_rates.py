@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from dataclasses import dataclass
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 
 from py_accountant.application.dto.models import CurrencyDTO, RateUpdateInput
 from py_accountant.application.ports import SupportsCommitRollback as UnitOfWork
@@ -40,7 +40,7 @@ class UpdateExchangeRates:
                 raise DomainError("Rate must be provided")
             try:
                 rate = Decimal(upd.rate)
-            except Exception as e:  # noqa: BLE001
+            except (InvalidOperation, TypeError, ValueError) as e:
                 raise DomainError("Invalid rate") from e
             if rate <= 0:
                 raise DomainError("Rate must be positive")
@@ -50,10 +50,12 @@ class UpdateExchangeRates:
             if self.policy and existing and not existing.is_base and existing.exchange_rate:
                 rate = self.policy.apply(existing.exchange_rate, rate)
             normalized.append((code, rate))
-        # Prefer optimized bulk path; fallback to upsert loop
-        try:
-            self.uow.currencies.bulk_upsert_rates(normalized)
-        except Exception:
+        # Prefer optimized bulk path; fallback to upsert loop only for repositories
+        # without it (errors from the bulk path propagate instead of being retried)
+        bulk = getattr(self.uow.currencies, "bulk_upsert_rates", None)
+        if bulk is not None:
+            bulk(normalized)
+        else:
             for code, rate in normalized:
                 existing = self.uow.currencies.get_by_code(code)
                 dto = existing or CurrencyDTO(code=code)
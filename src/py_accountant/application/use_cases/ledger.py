@@ -17,6 +17,7 @@ from py_accountant.application.dto.models import (
 )
 from py_accountant.application.ports import Clock
 from py_accountant.application.ports import SupportsCommitRollback as UnitOfWork
+from py_accountant.application.time_window import epoch_for
 from py_accountant.domain import (
     AccountName,
     CurrencyCode,
@@ -26,13 +27,14 @@ from py_accountant.domain import (
     ExchangeRate,
     TransactionVO,
 )
-from py_accountant.domain.ledger import LedgerEntry
+from py_accountant.domain.currencies import Currency, CurrencyIndex
+from py_accountant.domain.errors import ValidationError
 from py_accountant.domain.services.account_balance_service import (
     AccountBalanceServiceProtocol,
     InMemoryAccountBalanceService,
 )
 from py_accountant.domain.services.exchange_rate_policy import ExchangeRatePolicy
-from py_accountant.domain.trading_balance import ConvertedAggregator, RawAggregator
+from py_accountant.domain.trading_balance import CONVERTED_AGGREGATOR, RAW_AGGREGATOR
 
 # Mappers
 
@@ -44,11 +46,17 @@ def map_currency_vo_to_dto(code: CurrencyCode) -> CurrencyDTO:
     return CurrencyDTO(code=code.code)
 
 
+_ENTRY_SIDE: dict[str, EntrySide] = {"DEBIT": EntrySide.DEBIT, "CREDIT": EntrySide.CREDIT}
+_VALID_ORDERS = frozenset(("ASC", "DESC"))
+# ExchangeRate is immutable; lines without an explicit rate share one instance
+_IDENTITY_RATE = ExchangeRate.from_number(1)
+
+
 def map_line_dto_to_vo(line: EntryLineDTO) -> EntryLine:
-    side = EntrySide(line.side.upper())
-    account = AccountName(line.account_full_name)
-    currency = CurrencyCode(line.currency_code)
-    ex_rate = ExchangeRate.from_number(line.exchange_rate or 1)
+    side = _ENTRY_SIDE.get(line.side) or EntrySide(line.side.upper())
+    account = AccountName.get(line.account_full_name)
+    currency = CurrencyCode.get(line.currency_code)
+    ex_rate = ExchangeRate.from_number(line.exchange_rate) if line.exchange_rate else _IDENTITY_RATE
     return EntryLine.create(side, account, line.amount, currency, ex_rate)
 
 
@@ -59,7 +67,7 @@ class CreateCurrency:
     uow: UnitOfWork
 
     def __call__(self, code: str, exchange_rate: Decimal | None = None) -> CurrencyDTO:
-        vo = CurrencyCode(code)
+        vo = CurrencyCode.get(code)
         existing = self.uow.currencies.get_by_code(vo.code)
         if existing:
             if exchange_rate is not None:
@@ -75,13 +83,13 @@ class CreateAccount:
     uow: UnitOfWork
 
     def __call__(self, full_name: str, currency_code: str) -> AccountDTO:
-        full = AccountName(full_name)
+        full = AccountName.get(full_name)
         if self.uow.accounts.get_by_full_name(full.full_name):
             raise DomainError(f"Account already exists: {full}")
-        cur = self.uow.currencies.get_by_code(CurrencyCode(currency_code).code)
-        if not cur:
+        cur_vo = CurrencyCode.get(currency_code)
+        if not self.uow.currencies.get_by_code(cur_vo.code):
             raise DomainError(f"Currency not found: {currency_code}")
-        dto = map_account_vo_to_dto(full, CurrencyCode(cur.code))
+        dto = map_account_vo_to_dto(full, cur_vo)
         return self.uow.accounts.create(dto)
 
 
@@ -124,15 +132,23 @@ class UpdateCurrenciesFromTransaction:
     policy: ExchangeRatePolicy | None = None
 
     def __call__(self, tx: TransactionDTO) -> None:
+        # Fold rates per currency in line order (the policy may be stateful), reading
+        # each currency once and writing it once instead of get+upsert per line.
+        touched: dict[str, CurrencyDTO | None] = {}
         for line in tx.lines:
             if line.exchange_rate and line.exchange_rate > 0:
-                cur = self.uow.currencies.get_by_code(line.currency_code)
+                code = line.currency_code
+                if code not in touched:
+                    touched[code] = self.uow.currencies.get_by_code(code)
+                cur = touched[code]
                 if cur:
                     if self.policy:
                         cur.exchange_rate = self.policy.apply(cur.exchange_rate, line.exchange_rate)
                     else:
                         cur.exchange_rate = line.exchange_rate
-                    self.uow.currencies.upsert(cur)
+        for cur in touched.values():
+            if cur:
+                self.uow.currencies.upsert(cur)
 
 
 @dataclass
@@ -154,8 +170,9 @@ class GetLedger:
     clock: Clock
 
     def __call__(self, account_full_name: str, start: datetime | None = None, end: datetime | None = None, meta: dict | None = None) -> list[RichTransactionDTO]:
-        start_dt = start or datetime.fromtimestamp(0, tz=self.clock.now().tzinfo)
-        end_dt = end or self.clock.now()
+        now = self.clock.now()
+        start_dt = start or epoch_for(now.tzinfo)
+        end_dt = end or now
         return self.uow.transactions.ledger(account_full_name, start_dt, end_dt, meta)
 
 
@@ -181,19 +198,21 @@ class ListLedger:
     ) -> list[RichTransactionDTO]:
         if not account_full_name or ":" not in account_full_name:
             raise DomainError("Invalid account_full_name format")
-        start_dt = start or datetime.fromtimestamp(0, tz=self.clock.now().tzinfo)
-        end_dt = end or self.clock.now()
-        if start_dt > end_dt:
-            raise DomainError("start > end")
+        # Cheap argument checks first; the clock/epoch defaults are resolved only for valid calls
         if offset < 0:
             raise DomainError("offset must be >= 0")
         if limit is not None and limit < 0:
             raise DomainError("limit must be >= 0")
-        order_up = order.upper()
-        if order_up not in {"ASC", "DESC"}:
+        order_up = order if order in _VALID_ORDERS else order.upper()
+        if order_up not in _VALID_ORDERS:
             raise DomainError("order must be ASC or DESC")
         if meta is not None and not isinstance(meta, dict):
             raise DomainError("meta must be a dict or None")
+        now = self.clock.now()
+        start_dt = start or epoch_for(now.tzinfo)
+        end_dt = end or now
+        if start_dt > end_dt:
+            raise DomainError("start > end")
         return self.uow.transactions.ledger(
             account_full_name,
             start_dt,
@@ -221,17 +240,14 @@ class GetTradingBalanceRawDTOs:
 
     def __call__(self, *, start: datetime | None = None, end: datetime | None = None, as_of: datetime | None = None) -> list[TradingBalanceLineSimple]:
         # Determine window
-        win_start = start or datetime.fromtimestamp(0, tz=self.clock.now().tzinfo)
-        win_end = end or as_of or self.clock.now()
-        # Collect lines within window via repository
-        txs = self.uow.transactions.list_between(win_start, win_end)
-        # Map to domain LedgerEntry and aggregate
-        dom_lines: list[LedgerEntry] = []
-        for tx in txs:
-            for line in tx.lines:
-                side = EntrySide(line.side.upper())
-                dom_lines.append(LedgerEntry(side=side.value, amount=line.amount, currency_code=line.currency_code))
-        raw = RawAggregator().aggregate(dom_lines)
+        now = self.clock.now()
+        win_start = start or epoch_for(now.tzinfo)
+        win_end = end or as_of or now
+        # Per-currency/side sums are computed by the repository; fold them via domain
+        rows = self.uow.transactions.aggregate_raw(win_start, win_end)
+        if not rows:
+            return []
+        raw = RAW_AGGREGATOR.from_grouped(rows)
         # Map to DTOs
         return [
             TradingBalanceLineSimple(currency_code=item.currency_code, debit=item.debit, credit=item.credit, net=item.net)
@@ -258,20 +274,22 @@ class GetTradingBalanceDetailedDTOs:
         if not base_currency:
             raise DomainError("base_currency is required for detailed trading balance")
         # Determine window and collect
-        win_start = start or datetime.fromtimestamp(0, tz=self.clock.now().tzinfo)
-        win_end = end or as_of or self.clock.now()
-        txs = self.uow.transactions.list_between(win_start, win_end)
-        dom_lines: list[LedgerEntry] = []
-        for tx in txs:
-            for line in tx.lines:
-                side = EntrySide(line.side.upper())
-                dom_lines.append(LedgerEntry(side=side.value, amount=line.amount, currency_code=line.currency_code))
+        now = self.clock.now()
+        win_start = start or epoch_for(now.tzinfo)
+        win_end = end or as_of or now
+        rows = self.uow.transactions.aggregate_raw(win_start, win_end)
         # Build domain currency objects from repository DTOs
         all_curs = self.uow.currencies.list_all()
-        from py_accountant.domain.currencies import Currency
-        cur_map = { cur.code: Currency(code=cur.code, is_base=cur.is_base, rate_to_base=cur.exchange_rate) for cur in all_curs }
+        index = CurrencyIndex.build(
+            Currency(code=cur.code, is_base=cur.is_base, rate_to_base=cur.exchange_rate) for cur in all_curs
+        )
+        # Surface an unknown base even for an empty window (parity with the async use case)
+        if not rows:
+            if base_currency.strip().upper() not in index:
+                raise ValidationError(f"Base currency not found: {base_currency!r}")
+            return []
         # Aggregate via domain and map
-        conv = ConvertedAggregator().aggregate(dom_lines, currencies=cur_map, base_code=base_currency)
+        conv = CONVERTED_AGGREGATOR.from_grouped(rows, currencies=index, base_code=base_currency)
         return [
             TradingBalanceLineDetailed(
                 currency_code=item.currency_code,
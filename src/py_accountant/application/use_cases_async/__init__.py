@@ -52,6 +52,7 @@ from .reporting import (
 from .trading_balance import (
     AsyncGetTradingBalanceDetailed,
     AsyncGetTradingBalanceRaw,
+    DetailedBalanceCache,
 )
 
 __all__ = [
@@ -71,6 +72,7 @@ __all__ = [
     # new trading balance refactored use cases (I18)
     "AsyncGetTradingBalanceRaw",
     "AsyncGetTradingBalanceDetailed",
+    "DetailedBalanceCache",
     # fx audit
     "AsyncAddExchangeRateEvent",
     "AsyncListExchangeRateEvents",
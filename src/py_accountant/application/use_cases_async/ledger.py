@@ -3,18 +3,25 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
+from operator import attrgetter
 from typing import Any
 from uuid import uuid4
 
+from py_accountant.application import ledger_version
 from py_accountant.application.dto.models import (
     EntryLineDTO,
     RichTransactionDTO,
     TransactionDTO,
 )
 from py_accountant.application.ports import AsyncUnitOfWork, Clock
+from py_accountant.application.time_window import epoch_for
+from py_accountant.domain.currencies import Currency
 from py_accountant.domain.errors import ValidationError
 from py_accountant.domain.ledger import LedgerEntry, LedgerValidator
 
+_VALID_ORDERS = frozenset(("ASC", "DESC"))
+# EntryLineDTO -> positional LedgerEntry(side, amount, currency_code) arguments
+_entry_fields = attrgetter("side", "amount", "currency_code")
 
 @dataclass(slots=True)
 class AsyncPostTransaction:
@@ -26,8 +33,9 @@ class AsyncPostTransaction:
     Steps:
       1. Guard empty list (ValidationError).
       2. For each provided line: ensure account exists (ValueError) and currency exists (ValueError).
+         Accounts are fetched with one batch query; currencies come from one catalog read.
       3. Project lines to domain LedgerEntry (side/amount/currency_code validation -> ValidationError).
-      4. Load all distinct currencies referenced by lines from repository (ValueError if any missing).
+      4. Ensure every normalized currency code referenced by entries is in the catalog (ValueError if missing).
       5. Project currency DTOs to domain Currency value objects (ValidationError on invalid code/rate).
       6. Run LedgerValidator.validate(entries, currencies_domain) — performs:
          - Base currency detection (ValidationError if absent).
@@ -66,38 +74,36 @@ class AsyncPostTransaction:
         if not lines:
             raise ValidationError("No lines provided")
 
-        # 2. Resource existence checks (accounts + currencies)
+        # 2. Resource existence checks (accounts + currencies): one account query for all
+        #    distinct names, currencies from the (memoized) catalog; errors keep line order
+        known_accounts = {
+            acc.full_name
+            for acc in await self.uow.accounts.list_by_full_names(
+                list(dict.fromkeys(line.account_full_name for line in lines))
+            )
+        }
+        # All currencies (not just referenced) are needed anyway for base detection in step 6
+        all_cur_dtos = await self.uow.currencies.list_all()
+        dto_map: dict[str, Any] = {d.code: d for d in all_cur_dtos}
         for line in lines:
-            acc = await self.uow.accounts.get_by_full_name(line.account_full_name)
-            if not acc:
+            if line.account_full_name not in known_accounts:
                 raise ValueError(f"Account not found: {line.account_full_name}")
-            cur_dto = await self.uow.currencies.get_by_code(line.currency_code.upper())
-            if not cur_dto:
+            if line.currency_code.upper() not in dto_map:
                 raise ValueError(f"Currency not found: {line.currency_code}")
 
         # 3. Project to domain ledger entries (formal field validation)
-        entries: list[LedgerEntry] = []
-        for line in lines:
-            # LedgerEntry performs side/amount/currency_code validation
-            entries.append(LedgerEntry(side=line.side, amount=line.amount, currency_code=line.currency_code))
+        # LedgerEntry performs side/amount/currency_code validation
+        entries = [LedgerEntry(*_entry_fields(line)) for line in lines]
 
-        # 4. Load all currencies (not just referenced) to ensure base detection works even when lines omit base
-        all_cur_dtos = await self.uow.currencies.list_all()
-        dto_map: dict[str, Any] = {d.code: d for d in all_cur_dtos}
-        # Guard: ensure all referenced codes exist (classification ValueError)
+        # 4. Guard: ensure all referenced (normalized) codes exist (classification ValueError)
         for code in {e.currency_code for e in entries}:
             if code not in dto_map:
                 raise ValueError(f"Currency not found: {code}")
         # 5. Project DTOs to domain Currency objects
-        from py_accountant.domain.currencies import (  # local import to keep async module surface concise
-            Currency,
-        )
-
-        currencies_domain: list[Currency] = []
-        for dto in dto_map.values():
-            currencies_domain.append(
-                Currency(code=dto.code, is_base=dto.is_base, rate_to_base=dto.exchange_rate)
-            )
+        currencies_domain = [
+            Currency(code=dto.code, is_base=dto.is_base, rate_to_base=dto.exchange_rate)
+            for dto in dto_map.values()
+        ]
 
         # 6. Domain ledger balance validation
         LedgerValidator.validate(entries, currencies_domain)
@@ -110,7 +116,13 @@ class AsyncPostTransaction:
             memo=memo,
             meta=meta or {},
         )
-        return await self.uow.transactions.add(tx)
+        saved = await self.uow.transactions.add(tx)
+        # Invalidate cached reports now and once more when the posting becomes visible
+        ledger_version.bump()
+        on_commit = getattr(self.uow, "on_commit", None)
+        if on_commit is not None:
+            on_commit(ledger_version.bump)
+        return saved
 
 
 @dataclass(slots=True)
@@ -188,16 +200,17 @@ class AsyncGetLedger:
         """Return ledger entries; apply basic validation and pagination rules."""
         if not account_full_name or ":" not in account_full_name:
             raise ValueError("Invalid account_full_name format")
-        start_dt = start or datetime.fromtimestamp(0, tz=self.clock.now().tzinfo)
-        end_dt = end or self.clock.now()
+        now = self.clock.now()
+        start_dt = start or epoch_for(now.tzinfo)
+        end_dt = end or now
         if start_dt > end_dt:
             raise ValueError("start > end")
         if offset < 0:
             return []
         if limit is not None and limit <= 0:
             return []
-        order_up = order.upper()
-        if order_up not in {"ASC", "DESC"}:
+        order_up = order if order in _VALID_ORDERS else order.upper()
+        if order_up not in _VALID_ORDERS:
             raise ValueError("order must be ASC or DESC")
         if meta is not None and not isinstance(meta, dict):
             raise ValueError("meta must be a dict or None")
@@ -227,7 +240,7 @@ class AsyncGetAccountBalance:
 
     Notes:
     - If as_of is None (current balance), use aggregated account_balances fast path.
-    - Otherwise, fallback to ledger scan for historical moments (until snapshots appear).
+    - Otherwise, sum DEBIT/CREDIT up to as_of via one grouped repository query (until snapshots appear).
     """
     uow: AsyncUnitOfWork
     clock: Clock
@@ -239,26 +252,15 @@ class AsyncGetAccountBalance:
             cached = await self.uow.accounts.get_balance(account_full_name)
             if cached is not None:
                 return Decimal(cached)
-        # Fallback scan
+        # Historical moment: the database sums per side, only the sign is applied here
         ts = as_of or self.clock.now()
-        start = datetime.fromtimestamp(0, tz=ts.tzinfo)
-        entries = await self.uow.transactions.ledger(
-            account_full_name,
-            start,
-            ts,
-            None,
-            offset=0,
-            limit=None,
-            order="ASC",
+        rows = await self.uow.transactions.aggregate_raw(
+            epoch_for(ts.tzinfo), ts, account_full_name=account_full_name
         )
         total = Decimal("0")
-        for tx in entries:
-            for line in tx.lines:
-                if line.account_full_name != account_full_name:
-                    continue
-                side = (line.side or "").upper()
-                if side == "DEBIT":
-                    total += line.amount
-                elif side == "CREDIT":
-                    total -= line.amount
+        for _code, side, amount in rows:
+            if side == "DEBIT":
+                total += Decimal(amount)
+            elif side == "CREDIT":
+                total -= Decimal(amount)
         return total
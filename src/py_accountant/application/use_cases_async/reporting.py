@@ -12,6 +12,7 @@ from py_accountant.application.dto.models import (
     TradingBalanceSnapshotDTO,
 )
 from py_accountant.application.ports import AsyncUnitOfWork, Clock
+from py_accountant.application.time_window import epoch_for
 from py_accountant.domain.errors import ValidationError
 
 from .trading_balance import AsyncGetTradingBalanceDetailed, AsyncGetTradingBalanceRaw
@@ -19,10 +20,6 @@ from .trading_balance import AsyncGetTradingBalanceDetailed, AsyncGetTradingBala
 __all__ = ["AsyncGetParityReport", "AsyncGetTradingBalanceSnapshotReport"]
 
 
-def _epoch_with_tz(now: datetime) -> datetime:
-    return datetime.fromtimestamp(0, tz=now.tzinfo)
-
-
 @dataclass(slots=True)
 class AsyncGetParityReport:
     """Build a parity report snapshot for selected currencies.
@@ -140,15 +137,20 @@ class AsyncGetTradingBalanceSnapshotReport:
     ) -> TradingBalanceSnapshotDTO:
         now = self.clock.now()
         end_dt = as_of or now
-        start_dt = _epoch_with_tz(now)
-
-        base_dto = await self.uow.currencies.get_base()
-        base_code = base_dto.code if base_dto else None
+        start_dt = epoch_for(now.tzinfo)
 
+        # Reads go through one AsyncSession, so they cannot be overlapped with
+        # asyncio.gather; instead avoid round-trips that add nothing.
         if detailed:
             detailed_lines: list[TradingBalanceLineDetailed] = []
             # Delegate to existing detailed use case (will raise ValidationError if base missing per spec)
             detailed_lines = await AsyncGetTradingBalanceDetailed(self.uow, self.clock)(start=start_dt, end=end_dt)
+            # Every detailed line carries the resolved base; query it only for an empty window
+            if detailed_lines:
+                base_code: str | None = detailed_lines[0].base_currency_code
+            else:
+                base_dto = await self.uow.currencies.get_base()
+                base_code = base_dto.code if base_dto else None
             return TradingBalanceSnapshotDTO(
                 as_of=end_dt,
                 lines_raw=None,
@@ -156,6 +158,8 @@ class AsyncGetTradingBalanceSnapshotReport:
                 mode="detailed",
                 base_currency=base_code,
             )
+        base_dto = await self.uow.currencies.get_base()
+        base_code = base_dto.code if base_dto else None
         # Raw mode
         raw_lines: list[TradingBalanceLineSimple] = await AsyncGetTradingBalanceRaw(self.uow, self.clock)(
             start=start_dt, end=end_dt
@@ -1,27 +1,21 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, replace
 from datetime import datetime
 from typing import Any
 
+from py_accountant.application import ledger_version
 from py_accountant.application.dto.models import (
     TradingBalanceLineDetailed,
     TradingBalanceLineSimple,
 )
 from py_accountant.application.ports import AsyncUnitOfWork, Clock
-from py_accountant.domain.currencies import Currency
+from py_accountant.application.time_window import epoch_for
+from py_accountant.domain.currencies import Currency, CurrencyIndex
 from py_accountant.domain.errors import ValidationError
-from py_accountant.domain.ledger import LedgerEntry
-from py_accountant.domain.trading_balance import ConvertedAggregator, RawAggregator
-
-
-def _epoch_with_tz(now: datetime) -> datetime:
-    """Return Unix epoch (0) with the timezone of ``now``.
-
-    Helper kept local to avoid cross-module coupling; ensures start default
-    retains tz-awareness consistent with repository queries.
-    """
-    return datetime.fromtimestamp(0, tz=now.tzinfo)
+from py_accountant.domain.trading_balance import CONVERTED_AGGREGATOR, RAW_AGGREGATOR
 
 
 @dataclass(slots=True)
@@ -33,10 +27,11 @@ class AsyncGetTradingBalanceRaw:
 
     Error semantics:
     - ValueError: invalid window parameters (start > end) or invalid meta type.
-    - ValidationError: propagated from domain LedgerEntry construction (side, amount>0, currency code length).
+    - ValidationError: propagated from domain grouping (invalid side or currency code).
     - DomainError: not used for raw aggregation (no balance invariant at report level).
 
-    Repository usage remains CRUD-only (``transactions.list_between``).
+    Totals are summed by the repository (``transactions.aggregate_raw``); the
+    use case only folds the grouped rows into domain lines.
     """
 
     uow: AsyncUnitOfWork
@@ -60,27 +55,17 @@ class AsyncGetTradingBalanceRaw:
             List of ``TradingBalanceLineSimple``; empty if no transactions/lines.
         """
         now = self.clock.now()
-        start_dt = start or _epoch_with_tz(now)
+        start_dt = start or epoch_for(now.tzinfo)
         end_dt = end or now
         if start_dt > end_dt:
             raise ValueError("start > end")
         if meta is not None and not isinstance(meta, dict):
             raise ValueError("meta must be a dict or None")
 
-        txs = await self.uow.transactions.list_between(start_dt, end_dt, meta)
-        entries: list[LedgerEntry] = []
-        for tx in txs:
-            for line in tx.lines:
-                try:
-                    entries.append(
-                        LedgerEntry(side=line.side, amount=line.amount, currency_code=line.currency_code)
-                    )
-                except ValidationError as ve:
-                    # Re-propagate domain validation errors unchanged
-                    raise ve
-        if not entries:
+        rows = await self.uow.transactions.aggregate_raw(start_dt, end_dt, meta)
+        if not rows:
             return []
-        raw_lines = RawAggregator().aggregate(entries)
+        raw_lines = RAW_AGGREGATOR.from_grouped(rows)
         return [
             TradingBalanceLineSimple(
                 currency_code=line.currency_code,
@@ -92,6 +77,48 @@ class AsyncGetTradingBalanceRaw:
         ]
 
 
+class DetailedBalanceCache:
+    """Bounded LRU of detailed trading balance results (opt-in).
+
+    Only closed windows (``end`` strictly before ``clock.now()``) are stored, and only
+    once the computing unit of work has committed (the UoW must provide
+    ``on_commit``; otherwise nothing is cached). The key includes window, meta,
+    resolved base, a fingerprint of the currency catalog and the in-process
+    ``ledger_version``, which ``AsyncPostTransaction`` bumps on every posting and
+    again on its commit, so rate, base and posting changes miss automatically.
+    Postings from other processes are not observed; share a cache only within a
+    process that owns all writes, or call ``clear()`` after external imports.
+    """
+
+    __slots__ = ("maxsize", "_data")
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, list[TradingBalanceLineDetailed]] = OrderedDict()
+
+    def get(self, key: Hashable) -> list[TradingBalanceLineDetailed] | None:
+        """Return copies of the cached lines for ``key`` or None on miss."""
+        lines = self._data.get(key)
+        if lines is None:
+            return None
+        self._data.move_to_end(key)
+        return [replace(line) for line in lines]
+
+    def put(self, key: Hashable, lines: list[TradingBalanceLineDetailed]) -> None:
+        """Store copies of ``lines`` under ``key``, evicting the least recently used."""
+        self._data[key] = [replace(line) for line in lines]
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
 @dataclass(slots=True)
 class AsyncGetTradingBalanceDetailed:
     """Compute detailed trading balance with conversion to a base currency.
@@ -103,13 +130,18 @@ class AsyncGetTradingBalanceDetailed:
 
     Error semantics:
     - ValueError: invalid window (start > end) or meta type not dict/None.
-    - ValidationError: domain validation issues (invalid ledger entry, missing base, unknown currency,
+    - ValidationError: domain validation issues (invalid grouped row, missing base, unknown currency,
       missing/non-positive rate for non-base currency).
     - DomainError: not raised here (no balancing invariant enforced at report level).
+
+    Caching: pass a shared ``DetailedBalanceCache`` as ``cache`` to reuse results for
+    repeated closed-window queries; results are stored after the UoW commits (see
+    the cache docstring for invalidation rules).
     """
 
     uow: AsyncUnitOfWork
     clock: Clock
+    cache: DetailedBalanceCache | None = None
 
     async def __call__(
         self,
@@ -131,65 +163,99 @@ class AsyncGetTradingBalanceDetailed:
             List of ``TradingBalanceLineDetailed``; empty if no transactions.
         """
         now = self.clock.now()
-        start_dt = start or _epoch_with_tz(now)
+        start_dt = start or epoch_for(now.tzinfo)
         end_dt = end or now
         if start_dt > end_dt:
             raise ValueError("start > end")
         if meta is not None and not isinstance(meta, dict):
             raise ValueError("meta must be a dict or None")
 
-        txs = await self.uow.transactions.list_between(start_dt, end_dt, meta)
-        entries: list[LedgerEntry] = []
-        for tx in txs:
-            for line in tx.lines:
-                try:
-                    entries.append(
-                        LedgerEntry(side=line.side, amount=line.amount, currency_code=line.currency_code)
-                    )
-                except ValidationError as ve:
-                    raise ve
-
-        # Load currencies (CRUD-only) and project to domain Currency objects (needed even if no entries to validate base presence)
+        # Load currencies (CRUD-only) and index domain Currency objects by code once
+        # (needed even if no rows to validate base presence)
         cur_dtos = await self.uow.currencies.list_all()
-        domain_currencies: list[Currency] = []
-        for dto in cur_dtos:
-            try:
-                domain_currencies.append(
-                    Currency(code=dto.code, is_base=dto.is_base, rate_to_base=dto.exchange_rate)
-                )
-            except ValidationError as ve:
-                raise ve
+        index = CurrencyIndex.build(
+            Currency(code=dto.code, is_base=dto.is_base, rate_to_base=dto.exchange_rate) for dto in cur_dtos
+        )
 
         # Validate / determine base currency early (even when no entries) per spec
         if base_currency is not None:
             base_norm = base_currency.strip().upper() if base_currency else ""
-            if not any(c.code == base_norm for c in domain_currencies):
+            if base_norm not in index:
                 raise ValidationError(f"Base currency not found: {base_currency!r}")
             base_code_final = base_norm
         else:
-            # Infer
-            from py_accountant.domain.currencies import get_base_currency as _gbc
-
-            base_obj = _gbc(domain_currencies)
-            if base_obj is None:
+            if index.base is None:
                 raise ValidationError("Base currency is not defined")
-            base_code_final = base_obj.code
+            base_code_final = index.base.code
 
-        if not entries:
-            return []
+        # Closed windows are repeatable while the currency catalog and ledger are unchanged
+        cache_key: Hashable | None = None
+        version = ledger_version.current()
+        if self.cache is not None and (end_dt.tzinfo is None) == (now.tzinfo is None) and end_dt < now:
+            cache_key = _cache_key(start_dt, end_dt, meta, base_code_final, cur_dtos, version)
+            if cache_key is not None:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    return cached
 
-        converted = ConvertedAggregator().aggregate(entries, domain_currencies, base_code=base_code_final)
-        return [
-            TradingBalanceLineDetailed(
-                currency_code=line.currency_code,
-                base_currency_code=line.base_currency_code,
-                debit=line.debit,
-                credit=line.credit,
-                net=line.net,
-                used_rate=line.used_rate,
-                debit_base=line.debit_base,
-                credit_base=line.credit_base,
-                net_base=line.net_base,
-            )
-            for line in converted
-        ]
+        # Only query transactions once the cheap base checks passed. The two reads stay
+        # sequential: both run on the single UoW AsyncSession, which does not allow
+        # concurrent operations (asyncio.gather would fail at runtime).
+        rows = await self.uow.transactions.aggregate_raw(start_dt, end_dt, meta)
+        if not rows:
+            result: list[TradingBalanceLineDetailed] = []
+        else:
+            converted = CONVERTED_AGGREGATOR.from_grouped(rows, index, base_code=base_code_final)
+            result = [
+                TradingBalanceLineDetailed(
+                    currency_code=line.currency_code,
+                    base_currency_code=line.base_currency_code,
+                    debit=line.debit,
+                    credit=line.credit,
+                    net=line.net,
+                    used_rate=line.used_rate,
+                    debit_base=line.debit_base,
+                    credit_base=line.credit_base,
+                    net_base=line.net_base,
+                )
+                for line in converted
+            ]
+        on_commit = getattr(self.uow, "on_commit", None)
+        if cache_key is not None and self.cache is not None and on_commit is not None:
+            on_commit(_deferred_put(self.cache, cache_key, result, version))
+        return result
+
+
+def _deferred_put(
+    cache: DetailedBalanceCache,
+    key: Hashable,
+    lines: list[TradingBalanceLineDetailed],
+    version: int,
+) -> Callable[[], None]:
+    """Return an after-commit callback storing ``lines`` unless a posting happened meanwhile."""
+    snapshot = [replace(line) for line in lines]
+
+    def _put() -> None:
+        if ledger_version.current() == version:
+            cache.put(key, snapshot)
+
+    return _put
+
+
+def _cache_key(
+    start: datetime,
+    end: datetime,
+    meta: dict[str, Any] | None,
+    base_code: str,
+    cur_dtos: list[Any],
+    version: int,
+) -> Hashable | None:
+    """Build a result cache key; None when ``meta`` holds unhashable values."""
+    currencies = tuple(sorted((c.code, c.exchange_rate, c.is_base) for c in cur_dtos))
+    try:
+        meta_key = frozenset(meta.items()) if meta else None
+        key = (start, end, meta_key, base_code, currencies, version)
+        hash(key)
+    except TypeError:
+        return None
+    return key
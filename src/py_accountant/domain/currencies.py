@@ -4,12 +4,15 @@ Public API:
 - Currency: code, is_base, rate_to_base with helpers to manage rate and base flag.
 - BaseCurrencyRule: ensure a single base currency among a list, or clear base.
 - get_base_currency: return current base or None.
+- CurrencyIndex: currencies keyed by code with the base resolved once.
 
 No infrastructure dependencies. Rates are normalized via rate_quantize and must be
 positive (> 0). The global Decimal context is not modified.
 """
 from __future__ import annotations
 
+import sys
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from decimal import Decimal
 
@@ -37,7 +40,7 @@ class Currency:
         normalized = (self.code or "").strip().upper()
         if not (3 <= len(normalized) <= 10):
             raise ValidationError(f"Invalid currency code length: {self.code!r}")
-        self.code = normalized
+        self.code = sys.intern(normalized)
         # If rate provided directly (rare), ensure it's Decimal-quantized
         if self.rate_to_base is not None:
             # Accept only positive rates
@@ -130,3 +133,33 @@ def get_base_currency(currencies: list[Currency]) -> Currency | None:
     # TODO: Optionally validate duplicate base flags in future (repository-level uniqueness)
     return None
 
+
+@dataclass(slots=True)
+class CurrencyIndex:
+    """Currencies keyed by normalized code, with the base currency resolved once.
+
+    Build it once per request (``CurrencyIndex.build``) and pass it around instead
+    of a list, so code lookups and base detection are O(1) rather than list scans.
+    The first currency flagged ``is_base`` wins, matching ``get_base_currency``.
+    """
+
+    by_code: dict[str, Currency]
+    base: Currency | None = None
+
+    @classmethod
+    def build(cls, currencies: Iterable[Currency]) -> CurrencyIndex:
+        """Index ``currencies`` by code in a single pass."""
+        by_code: dict[str, Currency] = {}
+        base: Currency | None = None
+        for c in currencies:
+            by_code[c.code] = c
+            if base is None and c.is_base:
+                base = c
+        return cls(by_code=by_code, base=base)
+
+    def __contains__(self, code: object) -> bool:
+        return code in self.by_code
+
+    def get(self, code: str) -> Currency | None:
+        """Return the currency for an already-normalized ``code`` or None."""
+        return self.by_code.get(code)
@@ -10,6 +10,7 @@ Decimal's global context and performs rounding via domain.quantize.
 """
 from __future__ import annotations
 
+import sys
 from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from decimal import Decimal
@@ -28,7 +29,14 @@ class EntrySide(str, Enum):
     CREDIT = "CREDIT"
 
 
+# Normalized side string -> member; one dict probe replaces membership test + Enum lookup
+_SIDE_BY_NAME: dict[str, EntrySide] = {"DEBIT": EntrySide.DEBIT, "CREDIT": EntrySide.CREDIT}
+_ZERO = Decimal("0")
+
+
 def _to_decimal(x: Decimal | int | str | float | Any) -> Decimal:
+    if type(x) is Decimal:
+        return x
     if isinstance(x, Decimal):
         return x
     if isinstance(x, (int, str)):
@@ -56,28 +64,31 @@ class LedgerEntry:
         # Normalize side
         side_val: EntrySide
         raw_side = self.side
-        if isinstance(raw_side, EntrySide):
+        # Exact-type checks first (per-line hot path); isinstance keeps subclasses working
+        raw_type = type(raw_side)
+        if raw_type is EntrySide or (raw_type is not str and isinstance(raw_side, EntrySide)):
             side_val = raw_side
-        elif isinstance(raw_side, str):
-            normalized = raw_side.strip().upper()
-            if normalized not in (EntrySide.DEBIT.value, EntrySide.CREDIT.value):
+        elif raw_type is str or isinstance(raw_side, str):
+            side_lookup = _SIDE_BY_NAME.get(raw_side.strip().upper())
+            if side_lookup is None:
                 raise ValidationError(f"Invalid entry side: {raw_side!r}")
-            side_val = EntrySide(normalized)
+            side_val = side_lookup
         else:
             raise ValidationError(f"Invalid entry side type: {type(raw_side)!r}")
         object.__setattr__(self, "side", side_val)
 
         # Normalize amount
         amount_dec = _to_decimal(self.amount)
-        if amount_dec <= 0:
+        if amount_dec <= _ZERO:
             raise ValidationError("Amount must be positive")
         object.__setattr__(self, "amount", amount_dec)
 
-        # Normalize currency code
+        # Normalize currency code; interned so validator lookups against
+        # Currency.code (also interned) short-circuit on identity
         code = (self.currency_code or "").strip().upper()
         if not (3 <= len(code) <= 10):
             raise ValidationError(f"Invalid currency code length: {self.currency_code!r}")
-        object.__setattr__(self, "currency_code", code)
+        object.__setattr__(self, "currency_code", sys.intern(code))
 
 
 class LedgerValidator:
@@ -116,7 +127,8 @@ class LedgerValidator:
             cur_values = list(cur_map.values())
         else:
             cur_values = list(currencies)
-            cur_map = { c.code.strip().upper(): c for c in cur_values }
+            # Currency.__post_init__ already stored the trimmed upper-case code
+            cur_map = {c.code: c for c in cur_values}
         if not cur_map:
             raise ValidationError("No currencies provided")
 
@@ -136,28 +148,36 @@ class LedgerValidator:
             base_code_norm = base_currency.code
 
         # Accumulators in base currency
-        debit_total = Decimal("0")
-        credit_total = Decimal("0")
+        debit_total = _ZERO
+        credit_total = _ZERO
 
+        # Resolved per currency on first use (None = base currency, no conversion);
+        # entries repeat a handful of codes, so lookups/rate checks run once per code
+        rate_of: dict[str, Decimal | None] = {}
         for entry in materialized:
-            currency = cur_map.get(entry.currency_code)
-            if currency is None:
-                raise ValidationError(f"Unknown currency in entry: {entry.currency_code!r}")
+            code = entry.currency_code
+            if code in rate_of:
+                rate = rate_of[code]
+            else:
+                currency = cur_map.get(code)
+                if currency is None:
+                    raise ValidationError(f"Unknown currency in entry: {code!r}")
+                if currency.code == base_code_norm:
+                    rate = None
+                else:
+                    rate = currency.rate_to_base
+                    if rate is None:
+                        raise ValidationError(
+                            f"Missing rate_to_base for currency: {currency.code}"
+                        )
+                    if rate <= 0:
+                        raise ValidationError(
+                            f"Non-positive rate_to_base for currency: {currency.code}"
+                        )
+                rate_of[code] = rate
 
             # Compute amount in base
-            if currency.code == base_code_norm:
-                amount_base = entry.amount
-            else:
-                rate = currency.rate_to_base
-                if rate is None:
-                    raise ValidationError(
-                        f"Missing rate_to_base for currency: {currency.code}"
-                    )
-                if rate <= 0:
-                    raise ValidationError(
-                        f"Non-positive rate_to_base for currency: {currency.code}"
-                    )
-                amount_base = entry.amount * rate
+            amount_base = entry.amount if rate is None else entry.amount * rate
 
             if entry.side == EntrySide.DEBIT:
                 debit_total += amount_base
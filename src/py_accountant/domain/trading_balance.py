@@ -5,6 +5,10 @@ Public API:
 - RawAggregator: groups validated LedgerEntry lines by currency and returns totals.
 - ConvertedBalanceLine: immutable dataclass with original and base-currency totals.
 - ConvertedAggregator: aggregates like RawAggregator and converts to base currency.
+- GroupedTotal: ``(currency_code, side, amount)`` row pre-aggregated by a repository;
+  both aggregators accept such rows via ``from_grouped``.
+- RAW_AGGREGATOR / CONVERTED_AGGREGATOR: shared instances; the aggregators hold no
+  state, so report use cases reuse these instead of building one per call.
 
 Notes:
 - Aggregation is performed in a single pass without converting to base currency.
@@ -19,11 +23,83 @@ from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from decimal import Decimal
 
-from .currencies import Currency, get_base_currency
+from .currencies import Currency, CurrencyIndex, get_base_currency
 from .errors import ValidationError
 from .ledger import EntrySide, LedgerEntry
 from .quantize import money_quantize, rate_quantize
 
+_ZERO = Decimal("0")
+
+GroupedTotal = tuple[str, str, Decimal]
+
+
+def _accumulate(lines: Iterable[LedgerEntry]) -> dict[str, list[Decimal]]:
+    """Sum amounts per currency and side in a single pass.
+
+    Returns a mapping ``code -> [debit_total, credit_total]`` with raw (unrounded)
+    Decimal totals. One dict lookup per entry; locals are bound once outside the
+    loop to keep per-entry interpreter overhead low on long report windows.
+
+    Raises:
+        ValidationError: If an input element is not a LedgerEntry, has an invalid
+            currency code or an invalid side.
+    """
+    totals: dict[str, list[Decimal]] = {}
+    get = totals.get
+    debit_side = EntrySide.DEBIT
+    credit_side = EntrySide.CREDIT
+    for item in lines:
+        if not isinstance(item, LedgerEntry):  # safety guard for unexpected inputs
+            raise ValidationError("Input must be LedgerEntry instances")
+        code = item.currency_code
+        acc = get(code)
+        if acc is None:
+            # Normalize once per distinct code (already enforced by LedgerEntry)
+            norm = (code or "").strip().upper()
+            if not (3 <= len(norm) <= 10):
+                raise ValidationError(f"Invalid currency code: {item.currency_code!r}")
+            acc = get(norm)
+            if acc is None:
+                acc = totals[norm] = [_ZERO, _ZERO]
+        side = item.side
+        if side is debit_side:
+            acc[0] += item.amount
+        elif side is credit_side:
+            acc[1] += item.amount
+        else:
+            # Should be unreachable because LedgerEntry validates, but guard anyway
+            raise ValidationError(f"Invalid entry side: {item.side!r}")
+    return totals
+
+
+def _fold_grouped(rows: Iterable[GroupedTotal]) -> dict[str, list[Decimal]]:
+    """Fold repository-grouped ``(code, side, amount)`` rows into per-currency totals.
+
+    Produces the same ``code -> [debit_total, credit_total]`` mapping as
+    ``_accumulate``. Codes and sides are normalized (strip/upper) and validated
+    per row; repeated ``(code, side)`` pairs are summed.
+
+    Raises:
+        ValidationError: On an invalid currency code or side.
+    """
+    totals: dict[str, list[Decimal]] = {}
+    for code_raw, side_raw, amount in rows:
+        code = (code_raw or "").strip().upper()
+        if not (3 <= len(code) <= 10):
+            raise ValidationError(f"Invalid currency code: {code_raw!r}")
+        side = (side_raw or "").strip().upper()
+        if side == EntrySide.DEBIT.value:
+            idx = 0
+        elif side == EntrySide.CREDIT.value:
+            idx = 1
+        else:
+            raise ValidationError(f"Invalid entry side: {side_raw!r}")
+        acc = totals.get(code)
+        if acc is None:
+            acc = totals[code] = [_ZERO, _ZERO]
+        acc[idx] += amount if isinstance(amount, Decimal) else Decimal(str(amount))
+    return totals
+
 
 @dataclass(slots=True, frozen=True)
 class RawBalanceLine:
@@ -46,6 +122,7 @@ class RawAggregator:
     """Aggregate validated ledger entries by currency without FX conversion.
 
     Usage: RawAggregator().aggregate(lines) -> list[RawBalanceLine] sorted by currency code.
+           RawAggregator().from_grouped(rows) -> same, from repository-grouped totals.
     """
 
     def aggregate(self, lines: Iterable[LedgerEntry]) -> list[RawBalanceLine]:
@@ -60,35 +137,35 @@ class RawAggregator:
         Raises:
             ValidationError: If an input element is not a LedgerEntry or has an invalid side.
         """
-        # Single-pass accumulation of raw Decimal amounts per currency and side
-        debit_totals: dict[str, Decimal] = {}
-        credit_totals: dict[str, Decimal] = {}
+        return self._build(_accumulate(lines))
 
-        for item in lines:
-            if not isinstance(item, LedgerEntry):  # safety guard for unexpected inputs
-                raise ValidationError("Input must be LedgerEntry instances")
+    def from_grouped(self, rows: Iterable[GroupedTotal]) -> list[RawBalanceLine]:
+        """Produce rounded totals from rows already grouped by currency and side.
 
-            code = (item.currency_code or "").strip().upper()
-            if not (3 <= len(code) <= 10):  # ultra-conservative check (already enforced by LedgerEntry)
-                raise ValidationError(f"Invalid currency code: {item.currency_code!r}")
+        Args:
+            rows: Iterable of ``(currency_code, side, amount)`` tuples, e.g. the
+                result of ``transactions.aggregate_raw``. Can be empty.
 
-            if item.side == EntrySide.DEBIT:
-                debit_totals[code] = debit_totals.get(code, Decimal("0")) + item.amount
-            elif item.side == EntrySide.CREDIT:
-                credit_totals[code] = credit_totals.get(code, Decimal("0")) + item.amount
-            else:
-                # Should be unreachable because LedgerEntry validates, but guard anyway
-                raise ValidationError(f"Invalid entry side: {item.side!r}")
+        Returns:
+            List of RawBalanceLine sorted by currency_code ascending; identical to
+            ``aggregate`` over the underlying entries.
 
-        # Build results with rounding at the end per currency
-        if not debit_totals and not credit_totals:
+        Raises:
+            ValidationError: If a row has an invalid currency code or side.
+        """
+        return self._build(_fold_grouped(rows))
+
+    @staticmethod
+    def _build(totals: Mapping[str, list[Decimal]]) -> list[RawBalanceLine]:
+        if not totals:
             return []
 
-        codes = sorted(set(debit_totals.keys()) | set(credit_totals.keys()))
+        # Build results with rounding at the end per currency
         results: list[RawBalanceLine] = []
-        for code in codes:
-            debit_q = money_quantize(debit_totals.get(code, Decimal("0")))
-            credit_q = money_quantize(credit_totals.get(code, Decimal("0")))
+        for code in sorted(totals):
+            debit_raw, credit_raw = totals[code]
+            debit_q = money_quantize(debit_raw)
+            credit_q = money_quantize(credit_raw)
             net_q = money_quantize(debit_q - credit_q)
             results.append(
                 RawBalanceLine(
@@ -133,22 +210,24 @@ class ConvertedAggregator:
 
     Usage: ConvertedAggregator().aggregate(lines, currencies, base_code=None)
            -> list[ConvertedBalanceLine] sorted by currency code.
+           ConvertedAggregator().from_grouped(rows, currencies, base_code=None)
+           -> same, from repository-grouped totals.
     """
 
     def aggregate(
         self,
         lines: Iterable[LedgerEntry],
-        currencies: Sequence[Currency] | Mapping[str, Currency],
+        currencies: CurrencyIndex | Sequence[Currency] | Mapping[str, Currency],
         base_code: str | None = None,
     ) -> list[ConvertedBalanceLine]:
         """Group lines by currency, compute totals and convert to the base currency.
 
         Args:
             lines: Iterable of LedgerEntry instances. Can be empty.
-            currencies: Collection of Currency objects (sequence or mapping); codes are
-                matched case-insensitively.
-            base_code: Optional explicit base currency code; if omitted, detected via
-                get_base_currency(currencies).
+            currencies: ``CurrencyIndex`` (preferred; used as-is) or a collection of
+                Currency objects (sequence or mapping); codes are matched case-insensitively.
+            base_code: Optional explicit base currency code; if omitted, the first
+                currency flagged ``is_base`` (``CurrencyIndex.base``) is used.
 
         Returns:
             List of ConvertedBalanceLine sorted by currency_code (ASC). Empty for empty input.
@@ -158,34 +237,53 @@ class ConvertedAggregator:
                 entries is absent in `currencies`; if base currency cannot be determined;
                 or for non-base currencies when rate_to_base is missing or non-positive.
         """
-        # Single-pass accumulation of raw Decimal amounts per currency and side
-        raw_debit: dict[str, Decimal] = {}
-        raw_credit: dict[str, Decimal] = {}
-
-        for item in lines:
-            if not isinstance(item, LedgerEntry):
-                raise ValidationError("Input must be LedgerEntry instances")
-            code = (item.currency_code or "").strip().upper()
-            if not (3 <= len(code) <= 10):
-                raise ValidationError(f"Invalid currency code: {item.currency_code!r}")
-            if item.side == EntrySide.DEBIT:
-                raw_debit[code] = raw_debit.get(code, Decimal("0")) + item.amount
-            elif item.side == EntrySide.CREDIT:
-                raw_credit[code] = raw_credit.get(code, Decimal("0")) + item.amount
-            else:
-                raise ValidationError(f"Invalid entry side: {item.side!r}")
+        return self._convert(_accumulate(lines), currencies, base_code)
+
+    def from_grouped(
+        self,
+        rows: Iterable[GroupedTotal],
+        currencies: CurrencyIndex | Sequence[Currency] | Mapping[str, Currency],
+        base_code: str | None = None,
+    ) -> list[ConvertedBalanceLine]:
+        """Convert rows already grouped by currency and side to the base currency.
 
+        Args:
+            rows: Iterable of ``(currency_code, side, amount)`` tuples, e.g. the
+                result of ``transactions.aggregate_raw``. Can be empty.
+            currencies: Same as in ``aggregate``.
+            base_code: Same as in ``aggregate``.
+
+        Returns:
+            List of ConvertedBalanceLine sorted by currency_code (ASC); identical to
+            ``aggregate`` over the underlying entries.
+
+        Raises:
+            ValidationError: On an invalid row code/side and for the same currency/base/rate
+                problems as ``aggregate``.
+        """
+        return self._convert(_fold_grouped(rows), currencies, base_code)
+
+    @staticmethod
+    def _convert(
+        totals: Mapping[str, list[Decimal]],
+        currencies: CurrencyIndex | Sequence[Currency] | Mapping[str, Currency],
+        base_code: str | None,
+    ) -> list[ConvertedBalanceLine]:
         # Early return for empty input
-        if not raw_debit and not raw_credit:
+        if not totals:
             return []
 
-        # Normalize currencies to mapping and list for base detection
-        if isinstance(currencies, Mapping):
-            cur_map: dict[str, Currency] = { (k or "").strip().upper(): v for k, v in currencies.items() }
-            cur_values = list(cur_map.values())
+        # Normalize currencies to an index (code -> Currency, base resolved once)
+        if isinstance(currencies, CurrencyIndex):
+            index = currencies
+        elif isinstance(currencies, Mapping):
+            index = CurrencyIndex(
+                by_code={(k or "").strip().upper(): v for k, v in currencies.items()},
+                base=get_base_currency(list(currencies.values())),
+            )
         else:
-            cur_values = list(currencies)
-            cur_map = { c.code.strip().upper(): c for c in cur_values }
+            index = CurrencyIndex.build(currencies)
+        cur_map = index.by_code
 
         # Determine base currency
         if base_code is not None:
@@ -195,23 +293,23 @@ class ConvertedAggregator:
                 raise ValidationError(f"Base currency not found: {base_code!r}")
             base_code_norm = base_currency.code
         else:
-            base_currency = get_base_currency(cur_values)
+            base_currency = index.base
             if base_currency is None:
                 raise ValidationError("Base currency is not defined")
             base_code_norm = base_currency.code
 
         # Build per-currency results
-        codes = sorted(set(raw_debit.keys()) | set(raw_credit.keys()))
         results: list[ConvertedBalanceLine] = []
 
-        for code in codes:
+        for code in sorted(totals):
+            raw_debit, raw_credit = totals[code]
             currency = cur_map.get(code)
             if currency is None:
                 raise ValidationError(f"Unknown currency in entry: {code!r}")
 
             # Original totals rounded for DTO
-            debit_q = money_quantize(raw_debit.get(code, Decimal("0")))
-            credit_q = money_quantize(raw_credit.get(code, Decimal("0")))
+            debit_q = money_quantize(raw_debit)
+            credit_q = money_quantize(raw_credit)
             net_q = money_quantize(debit_q - credit_q)
 
             # Determine rate and convert totals to base currency
@@ -227,8 +325,8 @@ class ConvertedAggregator:
             used_rate_dto = rate_quantize(used_rate_num)
 
             # Convert raw totals (pre-rounded) and then quantize to money
-            debit_base_q = money_quantize(raw_debit.get(code, Decimal("0")) * used_rate_num)
-            credit_base_q = money_quantize(raw_credit.get(code, Decimal("0")) * used_rate_num)
+            debit_base_q = money_quantize(raw_debit * used_rate_num)
+            credit_base_q = money_quantize(raw_credit * used_rate_num)
             net_base_q = money_quantize(debit_base_q - credit_base_q)
 
             results.append(
@@ -247,3 +345,6 @@ class ConvertedAggregator:
 
         return results
 
+
+RAW_AGGREGATOR = RawAggregator()
+CONVERTED_AGGREGATOR = ConvertedAggregator()
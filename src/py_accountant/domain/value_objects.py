@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import re
 from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
 from enum import Enum
+from functools import lru_cache
 from typing import Literal
 
 from .errors import DomainError
@@ -20,6 +22,10 @@ __all__ = [
 ]
 
 
+# ``\w`` on str patterns is exactly str.isalnum() plus "_" (Unicode-aware), checked in C
+_SEGMENT_RE = re.compile(r"\w*")
+
+
 @dataclass(frozen=True, slots=True)
 class CurrencyCode:
     code: str
@@ -35,6 +41,15 @@ class CurrencyCode:
             raise DomainError("Currency code must be ASCII alnum + '_' only")
         object.__setattr__(self, "code", code.upper())
 
+    @classmethod
+    def get(cls, code: str) -> CurrencyCode:
+        """Return a shared validated instance for ``code`` (interned, bounded cache)."""
+        # Exact-type check: plain str is the per-line case; anything else (incl.
+        # str subclasses) is validated without interning
+        if type(code) is not str:
+            return cls(code)
+        return _intern_currency_code(code)
+
     def __str__(self) -> str:  # pragma: no cover - trivial
         return self.code
 
@@ -58,11 +73,18 @@ class AccountName:
         for seg in segments:
             if len(seg) > self.MAX_SEGMENT:
                 raise DomainError("Account name segment too long")
-            if any(not (c.isalnum() or c == "_") for c in seg):
+            if _SEGMENT_RE.fullmatch(seg) is None:
                 raise DomainError("Account name segments must be alnum/_ only")
         object.__setattr__(self, "full_name", raw)
         object.__setattr__(self, "segments", tuple(segments))
 
+    @classmethod
+    def get(cls, full_name: str) -> AccountName:
+        """Return a shared validated instance for ``full_name`` (interned, bounded cache)."""
+        if type(full_name) is not str:
+            return cls(full_name)
+        return _intern_account_name(full_name)
+
     @property
     def name(self) -> str:
         return self.segments[-1]
@@ -71,7 +93,8 @@ class AccountName:
     def parent(self) -> AccountName | None:
         if len(self.segments) == 1:
             return None
-        return AccountName(":".join(self.segments[:-1]))
+        # Parent paths repeat across siblings: reuse the interned, already split instance
+        return AccountName.get(":".join(self.segments[:-1]))
 
     def path(self) -> Sequence[str]:  # pragma: no cover - simple
         return self.segments
@@ -80,6 +103,18 @@ class AccountName:
         return self.full_name
 
 
+# Value objects are immutable, so one instance per distinct code/name can be shared
+# across lines. Failed validations raise and are not cached.
+@lru_cache(maxsize=1024)
+def _intern_currency_code(code: str) -> CurrencyCode:
+    return CurrencyCode(code)
+
+
+@lru_cache(maxsize=4096)
+def _intern_account_name(full_name: str) -> AccountName:
+    return AccountName(full_name)
+
+
 class EntrySide(str, Enum):
     DEBIT = "DEBIT"
     CREDIT = "CREDIT"
@@ -99,10 +134,13 @@ class ExchangeRate:
 
     @classmethod
     def from_number(cls, number: int | float | str | Decimal) -> ExchangeRate:
-        try:
-            dec = Decimal(str(number))
-        except (InvalidOperation, ValueError) as exc:  # noqa: PERF203
-            raise DomainError("Invalid exchange rate") from exc
+        if type(number) is Decimal:
+            dec = number
+        else:
+            try:
+                dec = Decimal(str(number))
+            except (InvalidOperation, ValueError) as exc:  # noqa: PERF203
+                raise DomainError("Invalid exchange rate") from exc
         if dec <= 0:
             raise DomainError("Exchange rate must be > 0")
         # Normalize to 10 decimal places for deterministic comparisons.
@@ -135,13 +173,17 @@ class EntryLine:
         exchange_rate: ExchangeRate | int | float | Decimal | str = 1,
     ) -> EntryLine:
         if isinstance(account, str):
-            account = AccountName(account)
+            account = AccountName.get(account)
         if isinstance(currency, str):
-            currency = CurrencyCode(currency)
-        try:
-            dec_amount = Decimal(str(amount))
-        except (InvalidOperation, ValueError) as exc:  # noqa: PERF203
-            raise DomainError("Invalid amount") from exc
+            currency = CurrencyCode.get(currency)
+        # DTO amounts are already Decimal: skip the str() round-trip and parse attempt
+        if type(amount) is Decimal:
+            dec_amount = amount
+        else:
+            try:
+                dec_amount = Decimal(str(amount))
+            except (InvalidOperation, ValueError) as exc:  # noqa: PERF203
+                raise DomainError("Invalid amount") from exc
         if dec_amount <= 0:
             raise DomainError("Amount must be > 0")
         if not isinstance(exchange_rate, ExchangeRate):
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from functools import lru_cache
-from typing import Literal
+import os
+from functools import cache, cached_property, lru_cache
+from typing import Literal, NamedTuple
 
 from pydantic import AliasChoices, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -9,10 +10,26 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 EnvName = Literal["test", "production"]
 
 
+@cache
 def _prefixed(name: str) -> AliasChoices:
+    # Один объект на имя: подклассы профилей переобъявляют те же поля
     return AliasChoices(f"PYACC__{name}", name)
 
 
+class DBRuntime(NamedTuple):
+    """Параметры пула/таймаутов/ретраев БД одним кортежем (ASYNC-09)."""
+
+    pool_size: int
+    max_overflow: int
+    pool_timeout: int
+    pool_recycle_sec: int
+    connect_timeout_sec: int
+    statement_timeout_ms: int
+    retry_attempts: int
+    retry_backoff_ms: int
+    retry_max_backoff_ms: int
+
+
 class BaseAppSettings(BaseSettings):
     """
     Общие настройки приложения.
@@ -25,7 +42,8 @@ class BaseAppSettings(BaseSettings):
     - Параметры ретраев транзистентных ошибок
     """
 
-    model_config = SettingsConfigDict(env_file=(".env",), env_file_encoding="utf-8", extra="ignore")
+    # frozen: экземпляры кэшируются в get_settings и разделяются между вызывающими
+    model_config = SettingsConfigDict(env_file=(".env",), env_file_encoding="utf-8", extra="ignore", frozen=True)
 
     # Поле env не связано напрямую с ENV, чтобы исключить коллизии и обеспечить явный контроль
     env: EnvName = Field(default="test")
@@ -64,6 +82,21 @@ class BaseAppSettings(BaseSettings):
     db_retry_backoff_ms: int = Field(alias="DB_RETRY_BACKOFF_MS", default=50, validation_alias=_prefixed("DB_RETRY_BACKOFF_MS"))
     db_retry_max_backoff_ms: int = Field(alias="DB_RETRY_MAX_BACKOFF_MS", default=1000, validation_alias=_prefixed("DB_RETRY_MAX_BACKOFF_MS"))
 
+    @cached_property
+    def db_runtime(self) -> DBRuntime:
+        """Снимок db_* полей; строится один раз на экземпляр (настройки заморожены)."""
+        return DBRuntime(
+            pool_size=self.db_pool_size,
+            max_overflow=self.db_max_overflow,
+            pool_timeout=self.db_pool_timeout,
+            pool_recycle_sec=self.db_pool_recycle_sec,
+            connect_timeout_sec=self.db_connect_timeout_sec,
+            statement_timeout_ms=self.db_statement_timeout_ms,
+            retry_attempts=self.db_retry_attempts,
+            retry_backoff_ms=self.db_retry_backoff_ms,
+            retry_max_backoff_ms=self.db_retry_max_backoff_ms,
+        )
+
 
 class TestSettings(BaseAppSettings):
     """
@@ -74,8 +107,6 @@ class TestSettings(BaseAppSettings):
     - Дефолты для пула/таймаутов/ретраев остаются консервативными
     """
 
-    model_config = SettingsConfigDict(env_prefix="", extra="ignore")
-
     # Значения по умолчанию для тестов
     env: EnvName = Field(default="test")
     database_url: str = Field(alias="DATABASE_URL", default="sqlite+pysqlite:///:memory:", validation_alias=_prefixed("DATABASE_URL"))
@@ -90,8 +121,6 @@ class ProdSettings(BaseAppSettings):
     Требует явного задания критичных переменных.
     """
 
-    model_config = SettingsConfigDict(env_prefix="", extra="ignore")
-
     env: EnvName = Field(default="production")
     # database_url обязательно должно быть задано через ENV/секреты; placeholder используется для статического анализа
     database_url: str = Field(alias="DATABASE_URL", default="__MISSING_DB_URL__", validation_alias=_prefixed("DATABASE_URL"))
@@ -108,19 +137,37 @@ class ProdSettings(BaseAppSettings):
 
 
 # Классы без чтения .env для тестов изолированных профилей
+# (model_config подклассов сливается с базовым — переопределяем только env_file)
 class TestSettingsNoFile(TestSettings):
-    model_config = SettingsConfigDict(env_file=(), extra="ignore")
+    model_config = SettingsConfigDict(env_file=())
 
 
 class ProdSettingsNoFile(ProdSettings):
-    model_config = SettingsConfigDict(env_file=(), extra="ignore")
+    model_config = SettingsConfigDict(env_file=())
+
+
+# Переменные окружения, от которых зависят настройки (без учёта регистра, как в pydantic-settings)
+_SETTINGS_ENV_KEYS = frozenset({"ENV"} | {f.alias for f in BaseAppSettings.model_fields.values() if f.alias})
+
+
+def _env_fingerprint() -> tuple[tuple[str, str], ...]:
+    """Значения релевантных переменных окружения — часть ключа кэша настроек."""
+    return tuple(
+        sorted(
+            (k, v)
+            for k, v in os.environ.items()
+            if (ku := k.upper()) in _SETTINGS_ENV_KEYS or ku.startswith("PYACC__")
+        )
+    )
 
 
-@lru_cache(maxsize=8)
 def get_settings(forced_env: EnvName | None = None, *, ignore_env_file: bool = False) -> BaseAppSettings:
     """
     Фабрика настроек на основе ENV с кэшированием.
 
+    Кэш учитывает текущие значения релевантных переменных окружения, поэтому
+    изменение ENV/DATABASE_URL/PYACC__* подхватывается без ручного сброса.
+
     Parameters:
     - forced_env: Явно выбрать профиль ("test" или "production"), перекрывает ENV.
     - ignore_env_file: Отключить чтение .env (используются *NoFile классы).
@@ -128,14 +175,27 @@ def get_settings(forced_env: EnvName | None = None, *, ignore_env_file: bool = F
     Returns:
     - Экземпляр настроек текущего окружения, включающий параметры БД/пула/ретраев для async стека.
     """
-    import os
+    return _build_settings(forced_env, ignore_env_file, _env_fingerprint())
 
-    selector: EnvName = forced_env or os.getenv("ENV", "test")  # type: ignore[assignment]
+
+@lru_cache(maxsize=8)
+def _build_settings(
+    forced_env: EnvName | None, ignore_env_file: bool, env_fingerprint: tuple[tuple[str, str], ...]
+) -> BaseAppSettings:
+    selector: EnvName = forced_env or os.environ.get("ENV", "test")  # type: ignore[assignment]
     if selector == "production":
         cls = ProdSettingsNoFile if ignore_env_file else ProdSettings
     else:
         cls = TestSettingsNoFile if ignore_env_file else TestSettings
 
-    instance = cls()
-    instance.env = selector  # гарантируем согласованность поля env с выбором профиля
-    return instance
+    # env передаётся при создании: поле согласовано с выбором профиля без пост-мутации
+    return cls(env=selector)
+
+
+# Совместимость: прежний lru_cache-интерфейс get_settings.cache_clear()
+get_settings.cache_clear = _build_settings.cache_clear  # type: ignore[attr-defined]
+
+
+def refresh_env_cache() -> None:
+    """Сбросить закэшированные настройки (нужно только после правки .env-файла)."""
+    _build_settings.cache_clear()
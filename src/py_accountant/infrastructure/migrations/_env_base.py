@@ -0,0 +1,133 @@
+"""Shared pieces of the Alembic env.py scripts.
+
+Used by the built-in migrations ``env.py`` and by the project's ``alembic/env.py``.
+Each script keeps only its URL resolution policy and the run trigger; nothing here
+touches the Alembic context at import time.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+from collections.abc import Mapping
+from logging.config import fileConfig
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import engine_from_config, pool
+from sqlalchemy.engine import URL, make_url
+
+from alembic import context
+
+if TYPE_CHECKING:
+    from alembic.config import Config
+
+log = logging.getLogger("alembic.env")
+
+# asyncpg / aiosqlite / any "+async..." dialect suffix, matched in a single scan
+_ASYNC_DRIVER_RE = re.compile(r"asyncpg|aiosqlite|\+async")
+ASYNC_DRIVER_MESSAGE = (
+    "Async driver not supported for Alembic; use a synchronous URL (e.g., postgresql+psycopg or sqlite+pysqlite)."
+)
+NO_URL_MESSAGE = (
+    "No synchronous database URL found (sqlalchemy.url or DATABASE_URL). Provide a sync URL e.g. postgresql+psycopg or sqlite+pysqlite."
+)
+
+
+# (path, mtime) of logging ini files already applied in this process; env.py itself
+# is re-executed by Alembic on every run, so the memo has to live here
+_applied_log_configs: set[tuple[str, int]] = set()
+
+
+def configure_logging(config_file_name: str | None) -> None:
+    """Apply the ini logging config once per file version."""
+    if config_file_name is None:
+        return
+    try:
+        key = (config_file_name, os.stat(config_file_name).st_mtime_ns)
+    except OSError:
+        # Let fileConfig report the missing/unreadable file
+        fileConfig(config_file_name)
+        return
+    if key not in _applied_log_configs:
+        fileConfig(config_file_name)
+        _applied_log_configs.add(key)
+
+
+def warn_if_async_url_set(environ: Mapping[str, str]) -> None:
+    """Warn that DATABASE_URL_ASYNC is ignored by Alembic."""
+    if environ.get("DATABASE_URL_ASYNC"):
+        log.warning(
+            "DATABASE_URL_ASYNC is set but ignored by Alembic; migrations must use a sync URL via DATABASE_URL or sqlalchemy.url."
+        )
+
+
+def is_async_driver(drivername: str | None) -> bool:
+    """Return True when the SQLAlchemy driver name refers to an async driver."""
+    return _ASYNC_DRIVER_RE.search((drivername or "").lower()) is not None
+
+
+def parse_env_url(env_url: str) -> URL:
+    """Parse DATABASE_URL, rejecting async drivers.
+
+    Raises:
+        RuntimeError: The URL uses an async driver.
+        ValueError: The URL cannot be parsed.
+    """
+    try:
+        sa_url = make_url(env_url)
+    except Exception as exc:
+        # If parsing failed, re-raise as ValueError to mimic SA behavior
+        raise ValueError(f"Invalid DATABASE_URL: {env_url}") from exc
+    if is_async_driver(sa_url.drivername):
+        raise RuntimeError(ASYNC_DRIVER_MESSAGE)
+    return sa_url
+
+
+def run_migrations_offline(config: Config, target_metadata: Any, *, render_as_batch: bool = False) -> None:
+    """Run migrations in 'offline' mode using the validated sync URL from config.
+
+    This configures the Alembic context with a literal URL and does not create
+    an Engine. It's suitable for generating SQL scripts without connecting to
+    the database.
+    """
+    context.configure(
+        url=config.get_main_option("sqlalchemy.url"),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        compare_type=True,
+        render_as_batch=render_as_batch,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online(config: Config, target_metadata: Any, *, render_as_batch: bool = False) -> None:
+    """Run migrations in 'online' mode using a sync Engine built from config.
+
+    The configuration must already hold the validated sync URL, so async
+    drivers are rejected before any Engine is created.
+    """
+    cfg_section = config.get_section(config.config_ini_section) or {}
+    connectable = engine_from_config(
+        cfg_section,
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+    with connectable.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            compare_type=True,
+            render_as_batch=render_as_batch,
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+def run_migrations(config: Config, target_metadata: Any, *, render_as_batch: bool = False) -> None:
+    """Dispatch to offline/online mode according to the Alembic context."""
+    if context.is_offline_mode():
+        run_migrations_offline(config, target_metadata, render_as_batch=render_as_batch)
+    else:
+        run_migrations_online(config, target_metadata, render_as_batch=render_as_batch)
@@ -11,6 +11,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# py_accountant's versions directory (resolved once at import)
+_VERSIONS_DIR = str(Path(__file__).parent / "versions")
+
 
 def include_in_alembic(
     context: MigrationContext,
@@ -42,38 +45,39 @@ def include_in_alembic(
         ...             context.run_migrations()
     """
     # Graceful degradation if context doesn't have script
-    if not hasattr(context, "script") or context.script is None:
+    script = getattr(context, "script", None)
+    if script is None:
         logger.warning(
             "Alembic context has no script directory, "
             "skipping py_accountant migrations integration"
         )
         return
 
-    # Get path to py_accountant's versions directory
-    versions_path = Path(__file__).parent / "versions"
-
-    # Store original location and add py_accountant versions
-    original_dir = context.script.dir
+    # Work on a local list (tuple/None normalized) and assign it back once
+    locations = script.version_locations
+    if not isinstance(locations, list):
+        locations = list(locations or ())
 
-    # Initialize version_locations if not set
-    if context.script.version_locations is None:
-        context.script.version_locations = []
+    existing = set(locations)
 
-    # Convert to list if it's a tuple or other sequence
-    if not isinstance(context.script.version_locations, list):
-        context.script.version_locations = list(context.script.version_locations)
-
-    # Add py_accountant versions first (to be applied before project migrations)
-    context.script.version_locations.insert(0, str(versions_path))
+    # Add py_accountant versions first (to be applied before project migrations);
+    # repeated calls must not register the same directory twice
+    versions_dir = _VERSIONS_DIR
+    if versions_dir not in existing:
+        locations.insert(0, versions_dir)
+        existing.add(versions_dir)
 
     # Add original directory if not already present
-    if original_dir not in context.script.version_locations:
-        context.script.version_locations.append(original_dir)
+    original_dir = script.dir
+    if original_dir not in existing:
+        locations.append(original_dir)
+
+    script.version_locations = locations
 
     logger.info(
         "Included py_accountant migrations from %s "
         "(table_prefix=%r, schema=%r)",
-        versions_path,
+        versions_dir,
         table_prefix,
         schema,
     )
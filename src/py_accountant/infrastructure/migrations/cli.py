@@ -6,11 +6,8 @@ import sys
 from pathlib import Path
 
 import typer
-from alembic import command
-from alembic.config import Config
 from rich.console import Console
 from rich.table import Table
-from sqlalchemy.ext.asyncio import create_async_engine
 
 from .runner import MigrationRunner
 
@@ -18,31 +15,60 @@ app = typer.Typer(
     name="migrations",
     help="Manage py_accountant database migrations",
     pretty_exceptions_enable=False,
+    # Run via ``python -m`` / embedding apps: no shell-completion options, plain help text
+    add_completion=False,
+    rich_markup_mode=None,
 )
 console = Console()
 
 
+def _echo_flag(value: object) -> bool:
+    """Normalize the --echo flag to a real bool once, at parse time.
+
+    Typer 0.9 on newer Click passes the string ``"False"`` when the flag is absent
+    and ``None`` when it is given, so a plain ``bool(value)`` would always echo.
+    """
+    if isinstance(value, str):
+        return value.strip().lower() in {"1", "true", "yes", "on"}
+    return value is None or bool(value)
+
+
+_ECHO_OPTION = typer.Option(False, "--echo", help="Echo SQL", callback=_echo_flag)
+
+
 def get_database_url() -> str:
     """Get DATABASE_URL from environment."""
-    url = os.getenv("DATABASE_URL") or os.getenv("PYACC__DATABASE_URL")
+    environ = os.environ
+    url = environ.get("DATABASE_URL") or environ.get("PYACC__DATABASE_URL")
     if not url:
         console.print("[red]Error: DATABASE_URL not set[/red]", file=sys.stderr)
         sys.exit(1)
     return url
 
 
+def _build_runner(echo: bool) -> MigrationRunner:
+    """Create a MigrationRunner for DATABASE_URL.
+
+    Not cached across commands: each command drives its own ``asyncio.run`` loop,
+    and pooled async connections must not outlive the loop that opened them.
+    The engine factory and Alembic (``history``) are imported where used so that
+    importing the CLI does not load Alembic.
+    """
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    url = get_database_url()
+    engine = create_async_engine(url, echo=echo)
+    return MigrationRunner(engine, echo=echo)
+
+
 @app.command()
 def upgrade(
     revision: str = typer.Argument("head", help="Target revision"),
-    echo: bool = typer.Option(False, "--echo", help="Echo SQL"),
+    echo: bool = _ECHO_OPTION,
 ):
     """Apply migrations."""
 
-    url = get_database_url()
-    # Ensure echo is boolean (typer may pass string from env vars)
-    echo_bool = bool(echo) if not isinstance(echo, bool) else echo
-    engine = create_async_engine(url, echo=echo_bool)
-    runner = MigrationRunner(engine, echo=echo_bool)
+    runner = _build_runner(echo)
 
     console.print(f"[blue]Upgrading to {revision}...[/blue]")
     if revision == "head":
@@ -55,18 +81,14 @@ def upgrade(
 @app.command()
 def downgrade(
     revision: str,
-    echo: bool = typer.Option(False, "--echo"),
+    echo: bool = _ECHO_OPTION,
 ):
     """Rollback migrations.
 
     Args:
         revision: Target revision or -N (e.g., -1, -2, or base)
     """
-    url = get_database_url()
-    # Ensure echo is boolean (typer may pass string from env vars)
-    echo_bool = bool(echo) if not isinstance(echo, bool) else echo
-    engine = create_async_engine(url, echo=echo_bool)
-    runner = MigrationRunner(engine, echo=echo_bool)
+    runner = _build_runner(echo)
 
     console.print(f"[yellow]Downgrading to {revision}...[/yellow]")
     asyncio.run(runner.downgrade(target=revision))
@@ -74,14 +96,10 @@ def downgrade(
 
 
 @app.command()
-def current(echo: bool = typer.Option(False, "--echo")):
+def current(echo: bool = _ECHO_OPTION):
     """Show current schema version."""
 
-    url = get_database_url()
-    # Ensure echo is boolean (typer may pass string from env vars)
-    echo_bool = bool(echo) if not isinstance(echo, bool) else echo
-    engine = create_async_engine(url, echo=echo_bool)
-    runner = MigrationRunner(engine, echo=echo_bool)
+    runner = _build_runner(echo)
 
     current_version = asyncio.run(runner.get_current_version())
 
@@ -92,14 +110,10 @@ def current(echo: bool = typer.Option(False, "--echo")):
 
 
 @app.command()
-def pending(echo: bool = typer.Option(False, "--echo")):
+def pending(echo: bool = _ECHO_OPTION):
     """Show pending migrations."""
 
-    url = get_database_url()
-    # Ensure echo is boolean (typer may pass string from env vars)
-    echo_bool = bool(echo) if not isinstance(echo, bool) else echo
-    engine = create_async_engine(url, echo=echo_bool)
-    runner = MigrationRunner(engine, echo=echo_bool)
+    runner = _build_runner(echo)
 
     pending_migrations = asyncio.run(runner.get_pending_migrations())
 
@@ -118,8 +132,11 @@ def pending(echo: bool = typer.Option(False, "--echo")):
 
 
 @app.command()
-def history(echo: bool = typer.Option(False, "--echo")):
+def history(echo: bool = _ECHO_OPTION):
     """Show migration history."""
+    from alembic.config import Config
+
+    from alembic import command
 
     migrations_dir = Path(__file__).parent
     config = Config()
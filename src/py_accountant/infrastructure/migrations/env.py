@@ -1,26 +1,26 @@
 """Alembic environment для встроенных миграций py_accountant.
 
-Адаптировано из alembic/env.py проекта.
+Общие с alembic/env.py проекта части вынесены в ``_env_base``; здесь остаётся
+политика выбора URL (config URL приоритетнее DATABASE_URL) и запуск.
 Сохраняет критическую валидацию sync/async драйверов.
 """
 # ruff: noqa: I001
 from __future__ import annotations
 
-import logging
 import os
-from logging.config import fileConfig
+from functools import lru_cache
 
 from alembic import context
-from sqlalchemy import engine_from_config, pool
 from sqlalchemy.engine import make_url
 
-from py_accountant.infrastructure.persistence.sqlalchemy.models import Base
+from py_accountant.infrastructure.migrations import _env_base
 
 # Module-level config - lazy initialization to support testing
 config = None
-log = logging.getLogger("alembic.env")
+log = _env_base.log
 
-target_metadata = Base.metadata
+# ORM metadata is loaded on the first run_migrations_*() call, not at import
+target_metadata = None
 
 
 def _get_config():
@@ -28,12 +28,21 @@ def _get_config():
     global config
     if config is None:
         config = context.config
-        # Logging configuration
-        if config.config_file_name is not None:
-            fileConfig(config.config_file_name)
+        # Logging configuration (applied once per ini file version)
+        _env_base.configure_logging(config.config_file_name)
     return config
 
 
+def _get_target_metadata():
+    """Get ORM metadata for autogenerate/compare, importing models if needed."""
+    global target_metadata
+    if target_metadata is None:
+        from py_accountant.infrastructure.persistence.sqlalchemy.models import Base
+
+        target_metadata = Base.metadata
+    return target_metadata
+
+
 def get_sync_url() -> str:
     """Return a validated synchronous SQLAlchemy URL for Alembic.
 
@@ -43,41 +52,31 @@ def get_sync_url() -> str:
 
     The URL is validated to ensure it's a synchronous driver.
     """
-    async_url_present = os.getenv("DATABASE_URL_ASYNC")
-    if async_url_present:
-        log.warning(
-            "DATABASE_URL_ASYNC is set but ignored by Alembic; migrations must use a sync URL via DATABASE_URL or sqlalchemy.url."
-        )
+    # Read once per call (not cached): env changes between runs/tests must be honored
+    environ = os.environ
+    _env_base.warn_if_async_url_set(environ)
 
     # First check config URL (programmatically set, e.g., by MigrationRunner)
     cfg_url = (_get_config().get_main_option("sqlalchemy.url") or "").strip()
 
     # Fallback to environment variable
-    env_url = (os.getenv("DATABASE_URL") or "").strip()
+    env_url = (environ.get("DATABASE_URL") or "").strip()
+
+    return _validated_sync_url(cfg_url, env_url)
+
 
+@lru_cache(maxsize=4)
+def _validated_sync_url(cfg_url: str, env_url: str) -> str:
+    """Validate and render the sync URL; pure in its inputs, so parsed results are memoized."""
     # Prefer programmatic config URL for actual engine usage when present
     raw_url = cfg_url or env_url
 
     # Only validate env URL if we're using it (config URL is already converted by MigrationRunner)
     if not cfg_url and env_url:
-        # If env specifies an async driver, reject it
-        try:
-            env_sa_url = make_url(env_url)
-            env_driver = (env_sa_url.drivername or "").lower()
-            if any(tok in env_driver for tok in ["asyncpg", "aiosqlite", "+async"]):
-                raise RuntimeError(
-                    "Async driver not supported for Alembic; use a synchronous URL (e.g., postgresql+psycopg or sqlite+pysqlite)."
-                )
-        except RuntimeError:
-            # Re-raise RuntimeError for async driver detection
-            raise
-        except Exception as exc:
-            # If parsing failed, re-raise as ValueError to mimic SA behavior
-            raise ValueError(f"Invalid DATABASE_URL: {env_url}") from exc
+        # Env URL already parsed: render it directly instead of parsing again
+        return _env_base.parse_env_url(env_url).render_as_string(hide_password=False)
     if not raw_url:
-        raise ValueError(
-            "No synchronous database URL found (sqlalchemy.url or DATABASE_URL). Provide a sync URL e.g. postgresql+psycopg or sqlite+pysqlite."
-        )
+        raise ValueError(_env_base.NO_URL_MESSAGE)
 
     # Return the URL (config URL is already converted to sync by MigrationRunner)
     sa_url = make_url(str(raw_url))
@@ -93,61 +92,21 @@ render_as_batch = False
 
 
 def run_migrations_offline() -> None:
-    """Run migrations in 'offline' mode using a validated sync URL.
-
-    This configures the Alembic context with a literal URL and does not create
-    an Engine. It's suitable for generating SQL scripts without connecting to
-    the database. The URL is validated by get_sync_url() to prevent accidental
-    use of async drivers.
-    """
-    url = _get_config().get_main_option("sqlalchemy.url")
-    context.configure(
-        url=url,
-        target_metadata=target_metadata,
-        literal_binds=True,
-        compare_type=True,
-        render_as_batch=render_as_batch,
-    )
-    with context.begin_transaction():
-        context.run_migrations()
+    """Run migrations in 'offline' mode using a validated sync URL."""
+    _env_base.run_migrations_offline(_get_config(), _get_target_metadata(), render_as_batch=render_as_batch)
 
 
 def run_migrations_online() -> None:
-    """Run migrations in 'online' mode using a validated sync Engine.
+    """Run migrations in 'online' mode using a validated sync Engine."""
+    _env_base.run_migrations_online(_get_config(), _get_target_metadata(), render_as_batch=render_as_batch)
 
-    This creates a synchronous Engine from the configuration (which has been
-    populated with the validated sync URL) and connects to run migrations.
-    Any attempt to pass an async driver is rejected early by get_sync_url().
-    """
-    cfg = _get_config()
-    cfg_section = cfg.get_section(cfg.config_ini_section) or {}
-    connectable = engine_from_config(
-        cfg_section,
-        prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
-    )
-    with connectable.connect() as connection:
-        context.configure(
-            connection=connection,
-            target_metadata=target_metadata,
-            compare_type=True,
-            render_as_batch=render_as_batch,
-        )
-        with context.begin_transaction():
-            context.run_migrations()
-
-
-# Execute migrations when called by Alembic
-# Check if we're in an Alembic runtime context
-try:
-    # This will succeed if Alembic has set up the context
-    _get_config()
+
+# Execute migrations when called by Alembic.
+# The context proxy only exposes ``config`` inside an Alembic run; a plain import
+# (e.g. in tests) skips this block, while real migration errors propagate.
+if getattr(context, "config", None) is not None:
     _initialize()
     if context.is_offline_mode():
         run_migrations_offline()
     else:
         run_migrations_online()
-except:
-    # Not in Alembic context (e.g., when imported in tests)
-    pass
-
@@ -6,13 +6,13 @@ from __future__ import annotations
 class MigrationError(Exception):
     """Base exception for migration errors."""
 
-    pass
+    __slots__ = ()
 
 
 class VersionMismatchError(MigrationError):
     """Schema version does not match expected version."""
 
-    pass
+    __slots__ = ()
 
 
 __all__ = [
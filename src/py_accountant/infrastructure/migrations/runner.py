@@ -4,20 +4,30 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from alembic.config import Config
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncEngine
-
-from alembic import command
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
 
 if TYPE_CHECKING:
+    # alembic (and Mako behind it) is imported on first use, not with the package
+    from alembic.config import Config
     from alembic.script import ScriptDirectory
 
 logger = logging.getLogger(__name__)
 
+_VERSIONS_SQL = text("SELECT version_num FROM alembic_version")
+
+# Async runtime drivers -> sync drivers Alembic runs on
+_SYNC_DRIVERS = {
+    "sqlite+aiosqlite": "sqlite",
+    "postgresql+asyncpg": "postgresql+psycopg",
+}
+
 
 class MigrationRunner:
     """Programmatic API for py_accountant database migrations.
@@ -44,6 +54,11 @@ class MigrationRunner:
         self.engine = engine
         self.echo = echo
         self._config = self._load_alembic_config(alembic_config_path)
+        # Version scripts are parsed once per runner; applying migrations does not change them
+        self._script: ScriptDirectory | None = None
+        self._all_revisions: list[str] | None = None
+        # Alembic commands are strictly serial: one dedicated worker, created on first use
+        self._executor: ThreadPoolExecutor | None = None
 
     def _load_alembic_config(self, config_path: str | Path | None) -> Config:
         """Load Alembic configuration.
@@ -54,6 +69,8 @@ class MigrationRunner:
         Returns:
             Configured Alembic Config instance
         """
+        from alembic.config import Config
+
         if config_path is None:
             # Use the migrations directory as script location
             migrations_dir = Path(__file__).parent
@@ -65,12 +82,15 @@ class MigrationRunner:
             migrations_dir = Path(__file__).parent
             config.set_main_option("script_location", str(migrations_dir))
 
-        # Set SQLAlchemy URL from engine - convert async drivers to sync
-        url_str = self.engine.url.render_as_string(hide_password=False)
-        # Convert async drivers to sync equivalents for Alembic
-        url_str = url_str.replace("sqlite+aiosqlite", "sqlite")
-        url_str = url_str.replace("postgresql+asyncpg", "postgresql+psycopg")
-        config.set_main_option("sqlalchemy.url", url_str)
+        # Set SQLAlchemy URL from engine - swap the async driver on the URL object,
+        # so credentials or database names containing driver tokens are untouched
+        url = self.engine.url
+        sync_driver = _SYNC_DRIVERS.get(url.drivername)
+        if sync_driver is not None:
+            url = url.set(drivername=sync_driver)
+        # Config values go through ConfigParser interpolation: escape '%' from
+        # percent-encoded credentials
+        config.set_main_option("sqlalchemy.url", url.render_as_string(hide_password=False).replace("%", "%%"))
 
         # Set echo parameter properly (Alembic expects string "true"/"false")
         if self.echo:
@@ -80,7 +100,9 @@ class MigrationRunner:
 
     async def upgrade_to_head(self) -> None:
         """Apply all pending migrations to head."""
-        await self._run_in_sync(lambda: command.upgrade(self._config, "head"))
+        from alembic import command
+
+        await self._run_in_sync(command.upgrade, self._config, "head")
         logger.info("Successfully upgraded to head")
 
     async def upgrade_to_version(self, version: str) -> None:
@@ -89,7 +111,9 @@ class MigrationRunner:
         Args:
             version: Revision ID (e.g., "0005")
         """
-        await self._run_in_sync(lambda: command.upgrade(self._config, version))
+        from alembic import command
+
+        await self._run_in_sync(command.upgrade, self._config, version)
         logger.info(f"Successfully upgraded to version {version}")
 
     async def downgrade(self, *, steps: int = 1, target: str | None = None) -> None:
@@ -99,77 +123,138 @@ class MigrationRunner:
             steps: Number of steps to downgrade (if target is None)
             target: Target revision or "base" for full downgrade
         """
+        from alembic import command
+
         if target is None:
             target = f"-{steps}"
 
-        await self._run_in_sync(lambda: command.downgrade(self._config, target))
+        await self._run_in_sync(command.downgrade, self._config, target)
         logger.info(f"Successfully downgraded to {target}")
 
-    async def get_current_version(self) -> str | None:
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[AsyncConnection]:
+        """Hold one connection open for a batch of version checks.
+
+        Examples:
+            async with runner.connection() as conn:
+                await runner.validate_schema_version(expected, conn=conn)
+                pending = await runner.get_pending_migrations(conn=conn)
+        """
+        async with self.engine.connect() as conn:
+            yield conn
+
+    async def get_current_version(self, *, conn: AsyncConnection | None = None) -> str | None:
         """Get current schema version from database.
 
+        Args:
+            conn: Connection to reuse (see ``connection()``); a new one is opened if None
+
         Returns:
             Revision ID or None if database not initialized
         """
-        async with self.engine.connect() as conn:
-            try:
-                result = await conn.execute(
-                    text("SELECT version_num FROM alembic_version LIMIT 1")
-                )
-                row = result.first()
-                return row[0] if row else None
-            except Exception:
-                # Table doesn't exist yet
-                return None
-
-    async def get_pending_migrations(self) -> list[str]:
+        versions = await self._read_versions(conn)
+        return versions[0] if versions else None
+
+    async def get_pending_migrations(self, *, conn: AsyncConnection | None = None) -> list[str]:
         """Get list of pending migrations.
 
+        Args:
+            conn: Connection to reuse (see ``connection()``); a new one is opened if None
+
         Returns:
             List of revision IDs not yet applied
         """
-        from alembic.script import ScriptDirectory as SD
+        script = self._script_directory()
+        applied = await self._applied_revisions(conn)
 
-        script: ScriptDirectory = SD.from_config(self._config)
-        current = await self.get_current_version()
-
-        if current is None:
+        if not applied:
             # Database not initialized, all migrations are pending
-            return [rev.revision for rev in script.walk_revisions()]
-
-        # Get pending between current and head (iterate from head down to current)
-        pending = []
-        for rev in script.iterate_revisions("head", current):
-            if rev.revision != current:
-                pending.append(rev.revision)
+            if self._all_revisions is None:
+                self._all_revisions = [rev.revision for rev in script.walk_revisions()]
+            return list(self._all_revisions)
+
+        if applied.issuperset(script.get_heads()):
+            # Steady state (already at head): nothing to walk
+            return []
+
+        # Get pending between applied revision(s) and head (iterate from head down);
+        # all stamped heads come from the single SELECT above
+        pending = [
+            rev.revision
+            for rev in script.iterate_revisions("head", tuple(applied))
+            if rev.revision not in applied
+        ]
 
         return pending
 
-    async def validate_schema_version(self, expected: str) -> None:
+    async def validate_schema_version(self, expected: str, *, conn: AsyncConnection | None = None) -> None:
         """Validate schema version matches expected.
 
         Args:
             expected: Expected schema version
+            conn: Connection to reuse (see ``connection()``); a new one is opened if None
 
         Raises:
             VersionMismatchError: If versions don't match
         """
         from .errors import VersionMismatchError
 
-        current = await self.get_current_version()
+        current = await self.get_current_version(conn=conn)
         if current != expected:
             raise VersionMismatchError(
                 f"Schema version mismatch: current={current}, expected={expected}"
             )
 
-    async def _run_in_sync(self, func):
-        """Run synchronous Alembic command via asyncio.
+    async def _applied_revisions(self, conn: AsyncConnection | None = None) -> set[str]:
+        """Return every revision stamped in alembic_version (one row per head).
+
+        Returns:
+            Set of revision IDs, empty if the database is not initialized
+        """
+        return set(await self._read_versions(conn))
+
+    async def _read_versions(self, conn: AsyncConnection | None) -> list[str]:
+        """Read alembic_version rows; empty if the table does not exist yet."""
+        if conn is None:
+            async with self.engine.connect() as own:
+                try:
+                    result = await own.execute(_VERSIONS_SQL)
+                except Exception:
+                    # Table doesn't exist yet
+                    return []
+                return list(result.scalars())
+        # A failed SELECT would abort the shared connection's transaction on
+        # PostgreSQL, so check for the table first
+        if not await conn.run_sync(lambda sync_conn: inspect(sync_conn).has_table("alembic_version")):
+            return []
+        return list((await conn.execute(_VERSIONS_SQL)).scalars())
+
+    def _script_directory(self) -> ScriptDirectory:
+        """Return the ScriptDirectory for this runner, loading version files on first use."""
+        if self._script is None:
+            from alembic.script import ScriptDirectory as SD
+
+            self._script = SD.from_config(self._config)
+        return self._script
+
+    async def _run_in_sync(self, func, *args):
+        """Run synchronous Alembic command on the runner's dedicated worker thread.
 
         Args:
             func: Synchronous function to execute
+            *args: Positional arguments passed to ``func``
         """
-        loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, func)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="alembic")
+        # asyncio.to_thread would use the loop's shared default pool; the loop is
+        # looked up per call because a runner may be driven from several loops
+        await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def aclose(self) -> None:
+        """Release the worker thread used for Alembic commands (the engine is not disposed)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
 
 
 __all__ = ["MigrationRunner"]
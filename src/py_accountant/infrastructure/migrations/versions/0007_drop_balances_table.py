@@ -21,10 +21,10 @@ depends_on: str | Sequence[str] | None = None
 
 
 def upgrade() -> None:
-    # Drop balances table if it exists (SQLite/Postgres safe)
+    # Drop balances table if it exists (SQLite/Postgres safe); has_table() looks up
+    # this one name instead of reflecting the whole table catalog
     bind = op.get_bind()
-    insp = sa.inspect(bind)
-    if 'balances' in insp.get_table_names():
+    if sa.inspect(bind).has_table('balances'):
         op.drop_table('balances')
 
 
@@ -18,6 +18,8 @@ from py_accountant.infrastructure.persistence.inmemory.repositories import (
 
 
 class SystemClock(Clock):  # type: ignore[misc]
+    __slots__ = ()
+
     def now(self) -> datetime:  # noqa: D401
         return datetime.now(UTC)
 
@@ -25,6 +27,8 @@ class SystemClock(Clock):  # type: ignore[misc]
 
 
 class FixedClock(Clock):  # type: ignore[misc]
+    __slots__ = ("_fixed",)
+
     def __init__(self, fixed: datetime) -> None:
         self._fixed = fixed
 
@@ -69,6 +69,8 @@ class InMemoryCurrencyRepository(CurrencyRepository):  # type: ignore[misc]
 class InMemoryAccountRepository(AccountRepository):  # type: ignore[misc]
     def __init__(self) -> None:
         self._by_full_name: dict[str, AccountDTO] = {}
+        # parent_id -> children in creation order; list(parent_id) is a bucket read, not a scan
+        self._by_parent: dict[str | None, list[AccountDTO]] = {}
 
     def get_by_full_name(self, full_name: str) -> AccountDTO | None:  # noqa: D401
         return self._by_full_name.get(full_name)
@@ -77,12 +79,13 @@ class InMemoryAccountRepository(AccountRepository):  # type: ignore[misc]
         if dto.full_name in self._by_full_name:
             raise ValueError(f"Account already exists: {dto.full_name}")
         self._by_full_name[dto.full_name] = dto
+        self._by_parent.setdefault(dto.parent_id, []).append(dto)
         return dto
 
     def list(self, parent_id: str | None = None) -> list[AccountDTO]:  # noqa: D401
         if parent_id is None:
             return list(self._by_full_name.values())
-        return [a for a in self._by_full_name.values() if a.parent_id == parent_id]
+        return list(self._by_parent.get(parent_id, ()))
 
 
 class InMemoryTransactionRepository(TransactionRepository):  # type: ignore[misc]
@@ -102,6 +105,20 @@ class InMemoryTransactionRepository(TransactionRepository):  # type: ignore[misc
             return all(tx.meta.get(k) == v for k, v in meta.items())
         return [t for t in self._transactions.values() if start <= t.occurred_at <= end and meta_match(t)]
 
+    def aggregate_raw(self, start: datetime, end: datetime, meta: dict[str, Any] | None = None) -> list[tuple[str, str, Decimal]]:  # noqa: D401
+        # Stream matching transactions straight into the totals; no intermediate list
+        txs = (
+            t
+            for t in self._transactions.values()
+            if start <= t.occurred_at <= end and (not meta or all(t.meta.get(k) == v for k, v in meta.items()))
+        )
+        totals: dict[tuple[str, str], Decimal] = {}
+        for tx in txs:
+            for line in tx.lines:
+                key = (line.currency_code.upper(), line.side.upper())
+                totals[key] = totals.get(key, Decimal("0")) + line.amount
+        return [(code, side, amount) for (code, side), amount in totals.items()]
+
     def ledger(
         self,
         account_full_name: str,
@@ -23,14 +23,18 @@ Supported URL examples:
 
 Notes:
 - Alembic stays on sync URLs; do not use these helpers from migration code.
+- File-based SQLite connections are switched to WAL with ``synchronous=NORMAL``
+  and in-memory temp storage (one fsync per checkpoint instead of per commit).
 - UoW/Repositories remain synchronous in ASYNC-01; this module is a building block
   for future iterations.
 """
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
-from sqlalchemy.engine import make_url
+from sqlalchemy import event
+from sqlalchemy.engine import URL, make_url
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -47,6 +51,16 @@ __all__ = [
 ]
 
 
+# Backend name (dialect without driver) -> the async driver used at runtime
+_ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+# Pure function of the URL string; engines/UoWs are built from a handful of URLs,
+# so repeat calls skip make_url parsing and rendering (errors are not cached)
+@lru_cache(maxsize=32)
 def normalize_async_url(url: str) -> str:
     """Normalize the given SQLAlchemy URL to an async-driver URL.
 
@@ -72,20 +86,37 @@ def normalize_async_url(url: str) -> str:
         raise ValueError("Database URL must be a non-empty string")
 
     sa_url = make_url(url)
-    drivername = sa_url.drivername or ""
+    # PostgreSQL family -> asyncpg, SQLite family -> aiosqlite; unknown backends as-is
+    target = _ASYNC_DRIVERS.get(sa_url.get_backend_name())
+    if target is not None and sa_url.drivername != target:
+        sa_url = sa_url.set(drivername=target)
+    return sa_url.render_as_string(hide_password=False)
+
 
-    # PostgreSQL family -> enforce asyncpg
-    if drivername.startswith("postgresql") and drivername != "postgresql+asyncpg":
-        sa_url = sa_url.set(drivername="postgresql+asyncpg")
-        return sa_url.render_as_string(hide_password=False)
+# Applied on every new file-based SQLite connection; journal_mode=WAL is persistent
+# in the database file, the rest are per-connection
+_SQLITE_FILE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+)
 
-    # SQLite family -> enforce aiosqlite
-    if drivername.startswith("sqlite") and drivername != "sqlite+aiosqlite":
-        sa_url = sa_url.set(drivername="sqlite+aiosqlite")
-        return sa_url.render_as_string(hide_password=False)
 
-    # Unknown or already-async; return as-is
-    return sa_url.render_as_string(hide_password=False)
+def _is_sqlite_file(sa_url: URL) -> bool:
+    """Return True for SQLite URLs backed by a file (not ``:memory:``)."""
+    if sa_url.get_backend_name() != "sqlite":
+        return False
+    database = sa_url.database or ""
+    return database not in ("", ":memory:") and sa_url.query.get("mode") != "memory"
+
+
+def _set_sqlite_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_FILE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
 
 
 def _engine_kwargs_for_dialect(norm_url: str, *, echo: bool, user_kwargs: dict[str, Any] | None) -> dict[str, Any]:
@@ -95,24 +126,23 @@ def _engine_kwargs_for_dialect(norm_url: str, *, echo: bool, user_kwargs: dict[s
     - For sqlite+aiosqlite: keep minimal; ignore pool options safely
     - For others: return minimal with pre_ping
     """
-    settings = get_settings()
-    sa_url = make_url(norm_url)
-    drivername = sa_url.drivername
+    db = get_settings().db_runtime
+    backend = make_url(norm_url).get_backend_name()
     extra = dict(user_kwargs or {})
     base: dict[str, Any] = {"echo": echo, "pool_pre_ping": True}
 
-    if drivername.startswith("postgresql"):
+    if backend == "postgresql":
         # Pool and timeouts
         base.update(
             {
-                "pool_size": max(1, int(settings.db_pool_size)),
-                "max_overflow": max(0, int(settings.db_max_overflow)),
-                "pool_timeout": max(1, int(settings.db_pool_timeout)),
-                "pool_recycle": max(0, int(settings.db_pool_recycle_sec)),
+                "pool_size": max(1, int(db.pool_size)),
+                "max_overflow": max(0, int(db.max_overflow)),
+                "pool_timeout": max(1, int(db.pool_timeout)),
+                "pool_recycle": max(0, int(db.pool_recycle_sec)),
             }
         )
         # asyncpg connect timeout
-        connect_timeout = max(1, int(settings.db_connect_timeout_sec))
+        connect_timeout = max(1, int(db.connect_timeout_sec))
         connect_args = dict(extra.pop("connect_args", {}))
         # asyncpg uses 'timeout' param for connect()
         connect_args.setdefault("timeout", connect_timeout)
@@ -121,7 +151,7 @@ def _engine_kwargs_for_dialect(norm_url: str, *, echo: bool, user_kwargs: dict[s
         base.update(extra)
         return base
 
-    if drivername.startswith("sqlite"):
+    if backend == "sqlite":
         # Keep minimal; sqlite pools behave differently, and options are often ignored
         base.update(extra)
         return base
@@ -158,6 +188,8 @@ def get_async_engine(url: str, *, echo: bool = False, engine_kwargs: dict[str, A
         norm_url,
         **kwargs,
     )
+    if _is_sqlite_file(engine.url):
+        event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
     return engine
 
 
@@ -73,8 +73,9 @@ class TransactionLineORM(Base):
 
     __table_args__ = (
         Index("ix_tx_lines_account_full_name", "account_full_name"),
-        Index("ix_tx_lines_currency_code", "currency_code"),
         Index("ix_tx_lines_account_journal", "account_full_name", "journal_id"),
+        # Covering index for aggregation: join by journal_id, read currency/side/amount
+        Index("ix_tx_lines_journal_covering", "journal_id", "currency_code", "side", "amount"),
     )
 
 
@@ -112,7 +113,8 @@ class ExchangeRateEventArchiveORM(Base):
 class AccountBalanceORM(Base):
     __tablename__ = "account_balances"
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    account_full_name: Mapped[str] = mapped_column(String(1024), nullable=False, unique=True, index=True)
+    # UNIQUE already provides the lookup index; a separate one only adds write cost
+    account_full_name: Mapped[str] = mapped_column(String(1024), nullable=False, unique=True)
     currency_code: Mapped[str] = mapped_column(String(10), nullable=False)
     balance: Mapped[Decimal] = mapped_column(Numeric(20, 6), nullable=False, default=Decimal("0"), server_default="0")
     last_journal_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
@@ -3,7 +3,9 @@
 This module provides async counterparts of repositories operating strictly at
 CRUD level (create/read/update/delete) with simple filters/sorting/pagination.
 Aggregation, conversion, and other domain computations are intentionally
-excluded from repositories (moved to domain/use cases per I13).
+excluded from repositories (moved to domain/use cases per I13). The one
+exception is ``aggregate_raw``: a plain per-currency/side ``SUM`` projection
+feeding the trading balance aggregators, with no conversion or rounding.
 
 Notes:
 - Public method signatures align with async Protocols in application.ports.
@@ -14,11 +16,14 @@ Notes:
 
 from __future__ import annotations
 
-from datetime import datetime
+from collections.abc import Iterable
+from datetime import UTC, datetime
 from decimal import Decimal
 from typing import Any, cast
 
-from sqlalchemy import select, update
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -41,6 +46,22 @@ from py_accountant.infrastructure.persistence.sqlalchemy.models import (
     TransactionLineORM,
 )
 
+# Decimal is immutable; shared zero for aggregate seeds
+_ZERO = Decimal("0")
+# DTO sides normally arrive upper-case already; normalize only on a miss
+_SIDES = frozenset(("DEBIT", "CREDIT"))
+# Rows per fetch when streaming unbounded result sets (ledger lines, meta-filtered sums)
+_STREAM_BATCH = 1000
+# Dialects with INSERT ... ON CONFLICT DO UPDATE: aggregates are upserted in one
+# statement per table; anything else goes through per-row UPDATE/INSERT
+_UPSERT_INSERTS: dict[str, Any] = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
+
+def _utc_day(dt: datetime) -> datetime:
+    """Return midnight (UTC) of the UTC day containing ``dt``; naive values are taken as UTC."""
+    d = dt.date() if dt.tzinfo is None else dt.astimezone(UTC).date()
+    return datetime(d.year, d.month, d.day, tzinfo=UTC)
+
 
 class AsyncSqlAlchemyCurrencyRepository:
     """Async repository for currency CRUD and base helpers.
@@ -50,11 +71,21 @@ class AsyncSqlAlchemyCurrencyRepository:
     - delete(code): convenience method (not in port) kept for tests/utilities.
 
     Domain rules (like conversion) are not implemented here.
+
+    ``list_all`` is memoized for the lifetime of the repository (one UoW
+    transaction): report use cases read the catalog on every call while it
+    rarely changes. Every mutating method here drops the snapshot, and the UoW
+    drops it on commit/rollback via ``invalidate_cache``.
     """
 
     def __init__(self, session: AsyncSession) -> None:
         """Bind repository to an AsyncSession within a UoW transaction."""
         self.session = session
+        self._list_cache: list[tuple[str, Decimal | None, bool]] | None = None
+
+    def invalidate_cache(self) -> None:
+        """Drop the memoized ``list_all`` snapshot."""
+        self._list_cache = None
 
     async def get_by_code(self, code: str) -> CurrencyDTO | None:
         """Return currency by code or ``None`` if not found."""
@@ -71,6 +102,7 @@ class AsyncSqlAlchemyCurrencyRepository:
         If ``dto.is_base`` is true, all other currencies have ``is_base`` cleared
         and the base currency's ``exchange_rate`` is set to ``None``.
         """
+        self._list_cache = None
         res = await self.session.execute(select(CurrencyORM).where(CurrencyORM.code == dto.code))
         cur = res.scalar_one_or_none()
         if not cur:
@@ -88,14 +120,16 @@ class AsyncSqlAlchemyCurrencyRepository:
         return CurrencyDTO(code=cur.code, exchange_rate=ex, is_base=bool(cur.is_base))
 
     async def list_all(self) -> list[CurrencyDTO]:
-        """Return all currencies as ``CurrencyDTO`` list (unordered)."""
-        res = await self.session.execute(select(CurrencyORM))
-        rows = res.scalars().all()
-        result: list[CurrencyDTO] = []
-        for r in rows:
-            ex = r.exchange_rate if r.exchange_rate is not None else None
-            result.append(CurrencyDTO(code=r.code, exchange_rate=ex, is_base=bool(r.is_base)))
-        return result
+        """Return all currencies as ``CurrencyDTO`` list (unordered).
+
+        Rows are fetched once per repository and memoized until a write or
+        ``invalidate_cache``; fresh DTOs are built per call so callers may
+        mutate them freely.
+        """
+        if self._list_cache is None:
+            res = await self.session.execute(select(CurrencyORM))
+            self._list_cache = [(r.code, r.exchange_rate, bool(r.is_base)) for r in res.scalars().all()]
+        return [CurrencyDTO(code=code, exchange_rate=ex, is_base=is_base) for code, ex, is_base in self._list_cache]
 
     async def get_base(self) -> CurrencyDTO | None:
         """Return the base currency or ``None`` if not set."""
@@ -108,6 +142,7 @@ class AsyncSqlAlchemyCurrencyRepository:
 
     async def set_base(self, code: str) -> None:
         """Set specified currency as base and clear others; requires that currency exists."""
+        self._list_cache = None
         res = await self.session.execute(select(CurrencyORM).where(CurrencyORM.code == code))
         cur = res.scalar_one_or_none()
         if not cur:
@@ -119,6 +154,7 @@ class AsyncSqlAlchemyCurrencyRepository:
 
     async def clear_base(self) -> None:
         """Clear base flag from all currencies."""
+        self._list_cache = None
         await self.session.execute(update(CurrencyORM).values(is_base=False))
         await self.session.flush()
 
@@ -127,6 +163,7 @@ class AsyncSqlAlchemyCurrencyRepository:
 
         Existing base currency rates are not overridden.
         """
+        self._list_cache = None
         for code, rate in updates:
             res = await self.session.execute(select(CurrencyORM).where(CurrencyORM.code == code))
             row = res.scalar_one_or_none()
@@ -143,6 +180,7 @@ class AsyncSqlAlchemyCurrencyRepository:
 
         Note: This convenience method is not part of the public port; used in tests.
         """
+        self._list_cache = None
         res = await self.session.execute(select(CurrencyORM).where(CurrencyORM.code == code))
         row = res.scalar_one_or_none()
         if not row:
@@ -152,6 +190,27 @@ class AsyncSqlAlchemyCurrencyRepository:
         return True
 
 
+# Columns needed to build an AccountDTO; lookups by the unique full_name index skip ORM hydration
+_ACCOUNT_COLUMNS = (
+    AccountORM.id,
+    AccountORM.name,
+    AccountORM.full_name,
+    AccountORM.currency_code,
+    AccountORM.parent_id,
+)
+
+
+def _account_dto(acc_id: int, name: str, full_name: str, currency_code: str, parent_id: int | None) -> AccountDTO:
+    """Build an ``AccountDTO`` from a row of ``_ACCOUNT_COLUMNS``."""
+    return AccountDTO(
+        id=str(acc_id),
+        name=name,
+        full_name=full_name,
+        currency_code=currency_code,
+        parent_id=str(parent_id) if parent_id else None,
+    )
+
+
 class AsyncSqlAlchemyAccountRepository:
     """Async repository for accounts (CRUD-level).
 
@@ -164,17 +223,9 @@ class AsyncSqlAlchemyAccountRepository:
 
     async def get_by_full_name(self, full_name: str) -> AccountDTO | None:
         """Return account by its ``full_name`` or ``None`` if absent."""
-        res = await self.session.execute(select(AccountORM).where(AccountORM.full_name == full_name))
-        acc = res.scalar_one_or_none()
-        if not acc:
-            return None
-        return AccountDTO(
-            id=str(acc.id),
-            name=acc.name,
-            full_name=acc.full_name,
-            currency_code=acc.currency_code,
-            parent_id=str(acc.parent_id) if acc.parent_id else None,
-        )
+        res = await self.session.execute(select(*_ACCOUNT_COLUMNS).where(AccountORM.full_name == full_name))
+        row = res.one_or_none()
+        return _account_dto(*row) if row else None
 
     async def create(self, dto: AccountDTO) -> AccountDTO:
         """Create a new account; raise ``ValueError`` on duplicate ``full_name``."""
@@ -219,6 +270,18 @@ class AsyncSqlAlchemyAccountRepository:
             for r in rows
         ]
 
+    async def list_by_full_names(self, full_names: list[str]) -> list[AccountDTO]:
+        """Return accounts whose ``full_name`` is in ``full_names`` with one ``IN`` query.
+
+        Names without an account are absent from the result; order is unspecified.
+        """
+        if not full_names:
+            return []
+        res = await self.session.execute(
+            select(*_ACCOUNT_COLUMNS).where(AccountORM.full_name.in_(set(full_names)))
+        )
+        return [_account_dto(*row) for row in res]
+
     async def delete(self, full_name: str) -> bool:
         """Delete account by ``full_name``; returns True if a row was removed.
 
@@ -235,19 +298,19 @@ class AsyncSqlAlchemyAccountRepository:
     async def get_balance(self, full_name: str) -> Decimal | None:
         """Fast-path: read aggregated balance from account_balances or return 0 if not present."""
         res = await self.session.execute(
-            select(AccountBalanceORM).where(AccountBalanceORM.account_full_name == full_name)
+            select(AccountBalanceORM.balance).where(AccountBalanceORM.account_full_name == full_name)
         )
-        row = res.scalar_one_or_none()
-        if not row:
+        balance = res.scalar_one_or_none()
+        if balance is None:
             return Decimal("0")
-        current = Decimal(cast(Any, row.balance))
-        return current
+        return Decimal(balance)
 
 
 class AsyncSqlAlchemyTransactionRepository:
     """Async repository for financial transactions (CRUD + simple queries).
 
-    Domain aggregations (balances, trading/net, currency conversion) are excluded.
+    Domain aggregations (balances, trading/net, currency conversion) are excluded;
+    ``aggregate_raw`` only returns grouped sums for the domain aggregators.
     """
 
     def __init__(self, session: AsyncSession) -> None:
@@ -327,20 +390,27 @@ class AsyncSqlAlchemyTransactionRepository:
             if not key:
                 raise
             return await self.get_by_idempotency_key(key)  # type: ignore[arg-type]
-        for line in dto.lines:
-            orm_line = TransactionLineORM(
-                journal_id=journal.id,
-                account_full_name=line.account_full_name,
-                side=line.side.upper(),
-                amount=line.amount,
-                currency_code=line.currency_code,
-                exchange_rate=line.exchange_rate,
+        journal_id = journal.id
+        if dto.lines:
+            # Bulk INSERT from plain parameter dicts: no per-line ORM instances or
+            # unit-of-work bookkeeping; batched into multi-row VALUES by the dialect
+            await self.session.execute(
+                insert(TransactionLineORM),
+                [
+                    {
+                        "journal_id": journal_id,
+                        "account_full_name": line.account_full_name,
+                        "side": line.side.upper(),
+                        "amount": line.amount,
+                        "currency_code": line.currency_code,
+                        "exchange_rate": line.exchange_rate,
+                    }
+                    for line in dto.lines
+                ],
             )
-            self.session.add(orm_line)
-        await self.session.flush()
 
         # --- I31: update aggregate tables within the same transaction ---
-        await self._apply_account_aggregates(journal_id=journal.id, occurred_at=dto.occurred_at, lines=dto.lines)
+        await self._apply_account_aggregates(journal_id=journal_id, occurred_at=dto.occurred_at, lines=dto.lines)
 
         return dto
 
@@ -351,41 +421,107 @@ class AsyncSqlAlchemyTransactionRepository:
 
         ``meta`` filter: if provided, return only rows where all keys match exactly.
         """
-        stmt = (
-            select(JournalORM)
-            .where(JournalORM.occurred_at.between(start, end))
+        # Plain column rows: journals/lines are only read into DTOs, never modified,
+        # so ORM instances and identity-map bookkeeping are skipped
+        window = JournalORM.occurred_at.between(start, end)
+        j_res = await self.session.execute(
+            select(JournalORM.id, JournalORM.occurred_at, JournalORM.memo, JournalORM.meta)
+            .where(window)
             .order_by(JournalORM.occurred_at.asc())
         )
-        res = await self.session.execute(stmt)
-        journals = res.scalars().all()
-        results: list[TransactionDTO] = []
-        for j in journals:
-            if meta and any(j.meta.get(k) != v for k, v in meta.items()):  # type: ignore[union-attr]
-                continue
-            lines_stmt = select(TransactionLineORM).where(TransactionLineORM.journal_id == j.id)
-            r2 = await self.session.execute(lines_stmt)
-            line_rows = r2.scalars().all()
-            lines = [
-                EntryLineDTO(
-                    side=r.side,
-                    account_full_name=r.account_full_name,
-                    amount=r.amount,
-                    currency_code=r.currency_code,
-                    exchange_rate=r.exchange_rate,
-                )
-                    for r in line_rows
-            ]
-            results.append(
-                TransactionDTO(
-                    id=f"journal:{j.id}",
-                    occurred_at=j.occurred_at,
-                    lines=lines,
-                    memo=j.memo,
-                    meta=j.meta or {},
-                )
+        journals = [
+            j for j in j_res if not meta or not any((j.meta or {}).get(k) != v for k, v in meta.items())
+        ]
+        if not journals:
+            return []
+        # All lines of the window in one query instead of one query per journal
+        lines_by_journal: dict[int, list[EntryLineDTO]] = {j.id: [] for j in journals}
+        l_res = await self.session.execute(
+            select(
+                TransactionLineORM.journal_id,
+                TransactionLineORM.side,
+                TransactionLineORM.account_full_name,
+                TransactionLineORM.amount,
+                TransactionLineORM.currency_code,
+                TransactionLineORM.exchange_rate,
+            )
+            .join(JournalORM, JournalORM.id == TransactionLineORM.journal_id)
+            .where(window)
+            .order_by(TransactionLineORM.id)
+        )
+        self._bucket_lines(lines_by_journal, l_res)
+        return [
+            TransactionDTO(
+                id=f"journal:{j.id}",
+                occurred_at=j.occurred_at,
+                lines=lines_by_journal[j.id],
+                memo=j.memo,
+                meta=j.meta or {},
             )
-        return results
+            for j in journals
+        ]
 
+    async def aggregate_raw(
+        self,
+        start: datetime,
+        end: datetime,
+        meta: dict[str, Any] | None = None,
+        *,
+        account_full_name: str | None = None,
+    ) -> list[tuple[str, str, Decimal]]:
+        """Return ``(currency_code, side, SUM(amount))`` rows for journals in the window.
+
+        Read-side projection for trading balance and historical account
+        balances: a single ``GROUP BY`` query instead of materialising every
+        journal with its lines. No conversion or rounding is applied. ``meta``
+        uses the same exact-match semantics as :meth:`list_between`;
+        ``account_full_name`` restricts the sums to that account's lines.
+        """
+        window = JournalORM.occurred_at.between(start, end)
+        if not meta:
+            stmt = (
+                select(
+                    TransactionLineORM.currency_code,
+                    TransactionLineORM.side,
+                    func.sum(TransactionLineORM.amount),
+                )
+                .join(JournalORM, JournalORM.id == TransactionLineORM.journal_id)
+                .where(window)
+                .group_by(TransactionLineORM.currency_code, TransactionLineORM.side)
+            )
+            if account_full_name is not None:
+                stmt = stmt.where(TransactionLineORM.account_full_name == account_full_name)
+            res = await self.session.execute(stmt)
+            # Iterate the result directly instead of materialising Row objects first
+            return [(code, side, amount) for code, side, amount in res]
+        # meta is a generic JSON column matched with Python equality, which has no
+        # portable SQL form. Sums are grouped per journal in SQL, each group carries
+        # its journal's meta, and matching groups are folded here from a stream;
+        # no journal id list is sent back as bind parameters.
+        per_journal = select(
+            TransactionLineORM.journal_id,
+            TransactionLineORM.currency_code,
+            TransactionLineORM.side,
+            func.sum(TransactionLineORM.amount).label("amount"),
+        ).join(JournalORM, JournalORM.id == TransactionLineORM.journal_id).where(window)
+        if account_full_name is not None:
+            per_journal = per_journal.where(TransactionLineORM.account_full_name == account_full_name)
+        sums = per_journal.group_by(
+            TransactionLineORM.journal_id, TransactionLineORM.currency_code, TransactionLineORM.side
+        ).subquery()
+        res = await self.session.stream(
+            select(JournalORM.meta, sums.c.currency_code, sums.c.side, sums.c.amount)
+            .join(sums, sums.c.journal_id == JournalORM.id)
+            .execution_options(yield_per=_STREAM_BATCH)
+        )
+        totals: dict[tuple[str, str], Decimal] = {}
+        async for batch in res.partitions():
+            for jmeta, code, side, amount in batch:
+                if any((jmeta or {}).get(k) != v for k, v in meta.items()):
+                    continue
+                key = (code, side)
+                totals[key] = totals.get(key, _ZERO) + amount
+        return [(code, side, amount) for (code, side), amount in totals.items()]
 
     async def ledger(
         self,
@@ -405,50 +541,81 @@ class AsyncSqlAlchemyTransactionRepository:
         - limit: None -> no limit; <= 0 -> empty list
         - meta: all provided key/value pairs must match
         """
-        j_stmt = select(JournalORM).where(JournalORM.occurred_at.between(start, end))
+        if offset < 0 or (limit is not None and limit <= 0):
+            return []
+        # Column rows only, as in list_between: journals touching the account, then
+        # their lines in one query instead of one ORM query per journal
+        window = JournalORM.occurred_at.between(start, end)
+        touching = JournalORM.id.in_(
+            select(TransactionLineORM.journal_id).where(TransactionLineORM.account_full_name == account_full_name)
+        )
+        j_stmt = select(JournalORM.id, JournalORM.occurred_at, JournalORM.memo, JournalORM.meta).where(window, touching)
         if order.upper() == "DESC":
             j_stmt = j_stmt.order_by(JournalORM.occurred_at.desc(), JournalORM.id.desc())
         else:
             j_stmt = j_stmt.order_by(JournalORM.occurred_at.asc(), JournalORM.id.asc())
-        res = await self.session.execute(j_stmt)
-        journals = res.scalars().all()
-        results: list[RichTransactionDTO] = []
-        for j in journals:
-            if meta and any((j.meta or {}).get(k) != v for k, v in meta.items()):
-                continue
-            lines_stmt = select(TransactionLineORM).where(TransactionLineORM.journal_id == j.id)
-            r2 = await self.session.execute(lines_stmt)
-            line_rows = r2.scalars().all()
-            include = any(r.account_full_name == account_full_name for r in line_rows)
-            if not include:
-                continue
-            lines = [
-                EntryLineDTO(
-                    side=r.side,
-                    account_full_name=r.account_full_name,
-                    amount=r.amount,
-                    currency_code=r.currency_code,
-                    exchange_rate=r.exchange_rate,
-                )
-                for r in line_rows
-            ]
-            results.append(
-                RichTransactionDTO(
-                    id=f"journal:{j.id}",
-                    occurred_at=j.occurred_at,
-                    memo=j.memo,
-                    lines=lines,
-                    meta=j.meta or {},
-                )
-            )
-        if offset < 0:
+        l_stmt = select(
+            TransactionLineORM.journal_id,
+            TransactionLineORM.side,
+            TransactionLineORM.account_full_name,
+            TransactionLineORM.amount,
+            TransactionLineORM.currency_code,
+            TransactionLineORM.exchange_rate,
+        ).order_by(TransactionLineORM.id)
+        if meta:
+            # The exact-match meta filter runs in Python, so paging follows it; lines
+            # come from the same window/account scope and are matched to the page
+            j_res = await self.session.execute(j_stmt)
+            journals = [j for j in j_res if not any((j.meta or {}).get(k) != v for k, v in meta.items())]
+            paged = journals[offset:] if limit is None else journals[offset : offset + limit]
+            l_stmt = l_stmt.join(JournalORM, JournalORM.id == TransactionLineORM.journal_id).where(window, touching)
+        else:
+            # No meta: the database pages, and the page's lines are selected through
+            # the same statement as a subquery (no id list in bind parameters)
+            if offset:
+                j_stmt = j_stmt.offset(offset)
+            if limit is not None:
+                j_stmt = j_stmt.limit(limit)
+            paged = list(await self.session.execute(j_stmt))
+            l_stmt = l_stmt.where(TransactionLineORM.journal_id.in_(j_stmt.with_only_columns(JournalORM.id)))
+        if not paged:
             return []
-        paged = results[offset:]
-        if limit is not None:
-            if limit <= 0:
-                return []
-            paged = paged[:limit]
-        return paged
+        lines_by_journal: dict[int, list[EntryLineDTO]] = {j.id: [] for j in paged}
+        if limit is not None and not meta:
+            # Bounded by ``limit``: fetch the page's lines at once
+            self._bucket_lines(lines_by_journal, await self.session.execute(l_stmt))
+        else:
+            # Unbounded pull: stream lines in batches so raw rows are never held in full
+            # alongside the DTOs (server-side cursor where the driver supports it)
+            l_stream = await self.session.stream(l_stmt.execution_options(yield_per=_STREAM_BATCH))
+            async for batch in l_stream.partitions():
+                self._bucket_lines(lines_by_journal, batch)
+        return [
+            RichTransactionDTO(
+                id=f"journal:{j.id}",
+                occurred_at=j.occurred_at,
+                memo=j.memo,
+                lines=lines_by_journal[j.id],
+                meta=j.meta or {},
+            )
+            for j in paged
+        ]
+
+    @staticmethod
+    def _bucket_lines(lines_by_journal: dict[int, list[EntryLineDTO]], rows: Iterable[Any]) -> None:
+        """Append line rows to their journal's bucket; rows of other journals are ignored."""
+        for journal_id, side, full_name, amount, currency_code, exchange_rate in rows:
+            bucket = lines_by_journal.get(journal_id)
+            if bucket is not None:
+                bucket.append(
+                    EntryLineDTO(
+                        side=side,
+                        account_full_name=full_name,
+                        amount=amount,
+                        currency_code=currency_code,
+                        exchange_rate=exchange_rate,
+                    )
+                )
 
     async def _apply_account_aggregates(self, *, journal_id: int, occurred_at: datetime, lines: list[EntryLineDTO]) -> None:
         """Compute per-account deltas and upsert into aggregate tables.
@@ -460,64 +627,137 @@ class AsyncSqlAlchemyTransactionRepository:
             return
         per_account: dict[tuple[str, str], Decimal] = {}
         per_turnover: dict[tuple[str, str], tuple[Decimal, Decimal]] = {}
-        day = occurred_at.replace(hour=0, minute=0, second=0, microsecond=0)
+        day = _utc_day(occurred_at)
+        balance_of = per_account.get
         for ln in lines:
             key = (ln.account_full_name, ln.currency_code.upper())
-            side = (ln.side or "").upper()
+            amount = ln.amount
+            side = ln.side if ln.side in _SIDES else (ln.side or "").upper()
             if side == "DEBIT":
-                delta = ln.amount
-                deb, cred = ln.amount, Decimal("0")
+                delta = amount
+                deb, cred = amount, _ZERO
             else:
-                delta = -ln.amount
-                deb, cred = Decimal("0"), ln.amount
-            per_account[key] = per_account.get(key, Decimal("0")) + delta
+                delta = -amount
+                deb, cred = _ZERO, amount
+            per_account[key] = balance_of(key, _ZERO) + delta
             if key in per_turnover:
                 d0, c0 = per_turnover[key]
                 per_turnover[key] = (d0 + deb, c0 + cred)
             else:
                 per_turnover[key] = (deb, cred)
 
-        # Upsert balances via SELECT + INSERT/UPDATE
+        insert_fn = _UPSERT_INSERTS.get(self.session.get_bind().dialect.name)
+        if insert_fn is not None:
+            await self._upsert_aggregates(insert_fn, journal_id=journal_id, day=day, per_account=per_account, per_turnover=per_turnover)
+            return
+
+        # Other dialects: increment in SQL, insert when no row was touched
         for (full_name, code), delta in per_account.items():
             res = await self.session.execute(
-                select(AccountBalanceORM).where(AccountBalanceORM.account_full_name == full_name)
+                update(AccountBalanceORM)
+                .where(AccountBalanceORM.account_full_name == full_name)
+                .values(balance=AccountBalanceORM.balance + delta, last_journal_id=journal_id)
+                .execution_options(synchronize_session=False)
             )
-            row = res.scalar_one_or_none()
-            if not row:
-                row = AccountBalanceORM(
-                    account_full_name=full_name,
-                    currency_code=code,
-                    balance=delta,
-                    last_journal_id=journal_id,
+            if not cast(Any, res).rowcount:
+                self.session.add(
+                    AccountBalanceORM(
+                        account_full_name=full_name,
+                        currency_code=code,
+                        balance=delta,
+                        last_journal_id=journal_id,
+                    )
                 )
-                self.session.add(row)
-            else:
-                current = Decimal(cast(Any, row.balance))
-                row.balance = current + delta
-                row.last_journal_id = journal_id
-        # Upsert daily turnovers
+        # Upsert daily turnovers the same way
         for (full_name, code), (d_add, c_add) in per_turnover.items():
             res = await self.session.execute(
-                select(AccountDailyTurnoverORM).where(
+                update(AccountDailyTurnoverORM)
+                .where(
                     AccountDailyTurnoverORM.account_full_name == full_name,
                     AccountDailyTurnoverORM.date_utc == day,
                 )
+                .values(
+                    debit_total=AccountDailyTurnoverORM.debit_total + d_add,
+                    credit_total=AccountDailyTurnoverORM.credit_total + c_add,
+                )
+                .execution_options(synchronize_session=False)
             )
-            row = res.scalar_one_or_none()
-            if not row:
-                row = AccountDailyTurnoverORM(
-                    account_full_name=full_name,
-                    currency_code=code,
-                    date_utc=day,
-                    debit_total=d_add,
-                    credit_total=c_add,
+            if not cast(Any, res).rowcount:
+                self.session.add(
+                    AccountDailyTurnoverORM(
+                        account_full_name=full_name,
+                        currency_code=code,
+                        date_utc=day,
+                        debit_total=d_add,
+                        credit_total=c_add,
+                    )
                 )
-                self.session.add(row)
-            else:
-                row.debit_total = Decimal(cast(Any, row.debit_total)) + d_add
-                row.credit_total = Decimal(cast(Any, row.credit_total)) + c_add
         await self.session.flush()
 
+    async def _upsert_aggregates(
+        self,
+        insert_fn: Any,
+        *,
+        journal_id: int,
+        day: datetime,
+        per_account: dict[tuple[str, str], Decimal],
+        per_turnover: dict[tuple[str, str], tuple[Decimal, Decimal]],
+    ) -> None:
+        """Apply all deltas with one ``INSERT ... ON CONFLICT DO UPDATE`` per aggregate table.
+
+        One statement per table regardless of the number of accounts touched;
+        the increment happens in SQL, so concurrent postings do not lose updates.
+        Rows are folded per conflict key first (the same key may not appear twice
+        in one statement); the first seen currency code is kept, as before.
+        """
+        balance_rows: dict[str, dict[str, Any]] = {}
+        for (full_name, code), delta in per_account.items():
+            row = balance_rows.get(full_name)
+            if row is None:
+                balance_rows[full_name] = {
+                    "account_full_name": full_name,
+                    "currency_code": code,
+                    "balance": delta,
+                    "last_journal_id": journal_id,
+                }
+            else:
+                row["balance"] += delta
+        stmt = insert_fn(AccountBalanceORM).values(list(balance_rows.values()))
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[AccountBalanceORM.account_full_name],
+                set_={
+                    "balance": AccountBalanceORM.balance + stmt.excluded.balance,
+                    "last_journal_id": stmt.excluded.last_journal_id,
+                },
+            )
+        )
+
+        turnover_rows: dict[str, dict[str, Any]] = {}
+        for (full_name, code), (d_add, c_add) in per_turnover.items():
+            row = turnover_rows.get(full_name)
+            if row is None:
+                turnover_rows[full_name] = {
+                    "account_full_name": full_name,
+                    "currency_code": code,
+                    "date_utc": day,
+                    "debit_total": d_add,
+                    "credit_total": c_add,
+                }
+            else:
+                row["debit_total"] += d_add
+                row["credit_total"] += c_add
+        stmt = insert_fn(AccountDailyTurnoverORM).values(list(turnover_rows.values()))
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[AccountDailyTurnoverORM.account_full_name, AccountDailyTurnoverORM.date_utc],
+                set_={
+                    "debit_total": AccountDailyTurnoverORM.debit_total + stmt.excluded.debit_total,
+                    "credit_total": AccountDailyTurnoverORM.credit_total + stmt.excluded.credit_total,
+                },
+            )
+        )
+
 
 class AsyncSqlAlchemyExchangeRateEventsRepository:
     """Async repository for FX exchange rate audit trail (CRUD + simple filters).
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Callable
 from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.pool import QueuePool
 
 from py_accountant.infrastructure.persistence.sqlalchemy.async_engine import (
     get_async_engine,
@@ -25,7 +27,7 @@ class AsyncSqlAlchemyUnitOfWork:
 
     Responsibilities:
     - Manage a single AsyncSession per context (open, begin, commit/rollback, close).
-    - Expose lazy repositories bound to the current session.
+    - Expose repositories bound to the current session (built once on enter).
     """
 
     def __init__(self, url: str | None = None, *, echo: bool = False) -> None:
@@ -41,7 +43,9 @@ class AsyncSqlAlchemyUnitOfWork:
         self._session: AsyncSession | None = None
         self._entered: bool = False
         self._explicit_commit: bool = False
-        # Lazy async repositories
+        # Callbacks registered via on_commit() for the current transaction
+        self._after_commit: list[Callable[[], None]] = []
+        # Async repositories, built on __aenter__ and dropped with the session
         self._a_accounts: AsyncSqlAlchemyAccountRepository | None = None
         self._a_currencies: AsyncSqlAlchemyCurrencyRepository | None = None
         self._a_transactions: AsyncSqlAlchemyTransactionRepository | None = None
@@ -59,11 +63,37 @@ class AsyncSqlAlchemyUnitOfWork:
         Raises:
         - RuntimeError: if accessed outside of an active context.
         """
-        if not self._session:
+        session = self._session
+        if session is None:
             raise RuntimeError(
                 "AsyncSqlAlchemyUnitOfWork.session is only available inside 'async with' block"
             )
-        return self._session
+        return session
+
+    async def warmup(self, n: int = 5) -> int:
+        """Pre-open pooled connections so first requests skip the connect handshake.
+
+        Opens up to ``n`` connections concurrently and returns them to the pool.
+        The count is capped by the pool size; non-queue pools (e.g. SQLite
+        in-memory StaticPool) are warmed with a single connection. Call once at
+        application startup, outside of ``async with``.
+
+        Returns:
+        - Number of connections opened.
+        """
+        pool = self._engine.sync_engine.pool
+        n = min(n, pool.size() if isinstance(pool, QueuePool) else 1)
+        if n <= 0:
+            return 0
+        conns = [self._engine.connect() for _ in range(n)]
+        started = await asyncio.gather(*(c.start() for c in conns), return_exceptions=True)
+        opened = [c for c in started if not isinstance(c, BaseException)]
+        await asyncio.gather(*(c.close() for c in opened))
+        for res in started:
+            if isinstance(res, BaseException):
+                raise res
+        logger.debug("AsyncUoW: warmed %d pooled connection(s)", len(opened))
+        return len(opened)
 
     @property
     def session_factory(self):
@@ -73,20 +103,25 @@ class AsyncSqlAlchemyUnitOfWork:
     async def __aenter__(self) -> AsyncSqlAlchemyUnitOfWork:
         """Open a new AsyncSession and begin a transaction.
 
-        Resets lazy repositories for this context.
+        Builds the repositories for this context over the new session.
         """
         if self._entered:
             raise RuntimeError("AsyncSqlAlchemyUnitOfWork instance cannot be re-entered")
         self._entered = True
         self._explicit_commit = False
+        self._after_commit = []
         logger.debug("AsyncUoW: opening session and beginning transaction")
         self._session = self._session_factory()
         await self._session.begin()
-        # Reset repositories cache on fresh session
-        self._a_accounts = None
-        self._a_currencies = None
-        self._a_transactions = None
-        self._a_rate_events = None
+        session = self._session
+        # Repositories are thin wrappers over the session: build them once here so
+        # the per-request property access is a plain attribute read
+        (self._a_accounts, self._a_currencies, self._a_transactions, self._a_rate_events) = (
+            AsyncSqlAlchemyAccountRepository(session),
+            AsyncSqlAlchemyCurrencyRepository(session),
+            AsyncSqlAlchemyTransactionRepository(session),
+            AsyncSqlAlchemyExchangeRateEventsRepository(session),
+        )
         return self
 
     async def __aexit__(self, exc_type, exc: BaseException | None, tb: Any) -> None:
@@ -95,7 +130,7 @@ class AsyncSqlAlchemyUnitOfWork:
         Always closes the session and clears cached repositories.
         """
         try:
-            if not self._session:
+            if self._session is None:
                 logger.debug("AsyncUoW.__aexit__: no active session; nothing to finalize")
                 return None
             if exc is not None:
@@ -116,6 +151,7 @@ class AsyncSqlAlchemyUnitOfWork:
                         except Exception:
                             logger.exception("AsyncUoW: rollback after exit-commit failure also failed")
                         raise
+                    self._run_after_commit()
         finally:
             if self._session is not None:
                 try:
@@ -125,34 +161,58 @@ class AsyncSqlAlchemyUnitOfWork:
                 finally:
                     self._session = None
                     self._entered = False
-                    # Drop repositories cache along with the session
-                    self._a_accounts = None
-                    self._a_currencies = None
-                    self._a_transactions = None
-                    self._a_rate_events = None
+                    self._after_commit = []
+                    # Drop repositories along with the session
+                    self._clear_repositories()
 
     async def commit(self) -> None:
         """Commit the current transaction if a session is active.
 
         Marks this context as having performed an explicit commit.
         """
-        if not self._session:
+        if self._session is None:
             raise RuntimeError("AsyncSqlAlchemyUnitOfWork.commit() requires an active session")
         await self._session.commit()
         self._explicit_commit = True
+        # Other writers may change currencies between transactions
+        if self._a_currencies is not None:
+            self._a_currencies.invalidate_cache()
+        self._run_after_commit()
 
     async def rollback(self) -> None:
         """Rollback the current transaction if a session is active."""
-        if not self._session:
+        if self._session is None:
             raise RuntimeError("AsyncSqlAlchemyUnitOfWork.rollback() requires an active session")
         await self._session.rollback()
+        # Rolled back writes must not survive in the memoized currency list
+        if self._a_currencies is not None:
+            self._a_currencies.invalidate_cache()
+        self._after_commit = []
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        """Run ``callback`` once the current transaction commits.
+
+        Callbacks run in registration order after a successful ``commit()`` or
+        commit on exit; a rollback, a failed commit or closing the session drops them.
+        """
+        if self._session is None:
+            raise RuntimeError("AsyncSqlAlchemyUnitOfWork.on_commit() requires an active session")
+        self._after_commit.append(callback)
+
+    def _run_after_commit(self) -> None:
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                logger.exception("AsyncUoW: after-commit callback failed")
 
     def close(self) -> None:
         """Best-effort synchronous close for cases without an event loop.
 
         Prefer using the async context manager in application code.
         """
-        if not self._session:
+        if self._session is None:
             return None
         try:
             self._session.sync_session.close()
@@ -165,47 +225,46 @@ class AsyncSqlAlchemyUnitOfWork:
         finally:
             self._session = None
             self._entered = False
-            self._a_accounts = None
-            self._a_currencies = None
-            self._a_transactions = None
-            self._a_rate_events = None
+            self._after_commit = []
+            self._clear_repositories()
 
-    # Async repositories (lazy properties)
+    def _clear_repositories(self) -> None:
+        self._a_accounts = None
+        self._a_currencies = None
+        self._a_transactions = None
+        self._a_rate_events = None
+
+    # Async repositories (built on __aenter__)
     @property
     def accounts(self) -> AsyncSqlAlchemyAccountRepository:
         """Return async Account repository bound to the current session."""
-        if not self._session:
+        repo = self._a_accounts
+        if repo is None:
             raise RuntimeError("AsyncSqlAlchemyUnitOfWork.accounts requires an active session")
-        if not self._a_accounts:
-            self._a_accounts = AsyncSqlAlchemyAccountRepository(self._session)
-        return self._a_accounts
+        return repo
 
     @property
     def currencies(self) -> AsyncSqlAlchemyCurrencyRepository:
         """Return async Currency repository bound to the current session."""
-        if not self._session:
+        repo = self._a_currencies
+        if repo is None:
             raise RuntimeError("AsyncSqlAlchemyUnitOfWork.currencies requires an active session")
-        if not self._a_currencies:
-            self._a_currencies = AsyncSqlAlchemyCurrencyRepository(self._session)
-        return self._a_currencies
+        return repo
 
     @property
     def transactions(self) -> AsyncSqlAlchemyTransactionRepository:
         """Return async Transaction repository bound to the current session."""
-        if not self._session:
+        repo = self._a_transactions
+        if repo is None:
             raise RuntimeError("AsyncSqlAlchemyUnitOfWork.transactions requires an active session")
-        if not self._a_transactions:
-            self._a_transactions = AsyncSqlAlchemyTransactionRepository(self._session)
-        return self._a_transactions
-
+        return repo
 
     @property
     def exchange_rate_events(self) -> AsyncSqlAlchemyExchangeRateEventsRepository:  # type: ignore[override]
         """Return async ExchangeRateEvents repository bound to the current session."""
-        if not self._session:
+        repo = self._a_rate_events
+        if repo is None:
             raise RuntimeError(
                 "AsyncSqlAlchemyUnitOfWork.exchange_rate_events requires an active session"
             )
-        if not self._a_rate_events:
-            self._a_rate_events = AsyncSqlAlchemyExchangeRateEventsRepository(self._session)
-        return self._a_rate_events
+        return repo
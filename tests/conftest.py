@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
 
+import pytest
 import pytest_asyncio
+from sqlalchemy import event
 
 from py_accountant.infrastructure.persistence.sqlalchemy.models import Base
 from py_accountant.infrastructure.persistence.sqlalchemy.uow import AsyncSqlAlchemyUnitOfWork
@@ -28,3 +32,45 @@ async def async_uow(tmp_path: Path) -> AsyncIterator[AsyncSqlAlchemyUnitOfWork]:
         yield uow
     finally:
         await uow.__aexit__(None, None, None)
+
+
+@dataclass
+class StatementCount:
+    """SQL statements sent to the database inside a ``query_counter()`` block.
+
+    ``max_params`` is the largest number of bind parameters of a single
+    (non-``executemany``) statement; ``statements`` holds the SQL text in order.
+    """
+
+    count: int = 0
+    max_params: int = 0
+    statements: list[str] = field(default_factory=list)
+
+
+@pytest.fixture
+def query_counter(async_uow: AsyncSqlAlchemyUnitOfWork) -> Callable[[], AbstractContextManager[StatementCount]]:
+    """Return a context manager counting statements executed on ``async_uow``'s engine.
+
+    Usage: ``with query_counter() as q: ...`` then ``assert q.count == 2``.
+    Counts ``before_cursor_execute`` events, so ORM flushes and streamed queries
+    are included and an ``executemany`` batch counts once.
+    """
+    engine = async_uow.engine.sync_engine  # type: ignore[attr-defined]
+
+    @contextmanager
+    def _count() -> Iterator[StatementCount]:
+        counter = StatementCount()
+
+        def _on_execute(_conn, _cursor, statement, parameters, _context, executemany) -> None:  # noqa: ANN001
+            counter.count += 1
+            counter.statements.append(statement)
+            if not executemany:
+                counter.max_params = max(counter.max_params, len(parameters or ()))
+
+        event.listen(engine, "before_cursor_execute", _on_execute)
+        try:
+            yield counter
+        finally:
+            event.remove(engine, "before_cursor_execute", _on_execute)
+
+    return _count
@@ -64,9 +64,9 @@ class TestCLIUpgradeWorkflow:
         )
 
         assert result.returncode == 0
-        # Should show the current version (0008_add_account_aggregates)
-        assert "0008" in result.stdout or "0008_add_account_aggregates" in result.stdout, \
-            f"Expected version 0008 in output.\nUpgrade output: {upgrade_result.stdout}\nCurrent output: {result.stdout}"
+        # Should show the current version (0009_tune_indexes)
+        assert "0009" in result.stdout or "0009_tune_indexes" in result.stdout, \
+            f"Expected version 0009 in output.\nUpgrade output: {upgrade_result.stdout}\nCurrent output: {result.stdout}"
 
     def test_pending_migrations_via_cli(self, db_env: dict[str, str]):
         """E2E: Check pending migrations via CLI."""
@@ -197,6 +197,6 @@ class TestCLIWithEcho:
         # Just verify the command succeeds with --echo flag
         assert result.returncode == 0, f"Command with --echo failed: {result.stderr}"
         # Should still show the version
-        assert "0008" in result.stdout or "0008_add_account_aggregates" in result.stdout, \
+        assert "0009" in result.stdout or "0009_tune_indexes" in result.stdout, \
             f"Expected version in output with --echo, got: {result.stdout}"
 
@@ -11,5 +11,6 @@ def test_indexes_present_sqlite_memory():
     t_ix = {ix['name'] for ix in insp.get_indexes('transaction_lines')}
     assert 'ix_journals_occurred_at' in j_ix
     assert 'ix_tx_lines_account_full_name' in t_ix
-    assert 'ix_tx_lines_currency_code' in t_ix
+    assert 'ix_tx_lines_currency_code' not in t_ix
     assert 'ix_tx_lines_account_journal' in t_ix
+    assert 'ix_tx_lines_journal_covering' in t_ix
@@ -77,7 +77,7 @@ class TestPostgresMigrationLifecycle:
 
         # Check version
         current = await runner.get_current_version()
-        assert current == "0008_add_account_aggregates"
+        assert current == "0009_tune_indexes"
 
         # Check no pending migrations
         pending = await runner.get_pending_migrations()
@@ -94,16 +94,16 @@ class TestPostgresMigrationLifecycle:
         await runner.upgrade_to_version("0002_add_is_base_currency")
         assert await runner.get_current_version() == "0002_add_is_base_currency"
 
-        # Check pending migrations (should be 6: 0003-0008)
+        # Check pending migrations (should be 7: 0003-0009)
         pending = await runner.get_pending_migrations()
-        assert len(pending) == 6
+        assert len(pending) == 7
 
     @pytest.mark.asyncio
     async def test_downgrade_from_head(self, runner: MigrationRunner):
         """Downgrade from head to specific version."""
         # Upgrade to head first
         await runner.upgrade_to_head()
-        assert await runner.get_current_version() == "0008_add_account_aggregates"
+        assert await runner.get_current_version() == "0009_tune_indexes"
 
         # Downgrade to 0005
         await runner.downgrade(target="0005_exchange_rate_events_archive")
@@ -112,9 +112,9 @@ class TestPostgresMigrationLifecycle:
         current = await runner.get_current_version()
         assert current == "0005_exchange_rate_events_archive"
 
-        # Check pending migrations (should be 3: 0006-0008)
+        # Check pending migrations (should be 4: 0006-0009)
         pending = await runner.get_pending_migrations()
-        assert len(pending) == 3
+        assert len(pending) == 4
 
     @pytest.mark.asyncio
     async def test_downgrade_to_base(self, runner: MigrationRunner):
@@ -131,7 +131,7 @@ class TestPostgresMigrationLifecycle:
 
         # Check all migrations are pending
         pending = await runner.get_pending_migrations()
-        assert len(pending) == 8
+        assert len(pending) == 9
 
     @pytest.mark.asyncio
     async def test_upgrade_after_downgrade(self, runner: MigrationRunner):
@@ -145,7 +145,7 @@ class TestPostgresMigrationLifecycle:
 
         # Upgrade back to head
         await runner.upgrade_to_head()
-        assert await runner.get_current_version() == "0008_add_account_aggregates"
+        assert await runner.get_current_version() == "0009_tune_indexes"
 
 
 class TestPostgresSchemaVerification:
@@ -213,7 +213,7 @@ class TestPostgresSchemaVerification:
         # Check at least some expected indexes exist
         expected_indexes = {
             "ix_tx_lines_account_full_name",
-            "ix_tx_lines_currency_code",
+            "ix_tx_lines_journal_covering",
             "ix_journals_occurred_at",
         }
 
@@ -227,7 +227,7 @@ class TestPostgresSchemaVerification:
         await runner.upgrade_to_head()
 
         # Should not raise
-        await runner.validate_schema_version("0008_add_account_aggregates")
+        await runner.validate_schema_version("0009_tune_indexes")
 
     @pytest.mark.asyncio
     async def test_validate_schema_version_mismatch(self, runner: MigrationRunner):
@@ -239,7 +239,7 @@ class TestPostgresSchemaVerification:
         with pytest.raises(VersionMismatchError) as exc_info:
             await runner.validate_schema_version("0005_exchange_rate_events_archive")
 
-        assert "0008_add_account_aggregates" in str(exc_info.value)
+        assert "0009_tune_indexes" in str(exc_info.value)
         assert "0005_exchange_rate_events_archive" in str(exc_info.value)
 
 
@@ -266,7 +266,7 @@ class TestPostgresConcurrency:
             # Both should report same version
             version1 = await runner1.get_current_version()
             version2 = await runner2.get_current_version()
-            assert version1 == version2 == "0008_add_account_aggregates"
+            assert version1 == version2 == "0009_tune_indexes"
         finally:
             await engine2.dispose()
 
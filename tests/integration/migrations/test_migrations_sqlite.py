@@ -58,7 +58,7 @@ class TestSQLiteMigrationLifecycle:
 
         # Check version
         current = await sqlite_runner.get_current_version()
-        assert current == "0008_add_account_aggregates"
+        assert current == "0009_tune_indexes"
 
     @pytest.mark.asyncio
     @pytest.mark.xfail(
@@ -78,7 +78,7 @@ class TestSQLiteMigrationLifecycle:
 
         # Check version
         current = await runner.get_current_version()
-        assert current == "0008_add_account_aggregates"
+        assert current == "0009_tune_indexes"
 
     @pytest.mark.asyncio
     async def test_downgrade_and_upgrade_sqlite(self, sqlite_runner: MigrationRunner):
@@ -95,7 +95,7 @@ class TestSQLiteMigrationLifecycle:
 
         # Upgrade back to head
         await sqlite_runner.upgrade_to_head()
-        assert await sqlite_runner.get_current_version() == "0008_add_account_aggregates"
+        assert await sqlite_runner.get_current_version() == "0009_tune_indexes"
 
     @pytest.mark.asyncio
     async def test_migration_persistence_across_connections(self, tmp_path: Path):
@@ -113,7 +113,7 @@ class TestSQLiteMigrationLifecycle:
         engine2 = create_async_engine(url, echo=False)
         runner2 = MigrationRunner(engine2)
         current = await runner2.get_current_version()
-        assert current == "0008_add_account_aggregates"
+        assert current == "0009_tune_indexes"
         await engine2.dispose()
 
 
@@ -178,11 +178,14 @@ class TestSQLiteSchemaVerification:
         # Check at least some indexes exist
         expected_indexes = {
             "ix_tx_lines_account_full_name",
-            "ix_tx_lines_currency_code",
+            "ix_tx_lines_journal_covering",
             "ix_journals_occurred_at",
         }
 
         assert expected_indexes.issubset(indexes)
+        # Covered by the covering index / the UNIQUE constraint since 0009
+        assert "ix_tx_lines_currency_code" not in indexes
+        assert "ix_account_balances_full_name" not in indexes
 
     @pytest.mark.asyncio
     async def test_validate_schema_version_sqlite(self, sqlite_runner: MigrationRunner):
@@ -190,7 +193,7 @@ class TestSQLiteSchemaVerification:
         await sqlite_runner.upgrade_to_head()
 
         # Should not raise
-        await sqlite_runner.validate_schema_version("0008_add_account_aggregates")
+        await sqlite_runner.validate_schema_version("0009_tune_indexes")
 
 
 class TestSQLiteURLConversion:
@@ -212,7 +215,7 @@ class TestSQLiteURLConversion:
 
         # Check version
         current = await runner.get_current_version()
-        assert current == "0008_add_account_aggregates"
+        assert current == "0009_tune_indexes"
 
         await engine.dispose()
 
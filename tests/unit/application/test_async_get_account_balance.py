@@ -82,3 +82,24 @@ async def test_balance_empty_zero(async_uow: AsyncSqlAlchemyUnitOfWork):
     bal = await AsyncGetAccountBalance(async_uow, clock)("Assets:Cash")
     assert bal == Decimal("0")
 
+
+
+async def test_balance_as_of_sums_lines_up_to_moment(async_uow: AsyncSqlAlchemyUnitOfWork):
+    start = datetime.now(UTC)
+    clock = _Clock(start)
+    await _bootstrap_minimal(async_uow)
+    post = AsyncPostTransaction(async_uow, clock)
+    await post([
+        EntryLineDTO(side="DEBIT", account_full_name="Assets:Cash", amount=Decimal("100"), currency_code="USD"),
+        EntryLineDTO(side="CREDIT", account_full_name="Income:Salary", amount=Decimal("100"), currency_code="USD"),
+    ])
+    clock._now = start + timedelta(seconds=10)
+    await post([
+        EntryLineDTO(side="CREDIT", account_full_name="Assets:Cash", amount=Decimal("40"), currency_code="USD"),
+        EntryLineDTO(side="DEBIT", account_full_name="Income:Salary", amount=Decimal("40"), currency_code="USD"),
+    ])
+    get_bal = AsyncGetAccountBalance(async_uow, clock)
+    assert await get_bal("Assets:Cash", as_of=start - timedelta(seconds=1)) == Decimal("0")
+    assert await get_bal("Assets:Cash", as_of=start) == Decimal("100")
+    assert await get_bal("Assets:Cash", as_of=start + timedelta(seconds=10)) == Decimal("60")
+    assert await get_bal("Income:Salary", as_of=start + timedelta(seconds=10)) == Decimal("-60")
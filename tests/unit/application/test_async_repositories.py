@@ -4,6 +4,7 @@ from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 
 import pytest
+from sqlalchemy import insert
 
 from py_accountant.application.dto.models import (
     AccountDTO,
@@ -11,6 +12,10 @@ from py_accountant.application.dto.models import (
     EntryLineDTO,
     TransactionDTO,
 )
+from py_accountant.infrastructure.persistence.sqlalchemy.models import (
+    JournalORM,
+    TransactionLineORM,
+)
 from py_accountant.infrastructure.persistence.sqlalchemy.uow import AsyncSqlAlchemyUnitOfWork
 
 pytestmark = pytest.mark.asyncio
@@ -37,6 +42,22 @@ async def test_currency_upsert_and_base(async_uow: AsyncSqlAlchemyUnitOfWork):
     assert eur2 and eur2.exchange_rate == Decimal("1.1")
 
 
+async def test_currency_list_all_memoized_until_write(async_uow: AsyncSqlAlchemyUnitOfWork, query_counter):
+    """list_all hits the session once per snapshot; writes and rollback invalidate it."""
+    uow = async_uow
+    await uow.currencies.upsert(CurrencyDTO(code="USD"))
+    with query_counter() as q:
+        first = await uow.currencies.list_all()
+        second = await uow.currencies.list_all()
+    assert q.count == 1
+    assert [c.code for c in first] == [c.code for c in second] == ["USD"]
+    assert first[0] is not second[0]
+    await uow.currencies.upsert(CurrencyDTO(code="EUR", exchange_rate=Decimal("0.9")))
+    assert sorted(c.code for c in await uow.currencies.list_all()) == ["EUR", "USD"]
+    await uow.rollback()
+    assert await uow.currencies.list_all() == []
+
+
 async def test_currency_set_base_missing_raises(async_uow: AsyncSqlAlchemyUnitOfWork):
     """Setting base on a non-existent currency must raise ValueError (parity with sync)."""
     with pytest.raises(ValueError):
@@ -57,6 +78,17 @@ async def test_account_create_and_unique(async_uow: AsyncSqlAlchemyUnitOfWork):
     assert fetched and fetched.full_name == "Assets:Cash"
 
 
+async def test_account_list_by_full_names(async_uow: AsyncSqlAlchemyUnitOfWork):
+    """Batch lookup returns only existing accounts; empty input short-circuits."""
+    uow = async_uow
+    for full_name in ("Assets:Cash", "Assets:Bank", "Income:Sales"):
+        await uow.accounts.create(AccountDTO(id="", name=full_name.rsplit(":", 1)[-1], full_name=full_name, currency_code="USD"))
+    found = await uow.accounts.list_by_full_names(["Assets:Cash", "Income:Sales", "Assets:Cash", "Nope:Missing"])
+    assert sorted(a.full_name for a in found) == ["Assets:Cash", "Income:Sales"]
+    assert all(a.id and a.currency_code == "USD" for a in found)
+    assert await uow.accounts.list_by_full_names([]) == []
+
+
 async def test_transactions_add_and_list_between_with_meta(async_uow: AsyncSqlAlchemyUnitOfWork):
     """Transactions listing supports meta exact-match filter and chronological order."""
     uow = async_uow
@@ -92,6 +124,96 @@ async def test_transactions_add_and_list_between_with_meta(async_uow: AsyncSqlAl
     assert [r.memo for r in alpha_rows] == ["T1"]
 
 
+async def test_transactions_list_between_loads_lines_in_one_query(async_uow: AsyncSqlAlchemyUnitOfWork, query_counter):
+    """list_between issues one journal query and one lines query regardless of journal count."""
+    uow = async_uow
+    t0 = datetime.now(UTC)
+    for i in range(3):
+        await uow.transactions.add(
+            TransactionDTO(
+                id="",
+                occurred_at=t0 + timedelta(seconds=i),
+                memo=f"T{i}",
+                lines=[
+                    EntryLineDTO(side="DEBIT", account_full_name="Assets:Cash", amount=Decimal(i + 1), currency_code="USD"),
+                    EntryLineDTO(side="CREDIT", account_full_name="Income:Sales", amount=Decimal(i + 1), currency_code="USD"),
+                ],
+            )
+        )
+    with query_counter() as q:
+        rows = await uow.transactions.list_between(t0 - timedelta(seconds=1), t0 + timedelta(seconds=5))
+    assert q.count == 2
+    assert [r.memo for r in rows] == ["T0", "T1", "T2"]
+    assert [[(ln.side, ln.account_full_name, ln.amount) for ln in r.lines] for r in rows][2] == [
+        ("DEBIT", "Assets:Cash", Decimal("3")),
+        ("CREDIT", "Income:Sales", Decimal("3")),
+    ]
+    assert await uow.transactions.list_between(t0 + timedelta(days=1), t0 + timedelta(days=2)) == []
+
+
+async def test_transactions_aggregate_raw_groups_by_currency_and_side(async_uow: AsyncSqlAlchemyUnitOfWork):
+    """aggregate_raw returns per-currency/side sums and honors the meta filter."""
+    uow = async_uow
+    t0 = datetime.now(UTC)
+    for amount, tag in ((Decimal("10"), "alpha"), (Decimal("5"), "beta")):
+        await uow.transactions.add(
+            TransactionDTO(
+                id="",
+                occurred_at=t0,
+                lines=[
+                    EntryLineDTO(side="DEBIT", account_full_name="Assets:Cash", amount=amount, currency_code="USD"),
+                    EntryLineDTO(side="CREDIT", account_full_name="Income:Sales", amount=amount, currency_code="USD"),
+                ],
+                meta={"tag": tag},
+            )
+        )
+    window = (t0 - timedelta(seconds=1), t0 + timedelta(seconds=1))
+    rows = await uow.transactions.aggregate_raw(*window)
+    assert sorted((c, s, Decimal(a)) for c, s, a in rows) == [
+        ("USD", "CREDIT", Decimal("15")),
+        ("USD", "DEBIT", Decimal("15")),
+    ]
+    alpha = await uow.transactions.aggregate_raw(*window, meta={"tag": "alpha"})
+    assert sorted((c, s, Decimal(a)) for c, s, a in alpha) == [
+        ("USD", "CREDIT", Decimal("10")),
+        ("USD", "DEBIT", Decimal("10")),
+    ]
+    assert await uow.transactions.aggregate_raw(*window, meta={"tag": "missing"}) == []
+
+
+async def test_transactions_aggregate_raw_meta_beyond_bind_parameter_limit(async_uow: AsyncSqlAlchemyUnitOfWork, query_counter):
+    """A meta-filtered window matching more journals than asyncpg/SQLite accept bind parameters.
+
+    Statement size must not grow with the number of matching journals (SQLite
+    builds differ in their variable limit, so the bound is asserted directly).
+    """
+    uow = async_uow
+    t0 = datetime.now(UTC)
+    n = 33_000  # asyncpg max arguments 32767, default SQLite max variables 32766
+    await uow.session.execute(
+        insert(JournalORM),
+        [{"id": i, "occurred_at": t0, "meta": {"tag": "alpha", "odd": bool(i % 2)}} for i in range(1, n + 1)],
+    )
+    await uow.session.execute(
+        insert(TransactionLineORM),
+        [
+            {"journal_id": i, "account_full_name": name, "side": side, "amount": Decimal("1"), "currency_code": "USD"}
+            for i in range(1, n + 1)
+            for name, side in (("Assets:Cash", "DEBIT"), ("Income:Sales", "CREDIT"))
+        ],
+    )
+    window = (t0 - timedelta(seconds=1), t0 + timedelta(seconds=1))
+    with query_counter() as q:
+        alpha = await uow.transactions.aggregate_raw(*window, meta={"tag": "alpha"})
+    assert q.max_params < 10
+    assert sorted((c, s, Decimal(a)) for c, s, a in alpha) == [
+        ("USD", "CREDIT", Decimal(n)),
+        ("USD", "DEBIT", Decimal(n)),
+    ]
+    cash = await uow.transactions.aggregate_raw(*window, meta={"odd": False}, account_full_name="Assets:Cash")
+    assert [(c, s, Decimal(a)) for c, s, a in cash] == [("USD", "DEBIT", Decimal(n // 2))]
+
+
 async def test_ledger_pagination_order_and_edges(async_uow: AsyncSqlAlchemyUnitOfWork):
     """Ledger honors ordering, offset/limit, and meta filter edge-cases."""
     uow = async_uow
@@ -122,6 +244,45 @@ async def test_ledger_pagination_order_and_edges(async_uow: AsyncSqlAlchemyUnitO
     assert empty1 == [] and empty2 == []
 
 
+async def test_ledger_loads_journals_and_lines_in_two_queries(async_uow: AsyncSqlAlchemyUnitOfWork, query_counter):
+    """ledger uses one journal query plus one lines query (streamed when unbounded); other accounts are skipped."""
+    uow = async_uow
+    now = datetime.now(UTC)
+    for i, debit in enumerate(("Assets:Cash", "Assets:Bank", "Assets:Cash")):
+        await uow.transactions.add(
+            TransactionDTO(
+                id="",
+                occurred_at=now + timedelta(seconds=i),
+                memo=f"T{i}",
+                lines=[
+                    EntryLineDTO(side="DEBIT", account_full_name=debit, amount=Decimal(i + 1), currency_code="USD"),
+                    EntryLineDTO(side="CREDIT", account_full_name="Income:Sales", amount=Decimal(i + 1), currency_code="USD"),
+                ],
+                meta={"tag": "even" if i % 2 == 0 else "odd"},
+            )
+        )
+    window = (now - timedelta(seconds=1), now + timedelta(seconds=10))
+    # Unbounded: lines are streamed
+    with query_counter() as q:
+        rows = await uow.transactions.ledger("Assets:Cash", *window)
+    assert q.count == 2
+    assert [r.memo for r in rows] == ["T0", "T2"]
+    assert [(ln.account_full_name, ln.amount) for ln in rows[1].lines] == [
+        ("Assets:Cash", Decimal("3")),
+        ("Income:Sales", Decimal("3")),
+    ]
+    # Paged without meta: the database pages; lines come through a subquery, not an id list
+    with query_counter() as q:
+        page = await uow.transactions.ledger("Assets:Cash", *window, order="DESC", limit=1)
+    assert q.count == 2 and "LIMIT" in q.statements[0] and q.max_params < 10
+    assert [r.memo for r in page] == ["T2"] and page[0].lines == rows[1].lines
+    skipped = await uow.transactions.ledger("Assets:Cash", *window, offset=1, limit=10_000)
+    assert [r.memo for r in skipped] == ["T2"]
+    # Paged with meta: filtered in Python first, then sliced
+    tagged = await uow.transactions.ledger("Assets:Cash", *window, meta={"tag": "even"}, offset=1, limit=1)
+    assert [r.memo for r in tagged] == ["T2"] and tagged[0].lines == rows[1].lines
+
+
 async def test_fx_events_list_filters_and_limits(async_uow: AsyncSqlAlchemyUnitOfWork):
     """FX events: negative limit handling, code filter, newest-first ordering."""
     uow = async_uow
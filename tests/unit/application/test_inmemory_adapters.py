@@ -9,7 +9,7 @@ from py_accountant.application.dto.models import (
     EntryLineDTO,
     TransactionDTO,
 )
-from py_accountant.infrastructure.persistence.inmemory.clock import FixedClock
+from py_accountant.infrastructure.persistence.inmemory.clock import FixedClock, SystemClock
 from py_accountant.infrastructure.persistence.inmemory.repositories import (
     InMemoryAccountRepository,
     InMemoryCurrencyRepository,
@@ -34,6 +34,16 @@ def test_inmemory_account_repo() -> None:
     assert repo.list() and repo.list()[0].id == "a1"
 
 
+def test_inmemory_account_repo_list_by_parent() -> None:
+    repo = InMemoryAccountRepository()
+    repo.create(AccountDTO(id="a1", name="Assets", full_name="Assets", currency_code="USD"))
+    repo.create(AccountDTO(id="a2", name="Cash", full_name="Assets:Cash", currency_code="USD", parent_id="a1"))
+    repo.create(AccountDTO(id="a3", name="Bank", full_name="Assets:Bank", currency_code="USD", parent_id="a1"))
+    assert [a.id for a in repo.list(parent_id="a1")] == ["a2", "a3"]
+    assert repo.list(parent_id="a2") == []
+    assert len(repo.list()) == 3
+
+
 def test_inmemory_transaction_repo_balance() -> None:
     repo = InMemoryTransactionRepository()
     now = datetime.now(UTC)
@@ -42,6 +52,8 @@ def test_inmemory_transaction_repo_balance() -> None:
     repo.add(TransactionDTO(id="t1", occurred_at=now - timedelta(minutes=1), lines=[line1, line2]))
     bal = repo.account_balance("Assets:Cash", now)
     assert bal == Decimal("25.00")
+    rows = repo.aggregate_raw(now - timedelta(days=1), now)
+    assert sorted(rows) == [("USD", "CREDIT", Decimal("25.00")), ("USD", "DEBIT", Decimal("25.00"))]
 
 
 def test_inmemory_uow_basic() -> None:
@@ -62,3 +74,8 @@ def test_fixed_clock() -> None:
     fixed_time = datetime(2025, 1, 1, tzinfo=UTC)
     clock = FixedClock(fixed=fixed_time)
     assert clock.now() == fixed_time
+
+
+def test_clocks_are_slotted() -> None:
+    assert not hasattr(SystemClock(), "__dict__")
+    assert not hasattr(FixedClock(fixed=datetime(2025, 1, 1, tzinfo=UTC)), "__dict__")
@@ -80,3 +80,17 @@ def test_limit_zero_returns_empty():
     res = ll("Assets:Cash", limit=0)
     assert res == []
 
+
+
+def test_invalid_arguments_do_not_read_clock():
+    uow, _ = setup()
+
+    class _NoClock:
+        def now(self):  # pragma: no cover - must not be reached
+            raise AssertionError("clock read before argument validation")
+
+    ll = ListLedger(uow, _NoClock())
+    with pytest.raises(DomainError):
+        ll("Assets:Cash", offset=-1)
+    with pytest.raises(DomainError):
+        ll("Assets:Cash", order="DOWN")
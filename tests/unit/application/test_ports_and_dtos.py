@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import os
+import subprocess
+import sys
 from datetime import UTC, datetime
 from decimal import Decimal
+from pathlib import Path
 
 from py_accountant.application.dto.models import (
     AccountDTO,
     CurrencyDTO,
     EntryLineDTO,
+    RichTransactionDTO,
     TradingBalanceLineDetailed,
     TradingBalanceLineSimple,
     TransactionDTO,
@@ -17,6 +22,8 @@ from py_accountant.application.ports import (
     CurrencyRepository,
     TransactionRepository,
 )
+from py_accountant.domain.currencies import Currency
+from py_accountant.domain.ledger import LedgerEntry
 
 
 def test_dto_shapes() -> None:
@@ -34,6 +41,25 @@ def test_dto_shapes() -> None:
     assert tline_det.net_base == Decimal("10")
 
 
+def test_hot_path_types_use_slots() -> None:
+    # Types built per line/row on posting and reporting paths must stay slotted
+    hot = [
+        CurrencyDTO,
+        AccountDTO,
+        EntryLineDTO,
+        TransactionDTO,
+        RichTransactionDTO,
+        TradingBalanceLineSimple,
+        TradingBalanceLineDetailed,
+        LedgerEntry,
+        Currency,
+    ]
+    for cls in hot:
+        assert "__slots__" in cls.__dict__, f"{cls.__name__} must be declared with slots=True"
+    line = EntryLineDTO(side="DEBIT", account_full_name="Assets:Cash", amount=Decimal("1"), currency_code="USD")
+    assert not hasattr(line, "__dict__")
+
+
 def test_ports_protocols() -> None:
     # Dummy implementations satisfy Protocols
     class DummyClock:
@@ -57,9 +83,21 @@ def test_ports_protocols() -> None:
     class DummyTx:
         def add(self, dto: TransactionDTO): ...
         def list_between(self, start: datetime, end: datetime, meta: dict | None = None): ...
+        def aggregate_raw(self, start: datetime, end: datetime, meta: dict | None = None): ...
         def ledger(self, account_full_name: str, start: datetime, end: datetime, meta: dict | None = None, *, offset: int = 0, limit: int | None = None, order: str = "ASC"): ...
 
     assert isinstance(DummyClock(), Clock)
     assert isinstance(DummyCur(), CurrencyRepository)
     assert isinstance(DummyAcc(), AccountRepository)
     assert isinstance(DummyTx(), TransactionRepository)
+
+
+def test_application_layer_does_not_import_sqlalchemy() -> None:
+    code = (
+        "import sys, py_accountant.application.use_cases_async, py_accountant.application.use_cases; "
+        "print('sqlalchemy' in sys.modules)"
+    )
+    src = str(Path(__file__).resolve().parents[3] / "src")
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [src, os.environ.get("PYTHONPATH")]))}
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env)
+    assert out.stdout.strip() == "False"
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta, timezone
+
+from py_accountant.application.time_window import epoch_for
+
+
+def test_epoch_for_keeps_tz_and_is_cached() -> None:
+    tz = timezone(timedelta(hours=3))
+    epoch = epoch_for(tz)
+    assert epoch == datetime.fromtimestamp(0, tz=UTC)
+    assert epoch.tzinfo is tz
+    assert epoch_for(tz) is epoch
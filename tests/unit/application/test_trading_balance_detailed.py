@@ -80,3 +80,12 @@ def test_get_trading_balance_detailed_fallback_rate():
     assert jpy_line.debit_base == jpy_line.debit
     assert jpy_line.credit_base == jpy_line.credit
     assert jpy_line.net_base == jpy_line.net
+
+
+def test_get_trading_balance_detailed_empty_window_still_validates_base():
+    uow = setup_uow()
+    CreateCurrency(uow)("USD", exchange_rate=Decimal("1"))
+    clock = FixedClock(fixed=datetime.now(UTC))
+    assert GetTradingBalanceDetailedDTOs(uow, clock)("USD") == []
+    with pytest.raises(DomainError):
+        GetTradingBalanceDetailedDTOs(uow, clock)("GBP")
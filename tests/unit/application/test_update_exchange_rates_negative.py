@@ -68,3 +68,22 @@ def test_weighted_average_policy_applies_and_validates():
     cur = uow.currencies.get_by_code("USD")
     assert cur.exchange_rate == Decimal("1.5")
 
+
+
+def test_invalid_rate_string_errors():
+    uow, clock = _setup_uow()
+    CreateCurrency(uow)("USD")
+    with pytest.raises(DomainError):
+        UpdateExchangeRates(uow)([RateUpdateInput(code="USD", rate="abc")])
+
+
+def test_bulk_upsert_failure_propagates():
+    uow, clock = _setup_uow()
+    CreateCurrency(uow)("USD")
+
+    def broken(updates):
+        raise RuntimeError("bulk failed")
+
+    uow.currencies.bulk_upsert_rates = broken
+    with pytest.raises(RuntimeError, match="bulk failed"):
+        UpdateExchangeRates(uow)([RateUpdateInput(code="USD", rate=Decimal("2.0"))])
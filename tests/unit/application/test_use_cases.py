@@ -5,7 +5,12 @@ from decimal import Decimal
 
 import pytest
 
-from py_accountant.application.dto.models import CurrencyDTO, EntryLineDTO, RateUpdateInput
+from py_accountant.application.dto.models import (
+    CurrencyDTO,
+    EntryLineDTO,
+    RateUpdateInput,
+    TransactionDTO,
+)
 from py_accountant.application.use_cases.exchange_rates import UpdateExchangeRates
 from py_accountant.application.use_cases.ledger import (
     CreateAccount,
@@ -15,6 +20,7 @@ from py_accountant.application.use_cases.ledger import (
     GetTradingBalanceDetailedDTOs,
     GetTradingBalanceRawDTOs,
     PostTransaction,
+    UpdateCurrenciesFromTransaction,
 )
 from py_accountant.domain import DomainError
 from py_accountant.domain.services.exchange_rate_policy import ExchangeRatePolicy
@@ -115,6 +121,29 @@ def test_update_exchange_rates_policy_applied():
     assert gbp and gbp.exchange_rate == Decimal("1.2500000000")
 
 
+def test_update_currencies_from_transaction_writes_each_currency_once():
+    uow = InMemoryUnitOfWork()
+    uow.currencies.upsert(CurrencyDTO(code="EUR", exchange_rate=Decimal("1.0")))
+    upserts: list[str] = []
+    upsert = uow.currencies.upsert
+
+    def counting_upsert(dto: CurrencyDTO) -> CurrencyDTO:
+        upserts.append(dto.code)
+        return upsert(dto)
+
+    uow.currencies.upsert = counting_upsert  # type: ignore[method-assign]
+    lines = [
+        EntryLineDTO(side="DEBIT", account_full_name="Assets:Eur", amount=Decimal("1"), currency_code="EUR", exchange_rate=Decimal("2.0")),
+        EntryLineDTO(side="CREDIT", account_full_name="Assets:Eur", amount=Decimal("1"), currency_code="EUR", exchange_rate=Decimal("3.0")),
+    ]
+    tx = TransactionDTO(id="t", occurred_at=datetime.now(UTC), lines=lines)
+    UpdateCurrenciesFromTransaction(uow, ExchangeRatePolicy(mode="weighted_average"))(tx)
+    assert upserts == ["EUR"]
+    eur = uow.currencies.get_by_code("EUR")
+    # (1.0 + 2.0) / 2 = 1.5, then (1.5 * 2 + 3.0) / 3 = 2.0
+    assert eur and eur.exchange_rate == Decimal("2")
+
+
 def test_set_base_currency_enforces_singleton():
     uow = InMemoryUnitOfWork()
     uow.currencies.upsert(CurrencyDTO(code="USD"))
@@ -58,6 +58,27 @@ async def test_post_transaction_unbalanced_raises_domain_error(async_uow):
         await post(lines)
 
 
+@pytest.mark.asyncio
+async def test_post_transaction_lookup_queries_do_not_grow_with_lines(async_uow, query_counter):
+    create_cur = AsyncCreateCurrency(async_uow)
+    await create_cur("USD")
+    await AsyncSetBaseCurrency(async_uow)("USD")
+    create_acc = AsyncCreateAccount(async_uow)
+    await create_acc("Assets:Cash", "USD")
+    await create_acc("Income:Sales", "USD")
+    post = AsyncPostTransaction(async_uow, _TestClock())
+    counts = []
+    for n in (1, 1, 5):  # first post also loads the memoized currency catalog
+        lines = [
+            EntryLineDTO(side="DEBIT", account_full_name="Assets:Cash", amount=Decimal("1"), currency_code="USD"),
+            EntryLineDTO(side="CREDIT", account_full_name="Income:Sales", amount=Decimal("1"), currency_code="USD"),
+        ] * n
+        with query_counter() as q:
+            await post(lines)
+        counts.append(q.count)
+    assert counts[1] == counts[2]
+
+
 @pytest.mark.asyncio
 async def test_post_transaction_empty_lines_raises_validation_error(async_uow):
     post = AsyncPostTransaction(async_uow, _TestClock())
@@ -13,6 +13,7 @@ from py_accountant.application.use_cases_async import (
     AsyncGetTradingBalanceRaw,
     AsyncPostTransaction,
     AsyncSetBaseCurrency,
+    DetailedBalanceCache,
 )
 from py_accountant.domain.errors import ValidationError
 
@@ -189,3 +190,88 @@ async def test_window_validation_and_meta_type(async_uow):
         await det(start=now + timedelta(seconds=1), end=now)
     with pytest.raises(ValueError):
         await det(meta=object())  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_trading_balance_detailed_unknown_base_skips_transaction_query(async_uow, monkeypatch):
+    clock = _Clock()
+    await AsyncCreateCurrency(async_uow)("USD")
+    await AsyncSetBaseCurrency(async_uow)("USD")
+
+    async def _fail(*args, **kwargs):  # pragma: no cover - must not be reached
+        raise AssertionError("transactions queried before base validation")
+
+    monkeypatch.setattr(async_uow.transactions, "aggregate_raw", _fail)
+    det = AsyncGetTradingBalanceDetailed(async_uow, clock)
+    with pytest.raises(ValidationError):
+        await det(base_currency="GBP")
+
+
+def _usd_pair(amount: str) -> list[EntryLineDTO]:
+    return [
+        EntryLineDTO(side="DEBIT", account_full_name="Assets:Cash", amount=Decimal(amount), currency_code="USD"),
+        EntryLineDTO(side="CREDIT", account_full_name="Assets:Cash", amount=Decimal(amount), currency_code="USD"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_trading_balance_detailed_cache_closed_window(async_uow, query_counter):
+    now = datetime.now(UTC)
+    clock = _Clock(now)
+    await AsyncCreateCurrency(async_uow)("USD")
+    await AsyncSetBaseCurrency(async_uow)("USD")
+    await AsyncCreateAccount(async_uow)("Assets:Cash", "USD")
+    await AsyncPostTransaction(async_uow, _Clock(now - timedelta(hours=1)))(_usd_pair("4"))
+    await async_uow.commit()
+    cache = DetailedBalanceCache(maxsize=4)
+    det = AsyncGetTradingBalanceDetailed(async_uow, clock, cache=cache)
+    closed = {"start": now - timedelta(days=1), "end": now - timedelta(minutes=1)}
+    first = await det(**closed)
+    # Stored only once the unit of work commits
+    assert len(cache) == 0
+    await async_uow.commit()
+    assert len(cache) == 1
+    # Served from cache: only the currency catalog (memo dropped by commit) is read
+    with query_counter() as q:
+        assert await det(**closed) == first
+    assert q.count == 1
+    # Open window (end defaults to now) is never cached
+    with query_counter() as q:
+        await det()
+    await async_uow.commit()
+    assert q.count == 1 and len(cache) == 1
+    # A currency catalog change produces a new key
+    await AsyncCreateCurrency(async_uow)("EUR", exchange_rate=Decimal("1.1"))
+    with query_counter() as q:
+        await det(**closed)
+    await async_uow.commit()
+    assert q.count == 2 and len(cache) == 2  # catalog reload + aggregate
+
+
+@pytest.mark.asyncio
+async def test_trading_balance_detailed_cache_invalidated_by_postings(async_uow):
+    now = datetime.now(UTC)
+    await AsyncCreateCurrency(async_uow)("USD")
+    await AsyncSetBaseCurrency(async_uow)("USD")
+    await AsyncCreateAccount(async_uow)("Assets:Cash", "USD")
+    cache = DetailedBalanceCache(maxsize=4)
+    det = AsyncGetTradingBalanceDetailed(async_uow, _Clock(now), cache=cache)
+    closed = {"start": now - timedelta(days=1), "end": now - timedelta(minutes=1)}
+    back_dated = AsyncPostTransaction(async_uow, _Clock(now - timedelta(hours=1)))
+    assert await det(**closed) == []
+    await async_uow.commit()
+    assert len(cache) == 1
+    # A back-dated posting into the cached window is reflected immediately
+    await back_dated(_usd_pair("4"))
+    assert [line.debit for line in await det(**closed)] == [Decimal("4")]
+    # Computed inside a UoW that rolls back: never stored
+    await async_uow.rollback()
+    assert len(cache) == 1
+    assert await det(**closed) == []
+    # Committed result over the posting is cached under the new ledger version
+    await back_dated(_usd_pair("5"))
+    await async_uow.commit()
+    assert [line.debit for line in await det(**closed)] == [Decimal("5")]
+    await async_uow.commit()
+    assert [line.debit for line in await det(**closed)] == [Decimal("5")]
+    assert len(cache) == 2
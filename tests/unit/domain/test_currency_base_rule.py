@@ -2,7 +2,12 @@ from decimal import getcontext
 
 import pytest
 
-from py_accountant.domain.currencies import BaseCurrencyRule, Currency, get_base_currency
+from py_accountant.domain.currencies import (
+    BaseCurrencyRule,
+    Currency,
+    CurrencyIndex,
+    get_base_currency,
+)
 
 
 def test_set_base_preserves_other_rates():
@@ -54,3 +59,13 @@ def test_set_base_missing_code_raises():
         BaseCurrencyRule.ensure_single_base([usd, eur], new_base_code="CHF")
     msg = str(exc.value)
     assert "Currency not found" in msg or "not found" in msg
+
+
+def test_currency_index_lookup_and_base():
+    usd = Currency("usd", is_base=True)
+    eur = Currency("eur", rate_to_base=1)
+    idx = CurrencyIndex.build([usd, eur])
+    assert idx.base is usd
+    assert "EUR" in idx and "GBP" not in idx
+    assert idx.get("EUR") is eur
+    assert CurrencyIndex.build([eur]).base is None
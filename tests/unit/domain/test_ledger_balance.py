@@ -25,6 +25,12 @@ def test_single_currency_balanced():
     LedgerValidator.validate(lines, currencies)
 
 
+def test_currency_codes_are_interned():
+    # Normalized codes are built at runtime; interning makes them shared objects
+    entry = LedgerEntry(side="debit", amount=1, currency_code=" usd ")
+    assert entry.currency_code is Currency(code="Usd").code
+
+
 def test_multi_currency_balanced_with_rates():
     currencies = make_currencies_usd_eur_jpy()
     # Example 1: 50 EUR debit vs 60 USD credit (EUR->USD 1.2)
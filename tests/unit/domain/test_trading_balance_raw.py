@@ -91,3 +91,25 @@ def test_preserve_decimal_context():
 def test_reject_non_ledger_entry_input_guard():
     with pytest.raises(ValidationError):
         RawAggregator().aggregate([{"side": "DEBIT", "amount": 10, "currency_code": "USD"}])
+
+
+def test_from_grouped_matches_aggregate():
+    lines = [
+        LedgerEntry(EntrySide.DEBIT, 50, "USD"),
+        LedgerEntry(EntrySide.CREDIT, 20, "EUR"),
+        LedgerEntry(EntrySide.CREDIT, 5, "USD"),
+        LedgerEntry(EntrySide.DEBIT, 21, "EUR"),
+    ]
+    rows = [
+        ("usd", "debit", Decimal("50")),
+        ("EUR", "CREDIT", Decimal("20")),
+        ("USD", "CREDIT", Decimal("5")),
+        ("EUR", "DEBIT", Decimal("21")),
+    ]
+    assert RawAggregator().from_grouped(rows) == RawAggregator().aggregate(lines)
+    assert RawAggregator().from_grouped([]) == []
+
+
+def test_from_grouped_invalid_side_raises():
+    with pytest.raises(ValidationError):
+        RawAggregator().from_grouped([("USD", "SIDEWAYS", Decimal("1"))])
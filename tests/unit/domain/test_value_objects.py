@@ -26,12 +26,41 @@ def test_account_name_segments_and_parent():
     acc = AccountName("ROOT:SUB")
     assert acc.name == "SUB"
     assert acc.parent is not None and acc.parent.full_name == "ROOT"
+    assert AccountName("ROOT:OTHER").parent is acc.parent
     with pytest.raises(DomainError):
         AccountName(":bad:")
     with pytest.raises(DomainError):
         AccountName("bad::bad")
 
 
+@pytest.mark.parametrize("name", ["Assets:Cash_1", "Активы:Касса"])
+def test_account_name_accepts_unicode_word_segments(name):
+    assert AccountName(name).full_name == name
+
+
+@pytest.mark.parametrize("name", ["Assets:Petty-Cash", "Assets:Petty Cash", "Assets:Cash\n"])
+def test_account_name_rejects_non_word_characters(name):
+    with pytest.raises(DomainError, match="alnum"):
+        AccountName(name)
+
+
+def test_interned_value_objects_are_shared_and_validated():
+    assert CurrencyCode.get("usd") is CurrencyCode.get("usd")
+    assert CurrencyCode.get("usd") == CurrencyCode("USD")
+    assert AccountName.get("ROOT:SUB") is AccountName.get("ROOT:SUB")
+    with pytest.raises(DomainError):
+        CurrencyCode.get("")
+    with pytest.raises(DomainError):
+        AccountName.get("bad::bad")
+    with pytest.raises(DomainError):
+        CurrencyCode.get(None)  # type: ignore[arg-type]
+
+    class Code(str):
+        pass
+
+    assert CurrencyCode.get(Code("eur")) == CurrencyCode("EUR")
+
+
 def test_exchange_rate_and_entry_line():
     rate = ExchangeRate.from_number(1.234567)
     assert float(rate.value) > 0
@@ -43,6 +72,17 @@ def test_exchange_rate_and_entry_line():
         EntryLine.create(EntrySide.CREDIT, "ROOT", 0, "USD")
 
 
+def test_decimal_inputs_are_used_as_is():
+    amount = Decimal("12.50")
+    line = EntryLine.create(EntrySide.DEBIT, "ROOT", amount, "USD", Decimal("2"))
+    assert line.amount is amount
+    assert line.exchange_rate.value == Decimal("2.0000000000")
+    with pytest.raises(DomainError):
+        EntryLine.create(EntrySide.DEBIT, "ROOT", Decimal("-1"), "USD")
+    with pytest.raises(DomainError):
+        EntryLine.create(EntrySide.DEBIT, "ROOT", "abc", "USD")
+
+
 def test_transaction_balancing():
     debit = EntryLine.create(EntrySide.DEBIT, "ROOT", 100, "USD")
     credit = EntryLine.create(EntrySide.CREDIT, "ROOT", 100, "USD")
@@ -71,6 +71,24 @@ def test_include_in_alembic_without_script():
     include_in_alembic(mock_context)  # No exception expected
 
 
+def test_include_in_alembic_is_idempotent():
+    """Repeated include_in_alembic() calls do not duplicate version locations."""
+    # Arrange
+    mock_context = MagicMock()
+    mock_script = MagicMock()
+    mock_script.dir = "/project/alembic"
+    mock_script.version_locations = ("/project/alembic",)
+    mock_context.script = mock_script
+
+    # Act
+    include_in_alembic(mock_context)
+    include_in_alembic(mock_context)
+
+    # Assert
+    assert len(mock_script.version_locations) == 2
+    assert mock_script.version_locations[1] == "/project/alembic"
+
+
 def test_include_in_alembic_versions_path_exists():
     """include_in_alembic() uses existing versions directory."""
     # Arrange
@@ -1,6 +1,9 @@
 """Unit tests for CLI."""
 
 import os
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -19,7 +22,7 @@ def mock_database_url(monkeypatch):
 
 @patch("py_accountant.infrastructure.migrations.cli.asyncio.run")
 @patch("py_accountant.infrastructure.migrations.cli.MigrationRunner")
-@patch("py_accountant.infrastructure.migrations.cli.create_async_engine")
+@patch("sqlalchemy.ext.asyncio.create_async_engine")
 def test_upgrade_command_to_head(mock_engine, mock_runner_class, mock_asyncio_run, mock_database_url):
     """upgrade command calls runner.upgrade_to_head()."""
     mock_runner = MagicMock()
@@ -34,7 +37,7 @@ def test_upgrade_command_to_head(mock_engine, mock_runner_class, mock_asyncio_ru
 
 @patch("py_accountant.infrastructure.migrations.cli.asyncio.run")
 @patch("py_accountant.infrastructure.migrations.cli.MigrationRunner")
-@patch("py_accountant.infrastructure.migrations.cli.create_async_engine")
+@patch("sqlalchemy.ext.asyncio.create_async_engine")
 def test_upgrade_command_to_version(mock_engine, mock_runner_class, mock_asyncio_run, mock_database_url):
     """upgrade command to specific version calls runner.upgrade_to_version()."""
     mock_runner = MagicMock()
@@ -52,7 +55,7 @@ def test_upgrade_command_to_version(mock_engine, mock_runner_class, mock_asyncio
 )
 @patch("py_accountant.infrastructure.migrations.cli.asyncio.run")
 @patch("py_accountant.infrastructure.migrations.cli.MigrationRunner")
-@patch("py_accountant.infrastructure.migrations.cli.create_async_engine")
+@patch("sqlalchemy.ext.asyncio.create_async_engine")
 def test_downgrade_command(mock_engine, mock_runner_class, mock_asyncio_run, mock_database_url):
     """downgrade command calls runner.downgrade()."""
     mock_runner = MagicMock()
@@ -66,7 +69,7 @@ def test_downgrade_command(mock_engine, mock_runner_class, mock_asyncio_run, moc
 
 
 @patch("py_accountant.infrastructure.migrations.cli.MigrationRunner")
-@patch("py_accountant.infrastructure.migrations.cli.create_async_engine")
+@patch("sqlalchemy.ext.asyncio.create_async_engine")
 @patch("py_accountant.infrastructure.migrations.cli.asyncio.run")
 def test_current_command_with_version(
     mock_asyncio_run, mock_engine, mock_runner_class, mock_database_url
@@ -84,7 +87,7 @@ def test_current_command_with_version(
 
 
 @patch("py_accountant.infrastructure.migrations.cli.MigrationRunner")
-@patch("py_accountant.infrastructure.migrations.cli.create_async_engine")
+@patch("sqlalchemy.ext.asyncio.create_async_engine")
 @patch("py_accountant.infrastructure.migrations.cli.asyncio.run")
 def test_current_command_not_initialized(
     mock_asyncio_run, mock_engine, mock_runner_class, mock_database_url
@@ -101,8 +104,25 @@ def test_current_command_not_initialized(
     assert "Database not initialized" in result.stdout
 
 
+@pytest.mark.parametrize(("args", "expected"), [([], False), (["--echo"], True)])
 @patch("py_accountant.infrastructure.migrations.cli.MigrationRunner")
-@patch("py_accountant.infrastructure.migrations.cli.create_async_engine")
+@patch("sqlalchemy.ext.asyncio.create_async_engine")
+@patch("py_accountant.infrastructure.migrations.cli.asyncio.run")
+def test_echo_flag_is_real_bool(
+    mock_asyncio_run, mock_engine, mock_runner_class, args, expected, mock_database_url
+):
+    """--echo reaches the engine and runner as a bool, off unless given."""
+    mock_asyncio_run.return_value = None
+
+    result = runner.invoke(app, ["current", *args])
+
+    assert result.exit_code == 0
+    assert mock_engine.call_args.kwargs["echo"] is expected
+    assert mock_runner_class.call_args.kwargs["echo"] is expected
+
+
+@patch("py_accountant.infrastructure.migrations.cli.MigrationRunner")
+@patch("sqlalchemy.ext.asyncio.create_async_engine")
 @patch("py_accountant.infrastructure.migrations.cli.asyncio.run")
 def test_pending_command_no_pending(
     mock_asyncio_run, mock_engine, mock_runner_class, mock_database_url
@@ -120,7 +140,7 @@ def test_pending_command_no_pending(
 
 
 @patch("py_accountant.infrastructure.migrations.cli.MigrationRunner")
-@patch("py_accountant.infrastructure.migrations.cli.create_async_engine")
+@patch("sqlalchemy.ext.asyncio.create_async_engine")
 @patch("py_accountant.infrastructure.migrations.cli.asyncio.run")
 def test_pending_command_with_pending(
     mock_asyncio_run, mock_engine, mock_runner_class, mock_database_url
@@ -152,8 +172,8 @@ def test_cli_without_database_url(monkeypatch):
     assert "DATABASE_URL not set" in output or result.exit_code == 1
 
 
-@patch("py_accountant.infrastructure.migrations.cli.command.history")
-@patch("py_accountant.infrastructure.migrations.cli.Config")
+@patch("alembic.command.history")
+@patch("alembic.config.Config")
 def test_history_command(mock_config_class, mock_history, mock_database_url):
     """history command calls alembic history."""
     mock_config_instance = MagicMock()
@@ -167,7 +187,7 @@ def test_history_command(mock_config_class, mock_history, mock_database_url):
 
 @patch("py_accountant.infrastructure.migrations.cli.asyncio.run")
 @patch("py_accountant.infrastructure.migrations.cli.MigrationRunner")
-@patch("py_accountant.infrastructure.migrations.cli.create_async_engine")
+@patch("sqlalchemy.ext.asyncio.create_async_engine")
 def test_downgrade_function_logic(
     mock_engine, mock_runner_class, mock_asyncio_run, mock_database_url
 ):
@@ -188,3 +208,13 @@ def test_downgrade_function_logic(
     assert call_args is not None
 
 
+def test_cli_import_does_not_load_alembic():
+    """Importing the CLI defers alembic to the history command."""
+    code = (
+        "import sys, py_accountant.infrastructure.migrations.cli; "
+        "print(any(m == 'alembic' or m.startswith('alembic.') for m in sys.modules))"
+    )
+    src = str(Path(__file__).resolve().parents[4] / "src")
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [src, os.environ.get("PYTHONPATH")]))}
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env)
+    assert out.stdout.strip() == "False"
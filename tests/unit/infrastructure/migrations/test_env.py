@@ -182,3 +182,53 @@ def test_get_sync_url_invalid_url_raises_value_error(monkeypatch, mock_alembic_c
         with pytest.raises(ValueError, match="Invalid DATABASE_URL"):
             get_sync_url()
 
+
+def test_target_metadata_loaded_on_demand():
+    """ORM metadata is resolved lazily and then reused."""
+    from py_accountant.infrastructure.migrations import env
+    from py_accountant.infrastructure.persistence.sqlalchemy.models import Base
+
+    assert env._get_target_metadata() is Base.metadata
+    assert env.target_metadata is Base.metadata
+
+
+def test_validated_sync_url_is_memoized():
+    """Repeated resolution of the same inputs reuses the parsed URL."""
+    from py_accountant.infrastructure.migrations.env import _validated_sync_url
+
+    _validated_sync_url.cache_clear()
+    first = _validated_sync_url("", "sqlite+pysqlite:///memo.db")
+    assert _validated_sync_url("", "sqlite+pysqlite:///memo.db") == first
+    assert _validated_sync_url.cache_info().hits == 1
+
+
+@pytest.mark.parametrize(
+    ("drivername", "expected"),
+    [
+        ("postgresql+asyncpg", True),
+        ("sqlite+aiosqlite", True),
+        ("mysql+asyncmy", True),
+        ("postgresql+psycopg", False),
+        ("sqlite", False),
+        (None, False),
+    ],
+)
+def test_is_async_driver(drivername, expected):
+    """Async driver detection covers asyncpg, aiosqlite and +async* dialects."""
+    from py_accountant.infrastructure.migrations._env_base import is_async_driver
+
+    assert is_async_driver(drivername) is expected
+
+
+def test_configure_logging_applies_ini_once(tmp_path):
+    """The logging ini is applied once per file version, not on every Alembic run."""
+    from py_accountant.infrastructure.migrations import _env_base
+
+    ini = tmp_path / "alembic.ini"
+    ini.write_text("[loggers]\nkeys=root\n")
+    with patch.object(_env_base, "fileConfig") as file_config:
+        _env_base.configure_logging(str(ini))
+        _env_base.configure_logging(str(ini))
+        _env_base.configure_logging(None)
+
+    file_config.assert_called_once_with(str(ini))
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import os
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
 import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.engine import URL, make_url
 from sqlalchemy.ext.asyncio import create_async_engine
 
 from py_accountant.infrastructure.migrations.errors import VersionMismatchError
@@ -54,7 +59,7 @@ async def test_upgrade_to_head(runner):
 
     # Check current version
     current = await runner.get_current_version()
-    assert current == "0008_add_account_aggregates"  # Last migration
+    assert current == "0009_tune_indexes"  # Last migration
 
 
 @pytest.mark.asyncio
@@ -71,13 +76,13 @@ async def test_downgrade(runner):
     """downgrade() rolls back migrations."""
     # Upgrade to head first
     await runner.upgrade_to_head()
-    assert await runner.get_current_version() == "0008_add_account_aggregates"
+    assert await runner.get_current_version() == "0009_tune_indexes"
 
     # Downgrade 2 steps
     await runner.downgrade(steps=2)
 
     current = await runner.get_current_version()
-    assert current == "0006_add_journal_idempotency_key"
+    assert current == "0007_drop_balances_table"
 
 
 @pytest.mark.asyncio
@@ -85,7 +90,7 @@ async def test_downgrade_to_target(runner):
     """downgrade() can target specific version."""
     # Upgrade to head first
     await runner.upgrade_to_head()
-    assert await runner.get_current_version() == "0008_add_account_aggregates"
+    assert await runner.get_current_version() == "0009_tune_indexes"
 
     # Downgrade to specific version
     await runner.downgrade(target="0003_add_performance_indexes")
@@ -129,12 +134,12 @@ async def test_get_pending_migrations_uninitialized(runner):
     """get_pending_migrations() returns all migrations for uninitialized DB."""
     pending = await runner.get_pending_migrations()
 
-    # Should have all 8 migrations
-    assert len(pending) == 8
+    # Should have all 9 migrations
+    assert len(pending) == 9
     # Check that migrations are in the list
     pending_str = str(pending)
     assert "0001_initial" in pending_str
-    assert "0008_add_account_aggregates" in pending_str
+    assert "0009_tune_indexes" in pending_str
 
 
 @pytest.mark.asyncio
@@ -145,8 +150,8 @@ async def test_get_pending_migrations_partial(runner):
 
     pending = await runner.get_pending_migrations()
 
-    # Should have 5 pending (0004-0008)
-    assert len(pending) == 5
+    # Should have 6 pending (0004-0009)
+    assert len(pending) == 6
 
 
 @pytest.mark.asyncio
@@ -160,6 +165,47 @@ async def test_get_pending_migrations_at_head(runner):
     # Should have no pending migrations
     assert len(pending) == 0
 
+    # Steady state must not walk the revision graph
+    def fail(*args, **kwargs):
+        raise AssertionError("iterate_revisions called at head")
+
+    runner._script.iterate_revisions = fail
+    assert await runner.get_pending_migrations() == []
+
+
+@pytest.mark.asyncio
+async def test_get_pending_migrations_reuses_script_directory(runner):
+    """Version scripts are parsed once and reused across polls and upgrades."""
+    first = await runner.get_pending_migrations()
+    script = runner._script
+    await runner.upgrade_to_version("0003_add_performance_indexes")
+    second = await runner.get_pending_migrations()
+
+    assert runner._script is script
+    assert second == first[:6]
+
+
+@pytest.mark.asyncio
+async def test_applied_revisions_reads_all_rows(runner):
+    """_applied_revisions() returns every stamped head, empty set before init."""
+    assert await runner._applied_revisions() == set()
+    await runner.upgrade_to_version("0003_add_performance_indexes")
+    assert await runner._applied_revisions() == {"0003_add_performance_indexes"}
+
+
+@pytest.mark.asyncio
+async def test_alembic_commands_share_one_worker(runner):
+    """Alembic commands run serially on one dedicated thread until aclose()."""
+    await runner.upgrade_to_version("0001_initial")
+    executor = runner._executor
+    await runner.upgrade_to_head()
+
+    assert executor is not None and runner._executor is executor
+    await runner.aclose()
+    assert runner._executor is None
+    await runner.downgrade(steps=1)  # a new worker is created on demand
+    await runner.aclose()
+
 
 @pytest.mark.asyncio
 async def test_validate_schema_version_success(runner):
@@ -177,9 +223,9 @@ async def test_validate_schema_version_mismatch(runner):
 
     with pytest.raises(
         VersionMismatchError,
-        match="current=0005_exchange_rate_events_archive, expected=0008_add_account_aggregates",
+        match="current=0005_exchange_rate_events_archive, expected=0009_tune_indexes",
     ):
-        await runner.validate_schema_version("0008_add_account_aggregates")
+        await runner.validate_schema_version("0009_tune_indexes")
 
 
 @pytest.mark.asyncio
@@ -188,3 +234,56 @@ async def test_validate_schema_version_uninitialized(runner):
     with pytest.raises(VersionMismatchError, match="current=None, expected=0001_initial"):
         await runner.validate_schema_version("0001_initial")
 
+
+def test_package_import_does_not_load_alembic():
+    """Importing the migrations API defers alembic until a runner is used."""
+    code = (
+        "import sys, py_accountant.infrastructure.migrations; "
+        "print(any(m == 'alembic' or m.startswith('alembic.') for m in sys.modules))"
+    )
+    src = str(Path(__file__).resolve().parents[4] / "src")
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [src, os.environ.get("PYTHONPATH")]))}
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env)
+    assert out.stdout.strip() == "False"
+
+
+@pytest.mark.asyncio
+async def test_alembic_url_swaps_driver_only():
+    """Async driver is swapped on the URL object; credentials survive intact."""
+    url = URL.create(
+        "postgresql+asyncpg", username="asyncpg", password="p@ss%word", host="db", database="sqlite+aiosqlite"
+    )
+    engine = create_async_engine(url)
+    try:
+        sync_url = make_url(MigrationRunner(engine)._config.get_main_option("sqlalchemy.url"))
+    finally:
+        await engine.dispose()
+
+    assert sync_url.drivername == "postgresql+psycopg"
+    assert (sync_url.username, sync_url.password, sync_url.database) == ("asyncpg", "p@ss%word", "sqlite+aiosqlite")
+
+
+@pytest.mark.asyncio
+async def test_version_checks_share_one_connection(runner, test_db_engine):
+    """Checks run inside runner.connection() reuse a single pooled connection."""
+    async with runner.connection() as conn:
+        assert await runner.get_current_version(conn=conn) is None
+        assert len(await runner.get_pending_migrations(conn=conn)) == 9
+
+    await runner.upgrade_to_head()
+
+    checkouts = 0
+
+    def count(*args):
+        nonlocal checkouts
+        checkouts += 1
+
+    event.listen(test_db_engine.sync_engine, "checkout", count)
+    try:
+        async with runner.connection() as conn:
+            await runner.validate_schema_version("0009_tune_indexes", conn=conn)
+            assert await runner.get_pending_migrations(conn=conn) == []
+            assert await runner.get_current_version(conn=conn) == "0009_tune_indexes"
+    finally:
+        event.remove(test_db_engine.sync_engine, "checkout", count)
+    assert checkouts == 1
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta, timezone
 from decimal import Decimal
 
 import pytest
@@ -71,6 +71,50 @@ async def test_repository_upserts_turnover_same_day_multiple_lines(async_uow: As
     assert r.debit_total == Decimal("30") and r.credit_total == Decimal("10"), "Turnover totals must sum line debits/credits (25+5, 2+8)."
 
 
+@pytest.mark.asyncio
+async def test_aggregates_upserted_with_one_statement_per_table(async_uow: AsyncSqlAlchemyUnitOfWork, query_counter) -> None:
+    """Проводка по нескольким счетам: один bulk INSERT строк и по одному upsert на таблицу агрегатов."""
+    repo = async_uow.transactions
+    lines = [
+        EntryLineDTO(side="DEBIT", account_full_name="Assets:Cash", amount=Decimal("7"), currency_code="USD"),
+        EntryLineDTO(side="DEBIT", account_full_name="Assets:Bank", amount=Decimal("3"), currency_code="USD"),
+        EntryLineDTO(side="CREDIT", account_full_name="Income:Sales", amount=Decimal("10"), currency_code="USD"),
+    ]
+    for _ in range(2):  # first post inserts, second one hits the conflict branch
+        with query_counter() as q:
+            await repo.add(TransactionDTO(id="", occurred_at=datetime.now(UTC), lines=lines))
+        assert q.count == 4  # journal, lines, balances, turnovers
+
+    execute = async_uow.session.execute
+    res = await execute(select(AccountBalanceORM.account_full_name, AccountBalanceORM.balance))
+    assert dict(res.all()) == {
+        "Assets:Cash": Decimal("14"),
+        "Assets:Bank": Decimal("6"),
+        "Income:Sales": Decimal("-20"),
+    }
+    res = await execute(select(AccountDailyTurnoverORM.account_full_name, AccountDailyTurnoverORM.debit_total, AccountDailyTurnoverORM.credit_total))
+    assert sorted(res.all()) == [
+        ("Assets:Bank", Decimal("6"), Decimal("0")),
+        ("Assets:Cash", Decimal("14"), Decimal("0")),
+        ("Income:Sales", Decimal("0"), Decimal("20")),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_turnover_day_is_utc_for_offset_timestamps(async_uow: AsyncSqlAlchemyUnitOfWork) -> None:
+    """Время с ненулевым смещением попадает в UTC-день, а не в локальный."""
+    occurred = datetime(2025, 1, 2, 1, 0, tzinfo=timezone(timedelta(hours=3)))  # 2025-01-01 22:00 UTC
+    await async_uow.transactions.add(
+        TransactionDTO(
+            id="t3",
+            occurred_at=occurred,
+            lines=[EntryLineDTO(side="DEBIT", account_full_name="Assets:Cash", amount=Decimal("1"), currency_code="USD")],
+        )
+    )
+    res = await async_uow.session.execute(select(AccountDailyTurnoverORM.date_utc))
+    assert res.scalar_one().replace(tzinfo=None) == datetime(2025, 1, 1)
+
+
 @pytest.mark.asyncio
 async def test_repository_concurrent_postings_consistent_balance(tmp_path) -> None:
     """Concurrent postings (отдельные сессии) должны привести к корректной итоговой сумме (гарантия race-safety).
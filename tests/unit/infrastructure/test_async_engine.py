@@ -38,12 +38,25 @@ async def test_async_engine_sqlite_connects_and_executes_select_1() -> None:
         ("sqlite+pysqlite:///:memory:", "sqlite+aiosqlite:///:memory:"),
         ("postgresql+asyncpg://user@h/db", "postgresql+asyncpg://user@h/db"),
         ("sqlite+aiosqlite:///./test.db", "sqlite+aiosqlite:///./test.db"),
+        ("postgresql+psycopg2://u@h/db", "postgresql+asyncpg://u@h/db"),
+        ("mysql+aiomysql://u@h/db", "mysql+aiomysql://u@h/db"),
     ],
 )
 def test_normalize_async_url(input_url: str, expected: str) -> None:
     assert normalize_async_url(input_url) == expected
 
 
+def test_normalize_async_url_is_memoized_and_rejects_empty() -> None:
+    url = "postgresql://memo@h/db"
+    first = normalize_async_url(url)
+    hits = normalize_async_url.cache_info().hits
+    assert normalize_async_url(url) is first
+    assert normalize_async_url.cache_info().hits == hits + 1
+    for bad in ("", "   "):
+        with pytest.raises(ValueError):
+            normalize_async_url(bad)
+
+
 @pytest.mark.asyncio
 async def test_postgres_url_normalizes_but_connection_optional() -> None:
     """
@@ -62,3 +75,22 @@ async def test_postgres_url_normalizes_but_connection_optional() -> None:
     finally:
         await engine.dispose()
 
+
+@pytest.mark.asyncio
+async def test_async_engine_sqlite_file_uses_wal(tmp_path) -> None:
+    """File-based SQLite connections get WAL/synchronous=NORMAL/temp_store=MEMORY."""
+    engine = get_async_engine(f"sqlite:///{tmp_path / 'wal.db'}")
+    try:
+        async with engine.connect() as conn:
+            assert (await conn.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+            assert (await conn.execute(text("PRAGMA synchronous"))).scalar() == 1  # NORMAL
+            assert (await conn.execute(text("PRAGMA temp_store"))).scalar() == 2  # MEMORY
+    finally:
+        await engine.dispose()
+
+    memory = get_async_engine("sqlite:///:memory:")
+    try:
+        async with memory.connect() as conn:
+            assert (await conn.execute(text("PRAGMA journal_mode"))).scalar() == "memory"
+    finally:
+        await memory.dispose()
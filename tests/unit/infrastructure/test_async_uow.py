@@ -58,3 +58,71 @@ async def test_async_uow_rollback(tmp_path: Path) -> None:
         res = await s.execute(text("SELECT COUNT(*) FROM t"))
         count = res.scalar_one()
         assert count == 0
+
+
+@pytest.mark.asyncio
+async def test_async_uow_warmup_fills_pool(tmp_path: Path) -> None:
+    """warmup() opens connections up to the pool size and returns them to the pool."""
+    uow = AsyncSqlAlchemyUnitOfWork(f"sqlite+aiosqlite:///{tmp_path / 'warm.sqlite3'}")
+    pool = uow.engine.sync_engine.pool
+
+    opened = await uow.warmup(n=3)
+
+    assert opened == 3
+    assert pool.checkedout() == 0 and pool.checkedin() == 3
+    async with uow:
+        await uow.session.execute(text("SELECT 1"))
+    await uow.engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_async_uow_warmup_in_memory_single_connection() -> None:
+    """Non-queue pools (in-memory SQLite) are warmed with one connection."""
+    uow = AsyncSqlAlchemyUnitOfWork()
+    assert await uow.warmup() == 1
+    assert await uow.warmup(n=0) == 0
+    await uow.engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_async_uow_repositories_scoped_to_context() -> None:
+    """Repositories are built once per context and unavailable outside it."""
+    uow = AsyncSqlAlchemyUnitOfWork()
+    with pytest.raises(RuntimeError):
+        _ = uow.accounts
+    async with uow:
+        accounts = uow.accounts
+        assert uow.accounts is accounts
+        assert accounts.session is uow.session
+        assert uow.exchange_rate_events.session is uow.session
+    with pytest.raises(RuntimeError):
+        _ = uow.transactions
+    await uow.engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_async_uow_on_commit_runs_only_after_commit() -> None:
+    """on_commit callbacks fire after explicit or exit commit and are dropped on rollback."""
+    uow = AsyncSqlAlchemyUnitOfWork("sqlite+aiosqlite:///:memory:")
+    fired: list[str] = []
+    async with uow:
+        uow.on_commit(lambda: fired.append("explicit"))
+        assert fired == []
+        await uow.commit()
+        assert fired == ["explicit"]
+        uow.on_commit(lambda: fired.append("rolled back"))
+        await uow.rollback()
+    async with uow:
+        uow.on_commit(lambda: fired.append("exit"))
+    assert fired == ["explicit", "exit"]
+
+    class Boom(Exception):
+        pass
+
+    with pytest.raises(Boom):
+        async with uow:
+            uow.on_commit(lambda: fired.append("error"))
+            raise Boom("trigger rollback")
+    assert fired == ["explicit", "exit"]
+    with pytest.raises(RuntimeError):
+        uow.on_commit(lambda: None)
@@ -6,7 +6,11 @@ from contextlib import suppress
 import pytest
 from pydantic import ValidationError
 
-from py_accountant.infrastructure.config.settings import BaseAppSettings, get_settings
+from py_accountant.infrastructure.config.settings import (
+    BaseAppSettings,
+    get_settings,
+    refresh_env_cache,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -76,3 +80,32 @@ def test_logging_enabled_flag(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("LOGGING_ENABLED", "false")
     s = get_settings(ignore_env_file=True)
     assert s.logging_enabled is False
+
+
+def test_settings_cache_tracks_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Пока окружение не меняется — тот же экземпляр; изменение переменной даёт новый
+    first = get_settings(ignore_env_file=True)
+    assert get_settings(ignore_env_file=True) is first
+    monkeypatch.setenv("LOG_LEVEL", "ERROR")
+    assert get_settings(ignore_env_file=True).log_level.upper() == "ERROR"
+    monkeypatch.delenv("LOG_LEVEL")
+    refresh_env_cache()
+    assert get_settings(ignore_env_file=True) is not first
+
+
+def test_settings_are_frozen() -> None:
+    # Закэшированный экземпляр общий для всех вызывающих — изменять его нельзя
+    s = get_settings(ignore_env_file=True)
+    with pytest.raises(ValidationError):
+        s.log_level = "ERROR"  # type: ignore[misc]
+
+
+def test_db_runtime_view(monkeypatch: pytest.MonkeyPatch) -> None:
+    # db_* поля доступны одним кортежем, который строится один раз на экземпляр
+    monkeypatch.setenv("DB_POOL_SIZE", "7")
+    monkeypatch.setenv("PYACC__DB_RETRY_ATTEMPTS", "5")
+    s = get_settings(ignore_env_file=True)
+    rt = s.db_runtime
+    assert rt is s.db_runtime
+    assert rt.pool_size == 7 and rt.retry_attempts == 5
+    assert rt.statement_timeout_ms == s.db_statement_timeout_ms